@@ -1,12 +1,43 @@
+import asyncio
+import copy
+import importlib.util
 import os
-from typing import Any, Dict, List, Optional
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 
-class ApiClient:
-    def __init__(self) -> None:
-        self.base_url = os.getenv("API_BASE_URL", "").rstrip("/")
+# Retried with backoff: connection failures always (nothing reached the server),
+# these statuses only for idempotent methods.
+RETRY_STATUSES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE"}
+ETAG_CACHE_SIZE = 256
+
+
+def _float_env(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class _ApiBase:
+    """Settings, retry policy and the ETag cache shared by ApiClient and AsyncApiClient."""
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        self.base_url = (base_url if base_url is not None else os.getenv("API_BASE_URL", "")).rstrip("/")
+        self.timeout = _float_env("API_TIMEOUT", 10.0)
+        self.retries = int(_float_env("API_RETRIES", 3))
+        self.backoff = _float_env("API_BACKOFF", 0.5)
+        # HTTP/2 needs the h2 package (httpx[http2]); fall back to HTTP/1.1 keep-alive without it
+        self.http2 = os.getenv("API_HTTP2", "1") != "0" and importlib.util.find_spec("h2") is not None
+        self._etags: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
 
     def enabled(self) -> bool:
         return bool(self.base_url)
@@ -16,31 +47,227 @@ class ApiClient:
             raise RuntimeError("API_BASE_URL is not configured")
         return f"{self.base_url}{path}"
 
-    def list_news(self) -> List[Dict[str, Any]]:
-        with httpx.Client(timeout=10) as client:
-            r = client.get(self._url("/news"))
-            r.raise_for_status()
-            return r.json()
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "timeout": self.timeout,
+            "http2": self.http2,
+            "limits": httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30),
+        }
+
+    def _should_retry(self, method: str, attempt: int, response: Optional[httpx.Response], exc: Optional[Exception]) -> bool:
+        if attempt >= self.retries:
+            return False
+        if exc is not None:
+            if isinstance(exc, (httpx.ConnectError, httpx.ConnectTimeout)):
+                return True
+            return method in IDEMPOTENT_METHODS and isinstance(exc, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError))
+        return method in IDEMPOTENT_METHODS and response is not None and response.status_code in RETRY_STATUSES
+
+    def _delay(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), 30.0)
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.backoff * (2 ** attempt), 10.0))
+
+    def _cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        return str(httpx.URL(url, params=params or None))
+
+    def _conditional_headers(self, key: str) -> Dict[str, str]:
+        with self._etag_lock:
+            cached = self._etags.get(key)
+        return {"If-None-Match": cached[0]} if cached else {}
+
+    def _read_json(self, key: Optional[str], r: httpx.Response) -> Any:
+        """JSON body of a GET, served from the ETag cache on 304."""
+        if key is not None and r.status_code == 304:
+            with self._etag_lock:
+                cached = self._etags.get(key)
+                if cached is not None:
+                    self._etags.move_to_end(key)
+                    return copy.deepcopy(cached[1])
+        r.raise_for_status()
+        data = r.json()
+        etag = r.headers.get("ETag")
+        if key is not None and etag:
+            with self._etag_lock:
+                self._etags[key] = (etag, copy.deepcopy(data))
+                self._etags.move_to_end(key)
+                while len(self._etags) > ETAG_CACHE_SIZE:
+                    self._etags.popitem(last=False)
+        return data
+
+    @staticmethod
+    def _list_params(limit: Optional[int], since: Optional[datetime], until: Optional[datetime], category: Optional[str]) -> Dict[str, Any]:
+        params: Dict[str, Any] = {}
+        if limit is not None:
+            params["limit"] = limit
+        if since is not None:
+            params["since"] = since.isoformat()
+        if until is not None:
+            params["until"] = until.isoformat()
+        if category:
+            params["category"] = category
+        return params
+
+
+class ApiClient(_ApiBase):
+    """Blocking client for the news API over one long-lived, pooled connection.
+
+    Safe to share between threads. Call `close()` (or use it as a context manager)
+    when done.
+    """
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        super().__init__(base_url)
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+
+    def _http(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(**self._client_options())
+        return self._client
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        url = self._url(path)
+        attempt = 0
+        while True:
+            response = exc = None
+            try:
+                response = self._http().request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                exc = e
+            if not self._should_retry(method, attempt, response, exc):
+                if exc is not None:
+                    raise exc
+                return response
+            time.sleep(self._delay(attempt, response))
+            attempt += 1
+
+    def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        key = self._cache_key(self._url(path), params)
+        r = self._request("GET", path, params=params, headers=self._conditional_headers(key))
+        return self._read_json(key, r)
+
+    def list_news(
+        self,
+        limit: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        return self._get_json("/news", self._list_params(limit, since, until, category))
+
+    def get_news(self, doc_id: str) -> Dict[str, Any]:
+        return self._get_json(f"/news/{doc_id}")
 
     def create_news(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        with httpx.Client(timeout=10) as client:
-            r = client.post(self._url("/news"), json=data)
-            r.raise_for_status()
-            return r.json()
+        r = self._request("POST", "/news", json=data)
+        r.raise_for_status()
+        return r.json()
 
     def update_news(self, doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-        with httpx.Client(timeout=10) as client:
-            r = client.put(self._url(f"/news/{doc_id}"), json=data)
-            r.raise_for_status()
-            return r.json()
+        r = self._request("PUT", f"/news/{doc_id}", json=data)
+        r.raise_for_status()
+        return r.json()
 
     def delete_news(self, doc_id: str) -> None:
-        with httpx.Client(timeout=10) as client:
-            r = client.delete(self._url(f"/news/{doc_id}"))
-            r.raise_for_status()
+        r = self._request("DELETE", f"/news/{doc_id}")
+        r.raise_for_status()
+
+    def batch_news(self, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """POST /news/batch; ops are {"op": "create"|"update"|"upsert", "id", "data"}."""
+        r = self._request("POST", "/news/batch", json={"ops": ops})
+        r.raise_for_status()
+        return r.json()["results"]
+
+    def close(self) -> None:
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def __enter__(self) -> "ApiClient":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class AsyncApiClient(_ApiBase):
+    """asyncio twin of ApiClient for concurrent callers; same methods, awaitable."""
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        super().__init__(base_url)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        # Created on first use, inside the event loop that will drive it
+        if self._client is None:
+            self._client = httpx.AsyncClient(**self._client_options())
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        url = self._url(path)
+        attempt = 0
+        while True:
+            response = exc = None
+            try:
+                response = await self._http().request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                exc = e
+            if not self._should_retry(method, attempt, response, exc):
+                if exc is not None:
+                    raise exc
+                return response
+            await asyncio.sleep(self._delay(attempt, response))
+            attempt += 1
+
+    async def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        key = self._cache_key(self._url(path), params)
+        r = await self._request("GET", path, params=params, headers=self._conditional_headers(key))
+        return self._read_json(key, r)
+
+    async def list_news(
+        self,
+        limit: Optional[int] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        return await self._get_json("/news", self._list_params(limit, since, until, category))
+
+    async def get_news(self, doc_id: str) -> Dict[str, Any]:
+        return await self._get_json(f"/news/{doc_id}")
+
+    async def create_news(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        r = await self._request("POST", "/news", json=data)
+        r.raise_for_status()
+        return r.json()
 
+    async def update_news(self, doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        r = await self._request("PUT", f"/news/{doc_id}", json=data)
+        r.raise_for_status()
+        return r.json()
 
+    async def delete_news(self, doc_id: str) -> None:
+        r = await self._request("DELETE", f"/news/{doc_id}")
+        r.raise_for_status()
 
+    async def batch_news(self, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        r = await self._request("POST", "/news/batch", json={"ops": ops})
+        r.raise_for_status()
+        return r.json()["results"]
 
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
 
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.aclose()
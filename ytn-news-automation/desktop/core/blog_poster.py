@@ -1,290 +1,671 @@
 import os
+import queue
 import re
+import threading
 import time
 from urllib.parse import urlparse, parse_qs
-from typing import Dict, List
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from xml.etree import ElementTree
 
+import requests
 from playwright.sync_api import sync_playwright
 
+from .editor_content import PASTE_SCRIPT, build_document
+from .logs import get_logger
+from .naver_session import SessionStore, has_auth_cookies
+from .post_journal import CONFIRMED, STARTED, PostJournal
+from .selector_cache import SelectorCache, StepAborted
+
+
+LOGIN_URL = "https://nid.naver.com/nidlogin.login"
+WRITE_URL = "https://blog.naver.com/GoBlogWrite.naver"
+# Pages posting at once; each runs its own browser on its own thread
+NAVER_POST_WORKERS = int(os.getenv("NAVER_POST_WORKERS", "2"))
+# Publishes per hour for the account across all pages; 0 disables the cap
+NAVER_POSTS_PER_HOUR = float(os.getenv("NAVER_POSTS_PER_HOUR", "30"))
+# "paste" puts the whole body into the editor in one paste event; "type" inserts it as keystrokes
+NAVER_CONTENT_MODE = os.getenv("NAVER_CONTENT_MODE", "paste").lower()
+# A paste that changed the body but has not shown its last paragraph yet gets this long to finish
+_PASTE_SETTLE_MS = 20000
+# How long to wait for the published post's URL after clicking publish
+POST_URL_TIMEOUT_MS = int(os.getenv("NAVER_POST_URL_TIMEOUT_MS", "75000"))
+# Headless posting for unattended servers; off by default so a person can watch the browser
+NAVER_HEADLESS = os.getenv("NAVER_HEADLESS", "0").strip() not in {"0", "false", "False", ""}
+# Skip images, media, fonts and trackers; defaults to on when headless. Stylesheets
+# stay: the editor's popups and layers are shown and hidden through CSS
+NAVER_BLOCK_RESOURCES = os.getenv("NAVER_BLOCK_RESOURCES", "1" if NAVER_HEADLESS else "0").strip() not in {
+    "0", "false", "False", ""
+}
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+# Blog whose RSS feed shows posts an interrupted attempt may have published; NAVER_ID by default
+NAVER_BLOG_ID = os.getenv("NAVER_BLOG_ID", "")
+# An attempt that clicked publish but left no trace in the feed is retried after this long
+NAVER_UNCONFIRMED_RETRY_HOURS = float(os.getenv("NAVER_UNCONFIRMED_RETRY_HOURS", "24"))
+TRACKER_HOSTS = (
+    "wcs.naver.net",
+    "lcs.naver.com",
+    "nlog.naver.com",
+    "tivan.naver.com",
+    "veta.naver.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+)
+
+log = get_logger("poster")
+
+
+class _Throttle:
+    """Spaces the posts of one account at least 3600 / per_hour seconds apart."""
+
+    def __init__(self, per_hour: float) -> None:
+        self.interval = 3600.0 / per_hour if per_hour > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self, stopped: Callable[[], bool]) -> bool:
+        """Block until this caller's slot; False if `stopped` turned true first."""
+        if not self.interval:
+            return not stopped()
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        while True:
+            if stopped():
+                return False
+            remaining = slot - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, 1.0))
+
+
+class _Traffic:
+    """Resource blocking and transfer counts for one browser context."""
+
+    def __init__(self, context, block: bool) -> None:
+        self.requests = self.blocked = self.bytes = 0
+        if block:
+            context.route("**/*", self._route)
+        context.on("requestfinished", self._on_finished)
+
+    def _route(self, route) -> None:
+        request = route.request
+        host = (urlparse(request.url).netloc or "").lower()
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or host.endswith(TRACKER_HOSTS):
+            self.blocked += 1
+            route.abort()
+        else:
+            # Not continue_(): another route (a replayed HAR) may still handle it
+            route.fallback()
+
+    def _on_finished(self, request) -> None:
+        self.requests += 1
+        try:
+            sizes = request.sizes()
+            self.bytes += sizes["responseHeadersSize"] + sizes["responseBodySize"]
+        except Exception:
+            pass
+
+    def reset(self) -> None:
+        self.requests = self.blocked = self.bytes = 0
+
+
+class _PostUrlWatcher:
+    """Catches the published post's URL from navigation and response events.
+
+    Attached before the publish click, it sees the editor frame navigate to
+    PostView, a redirect whose Location carries logNo, or a new page opening on
+    the post; `wait` returns as soon as one of them fires.
+    """
+
+    def __init__(self, context, page, is_final: Callable[[str], bool]) -> None:
+        self.context = context
+        self.is_final = is_final
+        self.url = ""
+        self._pages: List[Any] = []
+        context.on("page", self._on_page)
+        self._watch(page)
+
+    def _watch(self, page) -> None:
+        self._pages.append(page)
+        page.on("framenavigated", self._on_frame)
+        page.on("response", self._on_response)
+
+    def _offer(self, url: str) -> None:
+        if not self.url and url and self.is_final(url):
+            self.url = url
+
+    def _on_page(self, page) -> None:
+        self._watch(page)
+        self._offer(page.url)
+
+    def _on_frame(self, frame) -> None:
+        self._offer(frame.url)
+
+    def _on_response(self, response) -> None:
+        # Documents only: images and API calls may carry another post's logNo
+        if response.request.resource_type != "document":
+            return
+        self._offer(response.url)
+        if 300 <= response.status < 400:
+            self._offer(response.headers.get("location", ""))
+
+    def wait(self, timeout_ms: int) -> str:
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        while not self.url and time.monotonic() < deadline:
+            # Sync Playwright delivers events only while a call is in progress
+            pump = next((p for p in reversed(self._pages) if not p.is_closed()), None)
+            if pump is None:
+                break
+            try:
+                pump.wait_for_timeout(100)
+            except Exception:
+                # Closed while waiting; the next open page takes over
+                continue
+        return self.url
+
+    def detach(self) -> None:
+        self.context.remove_listener("page", self._on_page)
+        for page in self._pages:
+            page.remove_listener("framenavigated", self._on_frame)
+            page.remove_listener("response", self._on_response)
+
 
 class NaverBlogPoster:
     def __init__(self) -> None:
         self.naver_id = os.getenv("NAVER_ID", "")
         self.naver_pw = os.getenv("NAVER_PW", "")
+        self.session = SessionStore(self.naver_id, self.naver_pw)
+        self.throttle = _Throttle(NAVER_POSTS_PER_HOUR)
+        self.selectors = SelectorCache()
+        self.journal = PostJournal()
+        # Login state shared by all pages; _version counts logins so a page that
+        # waited on the lock can tell another page already logged in again
+        self._session_lock = threading.RLock()
+        self._state: Optional[Dict[str, Any]] = None
+        self._state_loaded = False
+        self._version = 0
+        self._local = threading.local()
+
+    def post_items(
+        self,
+        items: List[Dict],
+        workers: Optional[int] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+        before_post: Optional[Callable[[Dict], bool]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Post items on several pages at once, yielding each result as it completes.
 
-    def post_batch(self, items: List[Dict]) -> Dict[str, str]:
+        Results are {"id", "title", "blog_url", "error", "attempted"}, one per item, in
+        completion order; blog_url is "" unless the post was confirmed. A failure
+        while posting one item fails only that item. `before_post(item)` runs on
+        the posting thread right before an item starts; returning False skips it.
+        Once `should_stop` is true, items not yet started come back as "cancelled".
+        """
         if not self.naver_id or not self.naver_pw:
             raise RuntimeError("NAVER_ID/NAVER_PW not set")
-        results: Dict[str, str] = {}    
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            context = browser.new_context()
-            page = context.new_page()
-
-            # Login
-            page.goto("https://nid.naver.com/nidlogin.login", timeout=60000)
-            page.fill("#id", self.naver_id)
-            page.fill("#pw", self.naver_pw)
-            page.click("#log\.login")
-            page.wait_for_load_state("networkidle")
+        if not items:
+            return
+        pending: "queue.Queue[Dict]" = queue.Queue()
+        for item in items:
+            pending.put(item)
+        results: "queue.Queue[Any]" = queue.Queue()
+        stop = threading.Event()
 
-            for item in items[:3]:
-                blog_url = self._post_single(page, context, item)
-                if blog_url:
-                    doc_id = item.get("id") or item.get("doc_id") or ""
-                    if doc_id:
-                        results[doc_id] = blog_url
+        def stopped() -> bool:
+            return stop.is_set() or bool(should_stop and should_stop())
 
-            context.close()
-            browser.close()
-        return results
+        count = max(1, min(workers or NAVER_POST_WORKERS, len(items)))
+        lanes = [
+            threading.Thread(
+                target=self._run_lane, args=(pending, results, stopped, before_post), name=f"naver-post-{n}", daemon=True
+            )
+            for n in range(count)
+        ]
+        for lane in lanes:
+            lane.start()
+        running, lane_error = count, ""
+        try:
+            while running:
+                result = results.get()
+                if isinstance(result, tuple):
+                    # ("done", error) from a lane that finished or could not start
+                    running -= 1
+                    lane_error = result[1] or lane_error
+                    continue
+                yield result
+            # Left over only when every lane failed to start
+            while True:
+                try:
+                    item = pending.get_nowait()
+                except queue.Empty:
+                    break
+                yield self._result(item, error=lane_error or "not posted")
+        finally:
+            stop.set()
+            for lane in lanes:
+                lane.join()
+            self.selectors.save()
+            summary = self.selectors.summary()
+            if summary:
+                log.info(f"편집기 단계별 평균 소요: {summary}")
 
-    def _post_single(self, page, context, item: Dict) -> str:
-        title = item.get("title") or "제목 없음"
-        content = item.get("content") or ""
+    def unrecorded(self) -> List[Dict[str, Any]]:
+        """Posts confirmed on the blog but not yet recorded as posted, e.g. because the app died."""
+        return self.journal.entries(CONFIRMED)
 
-        # Go to write form
-        # page.goto(f"https://blog.naver.com/{self.naver_id}?Redirct=Write&", timeout=60000)
-        page.goto("https://blog.naver.com/GoBlogWrite.naver", timeout=60000)
+    def recorded(self, doc_id: str) -> None:
+        """The article's result is stored; its journal entry is no longer needed."""
+        self.journal.forget(doc_id)
 
-        page.wait_for_load_state("networkidle")
-        page.wait_for_timeout(1000)
+    @staticmethod
+    def _doc_id(item: Dict) -> str:
+        return item.get("id") or item.get("doc_id") or ""
+
+    @classmethod
+    def _result(cls, item: Dict, blog_url: str = "", error: str = "", attempted: bool = True) -> Dict[str, Any]:
+        return {
+            "id": cls._doc_id(item),
+            "title": item.get("title", ""),
+            "blog_url": blog_url,
+            "error": error,
+            # False when nothing was tried for the item this run (cancelled, or held for reconciliation)
+            "attempted": attempted,
+        }
+
+    def _run_lane(
+        self,
+        pending: "queue.Queue[Dict]",
+        results: "queue.Queue[Any]",
+        stopped: Callable[[], bool],
+        before_post: Optional[Callable[[Dict], bool]],
+    ) -> None:
+        """One browser and page working through `pending` until it is empty."""
+        error = ""
         try:
-            frame_loc = page.frame_locator("#mainFrame")
-            popup = frame_loc.locator("div.se-popup-alert-confirm").first
-            if popup.count() > 0 and popup.is_visible():
-                cancel_span = popup.locator("span.se-popup-button-text").filter(has_text=re.compile(r"^\s*취소\s*$"))
-                if cancel_span.count() > 0 and cancel_span.last.is_visible():
-                    cancel_span.last.locator("xpath=ancestor::button[1]").click()
-        except Exception:
-            # Fallback to main document
-            try:
-                popup_top = page.locator("div.se-popup-alert-confirm").first
-                if popup_top.count() > 0 and popup_top.is_visible():
-                    cancel_span_top = popup_top.locator("span.se-popup-button-text").filter(has_text=re.compile(r"^\s*취소\s*$"))
-                    if cancel_span_top.count() > 0 and cancel_span_top.last.is_visible():
-                        cancel_span_top.last.locator("xpath=ancestor::button[1]").click()
-            except Exception:
-                pass
+            with sync_playwright() as p:
+                browser = p.chromium.launch(headless=NAVER_HEADLESS)
+                try:
+                    state = self._shared_state()
+                    options: Dict[str, Any] = {"storage_state": state}
+                    if NAVER_HEADLESS:
+                        # The default headless user agent says "HeadlessChrome", which Naver may treat as a bot
+                        options["user_agent"] = (
+                            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                            f"(KHTML, like Gecko) Chrome/{browser.version} Safari/537.36"
+                        )
+                    context = browser.new_context(**options)
+                    self._local.traffic = _Traffic(context, NAVER_BLOCK_RESOURCES)
+                    page = context.new_page()
+                    if state is None:
+                        self._relogin(page, context)
+                    else:
+                        # Validity is confirmed by the first editor load; see _open_editor
+                        log.info("저장된 네이버 로그인 세션 사용")
+                    while True:
+                        try:
+                            item = pending.get_nowait()
+                        except queue.Empty:
+                            break
+                        results.put(self._post_one(page, context, item, stopped, before_post))
+                        if page.is_closed():
+                            page = context.new_page()
+                    # Naver refreshes the session cookies as they are used
+                    self._save_session(context)
+                finally:
+                    browser.close()
+        except Exception as exc:
+            # Browser launch or login failed; the other lanes take the remaining items
+            log.opt(exception=exc).error(f"포스팅 페이지 시작 실패: {exc}")
+            error = str(exc) or type(exc).__name__
+        finally:
+            results.put(("done", error))
 
-        # Optionally close help panel if it appears; otherwise click 'Next'
+    def _post_one(
+        self,
+        page,
+        context,
+        item: Dict,
+        stopped: Callable[[], bool],
+        before_post: Optional[Callable[[Dict], bool]],
+    ) -> Dict[str, Any]:
+        title = item.get("title", "")
+        doc_id = self._doc_id(item)
+        # Settled from the journal without a browser or a throttle slot
+        prior = self._reconcile(item)
+        if prior is not None:
+            return prior
+        if not self.throttle.wait(stopped):
+            return self._result(item, error="cancelled", attempted=False)
         try:
-            frame_loc = page.frame_locator("#mainFrame")
-            help_panel = frame_loc.locator(".se-help-panel.se-is-on").first
-            if help_panel.count() > 0 and help_panel.is_visible():
-                close_btn = help_panel.locator("button.se-help-panel-close-button, .se-help-panel-close-button").first
-                if close_btn.count() > 0 and close_btn.is_visible():
-                    close_btn.click()
-                else:
-                    next_btn = help_panel.locator("button.slick-next").first
-                    if next_btn.count() > 0 and next_btn.is_visible():
-                        next_btn.click()
-        except Exception:
+            if before_post and not before_post(item):
+                return self._result(item, error="lease lost")
+            self.journal.start(doc_id, item.get("title") or "제목 없음")
+            blog_url = self._post_single(page, context, item)
+        except Exception as exc:
+            log.opt(exception=exc).warning(f"포스팅 실패: {title}: {exc}")
+            self._forget_unpublished(doc_id)
+            # The failed step may have left a dialog or half-written post open
             try:
-                help_panel_top = page.locator(".se-help-panel.se-is-on").first
-                if help_panel_top.count() > 0 and help_panel_top.is_visible():
-                    close_btn_top = help_panel_top.locator("button.se-help-panel-close-button, .se-help-panel-close-button").first
-                    if close_btn_top.count() > 0 and close_btn_top.is_visible():
-                        close_btn_top.click()
-                    else:
-                        next_btn_top = help_panel_top.locator("button.slick-next").first
-                        if next_btn_top.count() > 0 and next_btn_top.is_visible():
-                            next_btn_top.click()
+                page.close()
             except Exception:
                 pass
+            return self._result(item, error=str(exc) or type(exc).__name__)
+        if not blog_url:
+            log.warning(f"블로그 URL 확인 실패: {title}")
+            self._forget_unpublished(doc_id)
+            return self._result(item, error="blog URL not confirmed")
+        self.journal.confirmed(doc_id, blog_url)
+        log.info(f"포스팅 완료: {title} -> {blog_url}")
+        return self._result(item, blog_url)
+
+    def _forget_unpublished(self, doc_id: str) -> None:
+        # Past the publish click the post may exist; keep those for _reconcile
+        entry = self.journal.get(doc_id)
+        if entry and entry["state"] == STARTED:
+            self.journal.forget(doc_id)
+
+    def _reconcile(self, item: Dict) -> Optional[Dict[str, Any]]:
+        """The result of an earlier attempt that may have published `item`, or None to post it."""
+        entry = self.journal.get(self._doc_id(item))
+        if not entry or entry["state"] == STARTED:
+            # Stopped before the publish click: nothing reached the blog
+            return None
+        if entry["state"] == CONFIRMED:
+            log.info(f"이전 시도에서 게시 확인됨: {entry['title']} -> {entry['blog_url']}")
+            return self._result(item, entry["blog_url"])
+        blog_url = self._find_published(entry["title"])
+        if blog_url:
+            self.journal.confirmed(entry["id"], blog_url)
+            log.info(f"이전 시도의 게시글을 찾음: {entry['title']} -> {blog_url}")
+            return self._result(item, blog_url)
+        if time.time() - entry["updated_at"] < NAVER_UNCONFIRMED_RETRY_HOURS * 3600:
+            log.warning(f"게시 여부 확인 전이라 건너뜀: {entry['title']}")
+            return self._result(item, error="publish state unknown", attempted=False)
+        log.warning(f"이전 시도의 게시글이 없어 다시 포스팅: {entry['title']}")
+        return None
 
-        # The editor is an iframe-based editor; work inside #mainFrame first
-        # Title
+    def _find_published(self, title: str) -> str:
+        """URL of a recent post titled `title` in the blog's RSS feed, or ""."""
+        blog_id = NAVER_BLOG_ID or self.naver_id
         try:
-            page.wait_for_selector("#mainFrame", timeout=10000)
-            frame_loc = page.frame_locator("#mainFrame")
-            title_editable_iframe = frame_loc.locator("div.se-section-documentTitle [contenteditable='true']").first
-            if title_editable_iframe.count() > 0:
-                title_editable_iframe.click()
-                title_editable_iframe.fill(title, timeout=5000)
+            resp = requests.get(f"https://rss.blog.naver.com/{blog_id}.xml", timeout=10)
+            resp.raise_for_status()
+            root = ElementTree.fromstring(resp.content)
+        except (requests.RequestException, ElementTree.ParseError) as exc:
+            log.warning(f"블로그 RSS 확인 실패: {exc}")
+            return ""
+        for entry in root.iter("item"):
+            if (entry.findtext("title") or "").strip() != title.strip():
+                continue
+            # Feed links carry tracking parameters: https://blog.naver.com/{id}/{logNo}?fromRss=true...
+            link = (entry.findtext("link") or "").strip().split("?")[0]
+            if self._is_final_post_url(link):
+                return self._to_canonical_post_url(link)
+        return ""
+
+    def _shared_state(self) -> Optional[Dict[str, Any]]:
+        """Login state for a new context: the one in memory, else the saved one."""
+        with self._session_lock:
+            if not self._state_loaded:
+                self._state_loaded = True
+                state = self.session.load()
+                self._state = state if has_auth_cookies(state) else None
+            self._local.version = self._version
+            return self._state
+
+    def _relogin(self, page, context) -> None:
+        """Log this context in, or adopt the login another page just made."""
+        with self._session_lock:
+            if self._version != getattr(self._local, "version", -1) and self._state:
+                context.add_cookies(self._state["cookies"])
             else:
-                frame_loc.locator("span.se-placeholder:has-text('제목')").first.click()
-                page.keyboard.insert_text(title)
-        except Exception:
+                self._login(page, context)
+                self._version += 1
+            self._local.version = self._version
+
+    def _login(self, page, context) -> None:
+        page.goto(LOGIN_URL, timeout=60000)
+        page.fill("#id", self.naver_id)
+        page.fill("#pw", self.naver_pw)
+        page.click("#log\\.login")
+        page.wait_for_load_state("networkidle")
+        self._state = None
+        if self._save_session(context):
+            log.info("네이버 로그인 완료")
+        else:
+            # Captcha, new-device check or wrong credentials; nothing worth keeping
+            self.session.clear()
+            log.warning("네이버 로그인 쿠키를 확인하지 못함")
+
+    def _save_session(self, context) -> bool:
+        """Store the context's login state if it still has one; True when saved."""
+        state = context.storage_state()
+        if not has_auth_cookies(state):
+            return False
+        with self._session_lock:
+            self._state = state
             try:
-                # Fallback to main document if iframe path fails
-                title_editable = page.locator("div.se-section-documentTitle [contenteditable='true']").first
-                if title_editable.count() > 0:
-                    title_editable.click()
-                    title_editable.fill(title, timeout=5000)
-                else:
-                    placeholder = page.locator("span.se-placeholder:has-text('제목')").first
-                    placeholder.click()
-                    page.keyboard.insert_text(title)
-            except Exception:
-                try:
-                    page.fill("input[placeholder='제목을 입력하세요']", title, timeout=5000)
-                except Exception:
-                    pass
+                self.session.save(state)
+            except OSError as exc:
+                log.warning(f"로그인 세션 저장 실패: {exc}")
+        return True
+
+    @staticmethod
+    def _on_login_page(page) -> bool:
+        return (urlparse(page.url).netloc or "").lower().endswith("nid.naver.com")
+
+    def _open_editor(self, page, context) -> None:
+        traffic: Optional[_Traffic] = getattr(self._local, "traffic", None)
+        if traffic:
+            traffic.reset()
+        started = time.perf_counter()
+        # page.goto(f"https://blog.naver.com/{self.naver_id}?Redirct=Write&", timeout=60000)
+        page.goto(WRITE_URL, timeout=60000)
+        page.wait_for_load_state("networkidle")
+        if self._on_login_page(page):
+            # Saved session expired or was revoked server-side
+            log.info("로그인 세션이 만료되어 다시 로그인합니다")
+            self._relogin(page, context)
+            if traffic:
+                traffic.reset()
+            started = time.perf_counter()
+            page.goto(WRITE_URL, timeout=60000)
+            page.wait_for_load_state("networkidle")
+        if traffic:
+            log.info(
+                f"편집기 로드 {(time.perf_counter() - started) * 1000:.0f}ms, {traffic.bytes / 1024:.0f} KB "
+                f"(요청 {traffic.requests}건, 차단 {traffic.blocked}건)"
+            )
+
+    def _post_single(self, page, context, item: Dict) -> str:
+        title = item.get("title") or "제목 없음"
+        doc = build_document(item.get("content") or "", item.get("source_url") or "")
+        content = doc["text"]
 
-        # Content - use placeholder span text then fallback to editor/contenteditable
+        # Go to write form
+        self._open_editor(page, context)
+        page.wait_for_timeout(1000)
+        # The editor is an iframe-based editor; strategies work inside #mainFrame first
         try:
-            # Inside editor iframe first
             page.wait_for_selector("#mainFrame", timeout=10000)
-            frame_loc = page.frame_locator("#mainFrame")
-            content_editable_iframe = frame_loc.locator("div.se-section:not(.se-section-documentTitle) [contenteditable='true']").first
-            if content_editable_iframe.count() > 0:
-                content_editable_iframe.click()
-                content_editable_iframe.fill(content, timeout=5000)
-            else:
-                # Try multiple known placeholder variants
-                placeholders = [
-                    "글감과 함께 나의 일상을 기록해보세요!",
-                    "최근 다녀온 곳을 지도와 함께 기록해보세요!",
-                ]
-                clicked = False
-                for ph in placeholders:
-                    try:
-                        loc = frame_loc.locator(f"span.se-placeholder:has-text('{ph}')").first
-                        if loc.count() > 0 and loc.is_visible():
-                            loc.click()
-                            page.keyboard.insert_text(content)
-                            clicked = True
-                            break
-                    except Exception:
-                        pass
-                if not clicked:
-                    # Fallback: click first paragraph area
-                    area = frame_loc.locator("div.se-section:not(.se-section-documentTitle)").first
-                    if area.count() > 0:
-                        area.click()
-                        page.keyboard.insert_text(content)
         except Exception:
-            try:
-                # Fallback to main document
-                content_editable = page.locator("div.se-section:not(.se-section-documentTitle) [contenteditable='true']").first
-                if content_editable.count() > 0:
-                    content_editable.click()
-                    content_editable.fill(content, timeout=5000)
-                else:
-                    placeholders = [
-                        "글감과 함께 나의 일상을 기록해보세요!",
-                        "최근 다녀온 곳을 지도와 함께 기록해보세요!",
-                    ]
-                    clicked = False
-                    for ph in placeholders:
-                        try:
-                            loc = page.locator(f"span.se-placeholder:has-text('{ph}')").first
-                            if loc.count() > 0 and loc.is_visible():
-                                loc.click()
-                                page.keyboard.insert_text(content)
-                                clicked = True
-                                break
-                        except Exception:
-                            pass
-                    if not clicked:
-                        try:
-                            area = page.locator("div.se-section:not(.se-section-documentTitle)").first
-                            if area.count() > 0:
-                                area.click()
-                                page.keyboard.insert_text(content)
-                        except Exception:
-                            pass
-            except Exception:
-                try:
-                    # Generic fallback: first contenteditable anywhere
-                    page.locator("[contenteditable='true']").first.fill(content)
-                except Exception:
-                    try:
-                        page.keyboard.insert_text(content)
-                    except Exception:
-                        pass
+            pass
+        frame = page.frame_locator("#mainFrame")
+        run = self.selectors.run
+        # Playwright actions return None, so `action(...) is None` marks a call that did not raise
+
+        run("popup", [
+            ("frame", lambda: self._dismiss_popup(frame)),
+            ("top", lambda: self._dismiss_popup(page)),
+        ])
+        # Optionally close help panel if it appears; otherwise click 'Next'
+        run("help", [
+            ("frame", lambda: self._close_help(frame)),
+            ("top", lambda: self._close_help(page)),
+        ])
+        run("title", [
+            ("frame-editable", lambda: self._fill_editable(frame, "div.se-section-documentTitle", title)),
+            ("frame-placeholder", lambda: self._type_at(page, frame.locator("span.se-placeholder:has-text('제목')"), title)),
+            ("top-editable", lambda: self._fill_editable(page, "div.se-section-documentTitle", title)),
+            ("top-placeholder", lambda: self._type_at(page, page.locator("span.se-placeholder:has-text('제목')"), title)),
+            ("top-input", lambda: page.fill("input[placeholder='제목을 입력하세요']", title, timeout=5000) is None),
+        ], required=True)
+        body = "div.se-section:not(.se-section-documentTitle)"
+        pastes = [
+            ("frame-paste", lambda: self._paste_document(frame, body, doc)),
+            ("top-paste", lambda: self._paste_document(page, body, doc)),
+        ] if NAVER_CONTENT_MODE == "paste" and doc["marker"] else []
+        run("content", pastes + [
+            ("frame-editable", lambda: self._fill_editable(frame, body, content)),
+            ("frame-placeholder", lambda: self._type_at_placeholder(page, frame, content)),
+            ("frame-section", lambda: self._type_at(page, frame.locator(body), content)),
+            ("top-editable", lambda: self._fill_editable(page, body, content)),
+            ("top-placeholder", lambda: self._type_at_placeholder(page, page, content)),
+            ("top-section", lambda: self._type_at(page, page.locator(body), content)),
+        ], fallbacks=[
+            # Not aimed at the body: may land in the title or wherever focus is
+            ("any-editable", lambda: page.locator("[contenteditable='true']").first.fill(content) is None),
+            ("keyboard", lambda: page.keyboard.insert_text(content) is None),
+        ], required=True)
 
-        # Publish - try inside #mainFrame first, then fallback to top document
-        published_clicked = False
+        # Listen before publishing so the navigation to the new post is not missed
+        watcher = _PostUrlWatcher(context, page, self._is_final_post_url)
         try:
-            page.wait_for_selector("#mainFrame", timeout=10000)
-            frame_loc = page.frame_locator("#mainFrame")
-            # First click the primary publish button in the toolbar area to open the layer
-            try:
-                pre_btn = frame_loc.locator("div.publish_btn_area__KjA2i button.publish_btn__m9KHH, [data-click-area='tpb.publish']").first
-                if pre_btn.count() > 0 and pre_btn.is_visible():
-                    pre_btn.click()
-                    # Wait briefly for confirm layer/buttons
-                    frame_loc.locator("[data-testid='seOnePublishBtn'], button.confirm_btn__WEaBq, [data-click-area='tpb*i.publish']").first.wait_for(state="visible", timeout=5000)
-            except Exception:
-                pass
+            self._publish(page, frame, self._doc_id(item))
+            final_url = watcher.wait(POST_URL_TIMEOUT_MS) or self._scan_for_post_url(context)
+        finally:
+            watcher.detach()
+        if final_url:
+            return self._to_canonical_post_url(final_url)
+        # If we couldn't confirm, don't return the write URL; let caller skip saving
+        return ""
 
-            # Preferred selectors based on provided HTML for confirm publish
-            btn_primary = frame_loc.locator('[data-testid="seOnePublishBtn"]').first
-            if btn_primary.count() > 0:
-                btn_primary.click()
-                published_clicked = True
+    def _publish(self, page, frame, doc_id: str) -> None:
+        # The toolbar button opens the publish layer; its confirm button publishes
+        # Raises when the layer didn't open, so nothing is recorded as clicked
+        self.selectors.run("publish-open", [
+            ("frame", lambda: self._open_publish_layer(frame)),
+            ("top", lambda: self._open_publish_layer(page)),
+        ], required=True)
+        # From here on a crash may leave a published post behind
+        self.journal.clicked(doc_id)
+        self.selectors.run("publish", [
+            ("frame-testid", lambda: self._click_first(frame.locator('[data-testid="seOnePublishBtn"]'))),
+            ("frame-confirm", lambda: self._click_first(frame.locator("button.confirm_btn__WEaBq"))),
+            ("frame-click-area", lambda: self._click_first(frame.locator('[data-click-area="tpb*i.publish"]'))),
+        ], fallbacks=[
+            # Any "발행" text also matches the toolbar button that only opens the layer
+            ("frame-role", lambda: self._click_first(frame.get_by_role("button", name="발행"))),
+            ("frame-span", lambda: self._click_first(frame.locator("span:has-text('발행')"), button=True)),
+            ("top-role", lambda: self._click_first(page.get_by_role("button", name="발행"))),
+            ("top-span", lambda: self._click_first(page.locator("span:has-text('발행')"), button=True)),
+            ("top-text", lambda: page.click("text=발행", timeout=5000) is None),
+            ("top-register", lambda: page.click("text=등록", timeout=3000) is None),
+        ], required=True)
+
+    # Strategy building blocks; `scope` is the page or the #mainFrame frame locator.
+    # Each returns True when it handled its step.
+
+    @staticmethod
+    def _dismiss_popup(scope) -> bool:
+        popup = scope.locator("div.se-popup-alert-confirm").first
+        if popup.count() > 0 and popup.is_visible():
+            cancel_span = popup.locator("span.se-popup-button-text").filter(has_text=re.compile(r"^\s*취소\s*$"))
+            if cancel_span.count() > 0 and cancel_span.last.is_visible():
+                cancel_span.last.locator("xpath=ancestor::button[1]").click()
+        # No popup is fine too
+        return True
+
+    @staticmethod
+    def _close_help(scope) -> bool:
+        help_panel = scope.locator(".se-help-panel.se-is-on").first
+        if help_panel.count() > 0 and help_panel.is_visible():
+            close_btn = help_panel.locator("button.se-help-panel-close-button, .se-help-panel-close-button").first
+            if close_btn.count() > 0 and close_btn.is_visible():
+                close_btn.click()
             else:
-                btn_class = frame_loc.locator('button.confirm_btn__WEaBq').first
-                if btn_class.count() > 0:
-                    btn_class.click()
-                    published_clicked = True
-                else:
-                    btn_data = frame_loc.locator('[data-click-area="tpb*i.publish"]').first
-                    if btn_data.count() > 0:
-                        btn_data.click()
-                        published_clicked = True
-                    else:
-                        # Fallbacks inside iframe
-                        btn = frame_loc.get_by_role("button", name="발행")
-                        if btn.count() > 0:
-                            btn.first.click()
-                            published_clicked = True
-                        else:
-                            span_btn = frame_loc.locator("span:has-text('발행')").first
-                            if span_btn.count() > 0:
-                                span_btn.locator("xpath=ancestor::button[1]").click()
-                                published_clicked = True
-        except Exception:
-            pass
+                next_btn = help_panel.locator("button.slick-next").first
+                if next_btn.count() > 0 and next_btn.is_visible():
+                    next_btn.click()
+        return True
 
-        if not published_clicked:
-            try:
-                # Fallback to top document
-                try:
-                    pre_btn_top = page.locator("div.publish_btn_area__KjA2i button.publish_btn__m9KHH, [data-click-area='tpb.publish']").first
-                    if pre_btn_top.count() > 0 and pre_btn_top.is_visible():
-                        pre_btn_top.click()
-                except Exception:
-                    pass
-
-                btn = page.get_by_role("button", name="발행")
-                if btn.count() > 0:
-                    btn.first.click()
-                    published_clicked = True
-                else:
-                    span = page.locator("span:has-text('발행')").first
-                    if span.count() > 0:
-                        span.locator("xpath=ancestor::button[1]").click()
-                        published_clicked = True
-                    else:
-                        page.click("text=발행", timeout=5000)
-                        published_clicked = True
-            except Exception:
-                try:
-                    page.click("text=등록", timeout=3000)
-                except Exception:
-                    pass
+    @staticmethod
+    def _fill_editable(scope, section: str, text: str) -> bool:
+        editable = scope.locator(f"{section} [contenteditable='true']").first
+        if editable.count() == 0:
+            return False
+        editable.click()
+        editable.fill(text, timeout=5000)
+        return True
 
-        # If a cancel button shows up inside the iframe after publish, click it
+    @staticmethod
+    def _type_at(page, target, text: str) -> bool:
+        target = target.first
+        if target.count() == 0:
+            return False
+        target.click()
+        page.keyboard.insert_text(text)
+        return True
 
-        # Try to get final post URL after publish (redirect or new page)
+    @staticmethod
+    def _paste_document(scope, section: str, doc: Dict[str, str]) -> bool:
+        # Clicking the body section puts the caret in its (placeholder) paragraph
+        area = scope.locator(section).first
+        if area.count() == 0:
+            return False
+        area.click()
+        before = area.inner_text()
+        area.evaluate(PASTE_SCRIPT, {"html": doc["html"], "text": doc["text"]})
+        # Landed when the last paragraph shows up; otherwise the typing strategies take over
+        landed = area.filter(has_text=doc["marker"]).first
         try:
-            # Wait briefly for any navigation to complete
-            try:
-                page.wait_for_load_state("networkidle", timeout=15000)
-            except Exception:
-                pass
+            landed.wait_for(state="attached", timeout=5000)
+            return True
+        except Exception:
+            if area.inner_text() == before:
+                # The editor ignored the paste; typing the body is safe
+                return False
+        # The body changed, so the editor is still converting a long paste.
+        # Typing now would insert the body a second time
+        try:
+            landed.wait_for(state="attached", timeout=_PASTE_SETTLE_MS)
+        except Exception:
+            raise StepAborted("paste changed the body but never completed")
+        return True
 
-            # Wait up to 75s for a final post URL to appear
-            final_url = self._wait_for_final_post_url(page, context, timeout_ms=75000)
-            if final_url:
-                return self._to_canonical_post_url(final_url)
-            # If we couldn't confirm, don't return the write URL; let caller skip saving
-            return ""
+    @staticmethod
+    def _type_at_placeholder(page, scope, text: str) -> bool:
+        # Known placeholder variants of the empty body
+        for ph in ("글감과 함께 나의 일상을 기록해보세요!", "최근 다녀온 곳을 지도와 함께 기록해보세요!"):
+            loc = scope.locator(f"span.se-placeholder:has-text('{ph}')").first
+            if loc.count() > 0 and loc.is_visible():
+                loc.click()
+                page.keyboard.insert_text(text)
+                return True
+        return False
+
+    @staticmethod
+    def _open_publish_layer(scope) -> bool:
+        pre_btn = scope.locator("div.publish_btn_area__KjA2i button.publish_btn__m9KHH, [data-click-area='tpb.publish']").first
+        if not pre_btn.is_visible():
+            return False
+        pre_btn.click()
+        # Wait briefly for confirm layer/buttons
+        try:
+            scope.locator("[data-testid='seOnePublishBtn'], button.confirm_btn__WEaBq, [data-click-area='tpb*i.publish']").first.wait_for(state="visible", timeout=5000)
         except Exception:
-            return ""
+            pass
+        return True
+
+    @staticmethod
+    def _click_first(target, button: bool = False) -> bool:
+        target = target.first
+        if target.count() == 0:
+            return False
+        (target.locator("xpath=ancestor::button[1]") if button else target).click()
+        return True
 
     def _is_final_post_url(self, url: str) -> bool:
         if not url:
@@ -318,51 +699,38 @@ class NaverBlogPoster:
                 return True
         return False
 
-    def _wait_for_final_post_url(self, page, context, timeout_ms: int = 60000) -> str:
-        """Poll all open pages/frames for a final blog post URL, up to timeout."""
-        deadline = time.time() + (timeout_ms / 1000.0)
+    def _scan_for_post_url(self, context) -> str:
+        """One pass over open pages and frames, reading og:url/canonical; used when no event matched."""
         last_candidate = ""
-        while time.time() < deadline:
-            # Check all pages
+        for p in list(context.pages):
             try:
-                for p in list(context.pages):
+                u = p.url
+                if self._is_final_post_url(u):
+                    return u
+                for fr in p.frames:
                     try:
-                        u = p.url
-                        if self._is_final_post_url(u):
-                            return u
-                        # Also check frames' URLs
-                        for fr in p.frames:
-                            try:
-                                fu = fr.url
-                                if self._is_final_post_url(fu):
-                                    return fu
-                                # Try to read canonical/og:url from within the frame
-                                try:
-                                    can = fr.evaluate(
-                                        """
-                                        () => {
-                                          const og = document.querySelector('meta[property="og:url"]');
-                                          if (og && og.content) return og.content;
-                                          const ln = document.querySelector('link[rel="canonical"]');
-                                          if (ln && ln.href) return ln.href;
-                                          return location.href;
-                                        }
-                                        """
-                                    )
-                                    if isinstance(can, str) and self._is_final_post_url(can):
-                                        return can
-                                except Exception:
-                                    pass
-                            except Exception:
-                                continue
-                        # Track best candidate with logNo even on m.blog
-                        if u and "logno=" in u.lower():
-                            last_candidate = u
+                        if self._is_final_post_url(fr.url):
+                            return fr.url
+                        can = fr.evaluate(
+                            """
+                            () => {
+                              const og = document.querySelector('meta[property="og:url"]');
+                              if (og && og.content) return og.content;
+                              const ln = document.querySelector('link[rel="canonical"]');
+                              if (ln && ln.href) return ln.href;
+                              return location.href;
+                            }
+                            """
+                        )
+                        if isinstance(can, str) and self._is_final_post_url(can):
+                            return can
                     except Exception:
                         continue
+                # Track best candidate with logNo even on m.blog
+                if u and "logno=" in u.lower():
+                    last_candidate = u
             except Exception:
-                pass
-            time.sleep(0.5)
+                continue
         return last_candidate
 
     def _to_canonical_post_url(self, url: str) -> str:
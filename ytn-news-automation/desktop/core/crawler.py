@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import logging
 import os
 import time
-from typing import Dict, List, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 from concurrent.futures import ThreadPoolExecutor
 
 import requests
@@ -10,6 +11,11 @@ from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 from playwright.sync_api import sync_playwright
 
+from .dates import parse_published_at
+
+# stdlib logging: this module also runs in the server image, where loguru isn't installed
+log = logging.getLogger(__name__)
+
 
 class YTNService:
     def __init__(self) -> None:
@@ -19,7 +25,16 @@ class YTNService:
             "https://www.ytn.co.kr",
         )
 
-    def fetch_latest(self, limit: int = 10) -> List[Dict[str, str]]:
+    def fetch_latest(
+        self,
+        limit: int = 10,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Crawl the popular-news list and article details.
+
+        `on_progress(stage, done, total)` is called with stage "links" once the
+        list page is read and "details" after each article.
+        """
         session = requests.Session()
         session.headers.update({
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
@@ -108,23 +123,28 @@ class YTNService:
                 browser.close()
         except Exception:
             # If Playwright fails entirely, fall back to returning empty list here
-            pass
+            log.warning("목록 페이지 수집 실패: %s", self.list_url, exc_info=True)
+
 
+        if on_progress:
+            on_progress("links", len(link_items), len(link_items))
 
         # Visit each link and parse details concurrently
-        detailed: List[Dict[str, str]] = []
-        def _fetch_detail(li: Dict[str, str]) -> Dict[str, str]:
+        detailed: List[Dict[str, Any]] = []
+        def _fetch_detail(li: Dict[str, str]) -> Dict[str, Any]:
             try:
                 s = requests.Session()
                 s.headers.update(session.headers)
                 d = self._parse_detail(s, li.get("link", ""))
-            except Exception:
-                d = {"content": "", "published_at": "", "phone": "", "email": "", "reporter_name": "", "category": ""}
+            except Exception as exc:
+                log.warning("기사 수집 실패 %s: %s", li.get("link", ""), exc)
+                d = {"content": "", "published_at": None, "published_at_raw": "", "phone": "", "email": "", "reporter_name": "", "category": ""}
             return {
                 "title": li.get("title", ""),
                 "link": li.get("link", ""),
                 "content": d.get("content", ""),
-                "published_at": d.get("published_at", ""),
+                "published_at": d.get("published_at"),
+                "published_at_raw": d.get("published_at_raw", ""),
                 "phone": d.get("phone", ""),
                 "email": d.get("email", ""),
                 "reporter_name": d.get("reporter_name", ""),
@@ -135,17 +155,19 @@ class YTNService:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             for item in executor.map(_fetch_detail, link_items):
                 detailed.append(item)
+                if on_progress:
+                    on_progress("details", len(detailed), len(link_items))
 
         return detailed
 
-    def _parse_detail(self, session: requests.Session, url: str) -> Dict[str, str]:
+    def _parse_detail(self, session: requests.Session, url: str) -> Dict[str, Any]:
         r = session.get(url, timeout=12)
         r.raise_for_status()
         soup = BeautifulSoup(r.text, "html.parser")
 
-        # 작성일
+        # 작성일: 원문 문자열은 published_at_raw로 보관하고 타임스탬프로 변환
         date_div = soup.select_one("div.date")
-        published_at = date_div.get_text(strip=True) if date_div else ""
+        published_at_raw = date_div.get_text(strip=True) if date_div else ""
 
         # 카테고리: HTML <title> 내 대괄호 안 텍스트 추출 (예: [경제])
         import re
@@ -190,7 +212,8 @@ class YTNService:
                 reporter_name = excerpt_name
 
         return {
-            "published_at": published_at,
+            "published_at": parse_published_at(published_at_raw),
+            "published_at_raw": published_at_raw,
             "content": content_text,
             "phone": phone,
             "email": reporter_email,
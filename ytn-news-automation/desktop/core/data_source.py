@@ -0,0 +1,216 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .api_client import RETRY_STATUSES, ApiClient
+from .dates import normalize_published_at, parse_published_at
+from .news_doc import preview_fields
+from .write_queue import WriteQueue, is_connection_error
+
+
+def _preview(data: Dict[str, Any], derive_raw: bool = True) -> Dict[str, Any]:
+    # Pending writes shown in the list look like stored summaries
+    data = normalize_published_at(dict(data), derive_raw)
+    if "content" in data:
+        data.update(preview_fields(data["content"]))
+    return data
+
+
+class DataSource(ABC):
+    """News storage as seen by the UI: reads go to the backend, creates and updates
+    go through a persisted WriteQueue and show up in reads right away.
+    """
+
+    name = ""
+
+    def __init__(self, queue_path: Optional[str] = None) -> None:
+        self.queue = WriteQueue(self.apply_batch, path=queue_path, is_transient=self._is_transient)
+        self.queue.start()
+
+    # Backend hooks
+    @abstractmethod
+    def _list(self, limit: int) -> List[Dict[str, Any]]: ...
+
+    @abstractmethod
+    def _get(self, doc_id: str) -> Dict[str, Any]:
+        """The stored document, or {} when it does not exist."""
+        ...
+
+    @abstractmethod
+    def _delete(self, doc_id: str) -> None: ...
+
+    @abstractmethod
+    def apply_batch(self, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Write queued ops; one {"op", "id", "found"} result per op."""
+        ...
+
+    def _is_transient(self, exc: Exception) -> bool:
+        """Whether apply_batch failed to reach the backend, rather than being refused."""
+        return is_connection_error(exc)
+
+    # UI surface
+    def list_news(self, limit: int = 50) -> List[Dict[str, Any]]:
+        items = self._list(limit)
+        pending = self.queue.pending()
+        updates: Dict[str, Dict[str, Any]] = {}
+        created: List[Dict[str, Any]] = []
+        parked: Dict[str, str] = {}
+        for p in pending:
+            if p["parked"] and p["id"]:
+                parked[p["id"]] = p["error"] or "parked"
+            if p["op"] == "create":
+                created.append({**_preview(p["data"]), "id": p["id"], "pending": True})
+            elif p["op"] == "update":
+                updates.setdefault(p["id"], {}).update(p["data"])
+        for item in created:
+            item["parked"] = parked.get(item["id"], "")
+        for item in items:
+            if item.get("id") in updates:
+                item.update(_preview(updates[item["id"]], derive_raw=False))
+                item["pending"] = True
+                item["parked"] = parked.get(item["id"], "")
+        return list(reversed(created)) + items
+
+    def get_news(self, doc_id: str) -> Dict[str, Any]:
+        merged: Dict[str, Any] = {}
+        pending_create = False
+        for p in self.queue.pending():
+            if p["id"] == doc_id and p["op"] in ("create", "update"):
+                merged.update(p["data"])
+                pending_create = pending_create or p["op"] == "create"
+        base = {} if pending_create else self._get(doc_id)
+        if not base and not pending_create:
+            return {}
+        return {**base, **normalize_published_at(merged, derive_raw=pending_create), "id": doc_id}
+
+    def get_news_many(self, doc_ids: List[str]) -> List[Dict[str, Any]]:
+        """Current state of each document; ones that no longer exist are left out."""
+        return [item for item in (self.get_news(doc_id) for doc_id in doc_ids) if item]
+
+    def create_news(self, data: Dict[str, Any]) -> str:
+        return self.queue.create(data)
+
+    def update_news(self, doc_id: str, data: Dict[str, Any]) -> None:
+        self.queue.update(doc_id, data)
+
+    def delete_news(self, doc_id: str) -> None:
+        if not self.queue.forget(doc_id):
+            self._delete(doc_id)
+
+    def save_crawled(self, items: List[Dict[str, Any]]) -> int:
+        """Queue crawled articles; matched to stored ones by source_url, then title."""
+        for item in items:
+            self.queue.upsert(item)
+        return len(items)
+
+    def pending_count(self) -> int:
+        return self.queue.pending_count()
+
+    def parked_count(self) -> int:
+        return self.queue.parked_count()
+
+    def close(self) -> None:
+        self.queue.stop(flush=True)
+
+
+class FirestoreDataSource(DataSource):
+    name = "Firestore"
+
+    def __init__(self, manager=None, queue_path: Optional[str] = None) -> None:
+        if manager is None:
+            from .firestore_manager import FirestoreManager
+
+            manager = FirestoreManager()
+        self.manager = manager
+        super().__init__(queue_path)
+
+    def _list(self, limit: int) -> List[Dict[str, Any]]:
+        return self.manager.list_news(limit=limit)
+
+    def _get(self, doc_id: str) -> Dict[str, Any]:
+        return self.manager.get_news_by_id(doc_id)
+
+    def _delete(self, doc_id: str) -> None:
+        self.manager.delete_news(doc_id)
+
+    def _is_transient(self, exc: Exception) -> bool:
+        from google.api_core import exceptions as gexc
+        from google.auth.exceptions import TransportError
+
+        transient = (
+            gexc.ServiceUnavailable,
+            gexc.DeadlineExceeded,
+            gexc.InternalServerError,
+            gexc.TooManyRequests,
+            gexc.ResourceExhausted,
+            gexc.Aborted,
+            gexc.RetryError,
+            TransportError,
+        )
+        return isinstance(exc, transient) or is_connection_error(exc)
+
+    def apply_batch(self, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        for op in ops:
+            data = op["data"]
+            if op["op"] == "create":
+                doc_id = self.manager.create_news(data, doc_id=op["id"])
+            elif op["op"] == "update":
+                doc_id = op["id"]
+                self.manager.update_news(doc_id, data)
+            else:
+                doc_id = self.manager.upsert_by_source_url(data.get("source_url") or "", data)
+            results.append({"op": op["op"], "id": doc_id, "found": True})
+        return results
+
+
+class ApiDataSource(DataSource):
+    name = "API"
+
+    def __init__(self, client: Optional[ApiClient] = None, queue_path: Optional[str] = None) -> None:
+        self.client = client or ApiClient()
+        super().__init__(queue_path)
+
+    @staticmethod
+    def _from_api(item: Dict[str, Any]) -> Dict[str, Any]:
+        # JSON carries timestamps as ISO strings
+        for field in ("published_at", "created_at", "updated_at"):
+            if isinstance(item.get(field), str):
+                item[field] = parse_published_at(item[field]) or item[field]
+        return item
+
+    def _list(self, limit: int) -> List[Dict[str, Any]]:
+        return [self._from_api(it) for it in self.client.list_news(limit=limit)]
+
+    def _get(self, doc_id: str) -> Dict[str, Any]:
+        try:
+            return self._from_api(self.client.get_news(doc_id))
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                return {}
+            raise
+
+    def _delete(self, doc_id: str) -> None:
+        self.client.delete_news(doc_id)
+
+    def apply_batch(self, ops: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.client.batch_news(ops)
+
+    def _is_transient(self, exc: Exception) -> bool:
+        if isinstance(exc, httpx.HTTPStatusError):
+            # A 500 may come from the ops themselves; it counts toward parking
+            return exc.response.status_code in RETRY_STATUSES
+        return isinstance(exc, httpx.TransportError) or is_connection_error(exc)
+
+    def close(self) -> None:
+        super().close()
+        self.client.close()
+
+
+def create_data_source() -> DataSource:
+    """The REST API when API_BASE_URL is set, Firestore otherwise."""
+    client = ApiClient()
+    if client.enabled():
+        return ApiDataSource(client)
+    return FirestoreDataSource()
@@ -0,0 +1,64 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+
+KST = timezone(timedelta(hours=9))
+
+# YTN's div.date, e.g. "2024.08.12. 오후 3:25." or "입력 : 2024-08-12 15:25"
+_DATE_RE = re.compile(
+    r"(\d{4})\s*[.\-/년]\s*(\d{1,2})\s*[.\-/월]\s*(\d{1,2})\s*[.일]?\s*"
+    r"(?:(오전|오후|AM|PM|am|pm)\s*)?"
+    r"(?:(\d{1,2})\s*:\s*(\d{2})(?:\s*:\s*(\d{2}))?)?"
+)
+
+
+def parse_published_at(raw: Any) -> Optional[datetime]:
+    """Parse a YTN date string (or ISO 8601) into an aware datetime; KST when no zone is given."""
+    if isinstance(raw, datetime):
+        return raw if raw.tzinfo else raw.replace(tzinfo=KST)
+    text = str(raw or "").strip()
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=KST)
+    except ValueError:
+        pass
+    m = _DATE_RE.search(text)
+    if not m:
+        return None
+    year, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    hour, minute, second = int(m.group(5) or 0), int(m.group(6) or 0), int(m.group(7) or 0)
+    meridiem = (m.group(4) or "").lower()
+    if meridiem in ("오후", "pm") and hour < 12:
+        hour += 12
+    elif meridiem in ("오전", "am") and hour == 12:
+        hour = 0
+    try:
+        return datetime(year, month, day, hour, minute, second, tzinfo=KST)
+    except ValueError:
+        return None
+
+
+def normalize_published_at(data: Dict[str, Any], derive_raw: bool = True) -> Dict[str, Any]:
+    """Store `published_at` as a timestamp and keep the original text in `published_at_raw`.
+
+    Edits pass `derive_raw=False`: the editor sends back the reformatted date,
+    which must not replace the YTN text stored when the article was created.
+    """
+    value = data.get("published_at")
+    if "published_at" not in data or value is None or isinstance(value, datetime):
+        return data
+    raw = str(value).strip()
+    data = {**data, "published_at": parse_published_at(raw)}
+    if derive_raw:
+        data.setdefault("published_at_raw", raw)
+    return data
+
+
+def format_published_at(value: Any) -> str:
+    if isinstance(value, datetime):
+        aware = value if value.tzinfo else value.replace(tzinfo=KST)
+        return aware.astimezone(KST).strftime("%Y-%m-%d %H:%M")
+    return str(value or "")
@@ -0,0 +1,49 @@
+import html
+import re
+from typing import Dict, List
+
+
+# A paragraph that is one quoted utterance becomes a quotation block
+_QUOTED = re.compile(r'^[“"].+[”"]$')
+
+# Dispatched on the focused body paragraph; SmartEditor turns pasted HTML into
+# its own paragraph and quotation components in one step
+PASTE_SCRIPT = """
+(el, doc) => {
+  const target = el.ownerDocument.activeElement || el;
+  const data = new DataTransfer();
+  data.setData('text/html', doc.html);
+  data.setData('text/plain', doc.text);
+  target.dispatchEvent(new ClipboardEvent('paste', {clipboardData: data, bubbles: true, cancelable: true}));
+}
+"""
+
+
+def paragraphs(content: str) -> List[str]:
+    # The crawler joins the article's text nodes with newlines
+    return [line.strip() for line in (content or "").splitlines() if line.strip()]
+
+
+def build_document(content: str, source_url: str = "") -> Dict[str, str]:
+    """The post body as {"html", "text", "marker"}, built once per article.
+
+    `html` is what gets pasted, `text` the same body for plain-text insertion,
+    and `marker` a snippet of the last paragraph that shows the paste landed.
+    """
+    blocks: List[str] = []
+    lines: List[str] = []
+    body = paragraphs(content)
+    for para in body:
+        escaped = html.escape(para)
+        if _QUOTED.match(para):
+            blocks.append(f"<blockquote><p>{escaped}</p></blockquote>")
+        else:
+            blocks.append(f"<p>{escaped}</p>")
+        lines.append(para)
+    if source_url:
+        url = html.escape(source_url, quote=True)
+        blocks.append(f'<p>출처: <a href="{url}">{url}</a></p>')
+        lines.append(f"출처: {source_url}")
+    # The editor may turn the source link into a link card, so prefer article text
+    marker = (body or lines or [""])[-1][:40]
+    return {"html": "".join(blocks), "text": "\n".join(lines), "marker": marker}
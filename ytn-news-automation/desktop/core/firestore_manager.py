@@ -1,9 +1,21 @@
 import os
 import sys
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core.exceptions import AlreadyExists
+
+from .dates import KST, normalize_published_at
+from .news_doc import BODY_COLLECTION, BODY_DOC_ID, as_summary, normalize_status, split_content
+from .stats import NewsCounters
+
+
+# Posting work queue: a poster leases pending articles before publishing them.
+# Leases expire so items held by a crashed poster become claimable again.
+POST_LEASE_SECONDS = int(os.getenv("POST_LEASE_SECONDS", "900"))
+MAX_POST_ATTEMPTS = int(os.getenv("MAX_POST_ATTEMPTS", "3"))
 
 
 class FirestoreManager:
@@ -41,41 +53,119 @@ class FirestoreManager:
                     # Fall back to Application Default Credentials on Cloud Run / GCE
                     firebase_admin.initialize_app(options={"projectId": project_id} if project_id else None)
         self.client = firestore.client()
+        self.counters = NewsCounters(self.client, firestore)
 
     def _col(self):
         return self.client.collection(self.collection_name)
 
-    def list_news(self, limit: int = 100) -> List[Dict[str, Any]]:
-        docs = self._col().order_by("created_at", direction=firestore.Query.DESCENDING).limit(limit).stream()
+    def _body_ref(self, doc_id: str):
+        return self._col().document(doc_id).collection(BODY_COLLECTION).document(BODY_DOC_ID)
+
+    def _attach_bodies(self, items: List[Dict[str, Any]]) -> None:
+        missing = {it["id"]: it for it in items if "content" not in it}
+        if not missing:
+            return
+        for snap in self.client.get_all([self._body_ref(doc_id) for doc_id in missing]):
+            doc_id = snap.reference.parent.parent.id
+            missing[doc_id]["content"] = (snap.to_dict() or {}).get("content", "")
+        for it in missing.values():
+            it.setdefault("content", "")
+
+    def list_news(
+        self,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Newest first. With `since`/`until` the range applies to `published_at`
+        (and results are ordered by it); otherwise ordered by `created_at`.
+        """
+        query = self._col()
+        if category:
+            query = query.where("category", "==", category)
+        if since or until:
+            if since:
+                query = query.where("published_at", ">=", since if since.tzinfo else since.replace(tzinfo=KST))
+            if until:
+                query = query.where("published_at", "<", until if until.tzinfo else until.replace(tzinfo=KST))
+            query = query.order_by("published_at", direction=firestore.Query.DESCENDING)
+        else:
+            query = query.order_by("created_at", direction=firestore.Query.DESCENDING)
+        docs = query.limit(limit).stream()
         items: List[Dict[str, Any]] = []
         for d in docs:
-            data = d.to_dict() or {}
+            data = as_summary(d.to_dict() or {})
             data["id"] = d.id
             items.append(data)
         return items
 
     def get_news_by_id(self, doc_id: str) -> Dict[str, Any]:
-        snap = self._col().document(doc_id).get()
+        """The article with its body, or {} when the document does not exist."""
+        snaps = {
+            snap.reference.path: snap
+            for snap in self.client.get_all([self._col().document(doc_id), self._body_ref(doc_id)])
+        }
+        snap = snaps[self._col().document(doc_id).path]
+        if not snap.exists:
+            return {}
         data = snap.to_dict() or {}
+        if "content" not in data:
+            body = snaps[self._body_ref(doc_id).path].to_dict() or {}
+            data["content"] = body.get("content", "")
         data["id"] = doc_id
         return data
 
-    def create_news(self, data: Dict[str, Any]) -> str:
+    def create_news(self, data: Dict[str, Any], doc_id: Optional[str] = None) -> str:
+        # With a caller-chosen doc_id, creating an existing document is a no-op,
+        # so the write queue can replay a create whose outcome it never saw
+        data, body = split_content(normalize_published_at(normalize_status(data)))
         data = {**data}
         data.setdefault("status", "new")
         data.setdefault("created_at", firestore.SERVER_TIMESTAMP)
         data["updated_at"] = firestore.SERVER_TIMESTAMP
-        ref = self._col().document()
-        ref.set(data)
+        ref = self._col().document(doc_id) if doc_id else self._col().document()
+        batch = self.client.batch()
+        if doc_id:
+            batch.create(ref, data)
+        else:
+            batch.set(ref, data)
+        batch.set(self._body_ref(ref.id), body or {"content": ""})
+        self.counters.apply(batch, None, data)
+        try:
+            batch.commit()
+        except AlreadyExists:
+            pass
         return ref.id
 
     def update_news(self, doc_id: str, data: Dict[str, Any]) -> None:
-        data = {**data}
-        data["updated_at"] = firestore.SERVER_TIMESTAMP
-        self._col().document(doc_id).set(data, merge=True)
+        data, body = split_content(normalize_published_at(normalize_status(data), derive_raw=False))
+        ref = self._col().document(doc_id)
+
+        @firestore.transactional
+        def _update(transaction) -> None:
+            old = ref.get(transaction=transaction).to_dict()
+            writes = {**data, "updated_at": firestore.SERVER_TIMESTAMP}
+            if body is not None:
+                # Moves a legacy inline body out of the summary on first edit
+                writes["content"] = firestore.DELETE_FIELD
+                transaction.set(self._body_ref(doc_id), body)
+            transaction.set(ref, writes, merge=True)
+            self.counters.apply(transaction, old, {**(old or {}), **data})
+
+        _update(self.client.transaction())
 
     def delete_news(self, doc_id: str) -> None:
-        self._col().document(doc_id).delete()
+        ref = self._col().document(doc_id)
+
+        @firestore.transactional
+        def _delete(transaction) -> None:
+            old = ref.get(transaction=transaction).to_dict()
+            transaction.delete(self._body_ref(doc_id))
+            transaction.delete(ref)
+            self.counters.apply(transaction, old, None)
+
+        _delete(self.client.transaction())
 
     def upsert_by_source_url(self, source_url: str, data: Dict[str, Any]) -> str:
         # Try match by source_url first when available
@@ -85,7 +175,7 @@ class FirestoreManager:
             docs = list(query)
             if docs:
                 doc_id = docs[0].id
-                self.update_news(doc_id, data)
+                self.update_news(doc_id, self._without_status(data))
                 return doc_id
 
         # If not found by URL (or URL missing), attempt match by exact title
@@ -95,12 +185,168 @@ class FirestoreManager:
             title_docs = list(title_query)
             if title_docs:
                 doc_id = title_docs[0].id
-                self.update_news(doc_id, data)
+                self.update_news(doc_id, self._without_status(data))
                 return doc_id
 
         # Create new if no match found
         return self.create_news(data)
 
+    @staticmethod
+    def _without_status(data: Dict[str, Any]) -> Dict[str, Any]:
+        # Re-crawling an article must not reset its posting state (e.g. posted -> new)
+        return {k: v for k, v in data.items() if k != "status"}
+
+    # Posting work queue
+    def claim_pending(self, worker_id: str, limit: int = 3, lease_seconds: int = POST_LEASE_SECONDS) -> List[Dict[str, Any]]:
+        """Lease up to ``limit`` unposted articles for ``worker_id``, oldest first.
+
+        Each claim runs in a transaction, so concurrent posters never receive
+        the same article. Articles whose lease expired are claimable again.
+        """
+        if limit <= 0:
+            return []
+        now = datetime.now(timezone.utc)
+        # Over-fetch a little: other posters may win some of the candidates
+        fetch = limit * 3
+        candidates = list(
+            self._col().where("status", "==", "new").order_by("created_at").limit(fetch).stream()
+        )
+        if len(candidates) < fetch:
+            candidates += list(
+                self._col()
+                .where("status", "==", "posting")
+                .where("lease_expires_at", "<", now)
+                .order_by("lease_expires_at")
+                .limit(fetch - len(candidates))
+                .stream()
+            )
+
+        claimed: List[Dict[str, Any]] = []
+        for snap in candidates:
+            if len(claimed) >= limit:
+                break
+            data = self._try_claim(snap.reference, worker_id, lease_seconds)
+            if data:
+                data["id"] = snap.id
+                claimed.append(data)
+        # The poster needs the full article text
+        self._attach_bodies(claimed)
+        return claimed
+
+    def renew_lease(self, doc_id: str, worker_id: str, lease_seconds: int = POST_LEASE_SECONDS) -> bool:
+        """Extend a lease held by ``worker_id``. Returns False if it was lost."""
+        ref = self._col().document(doc_id)
+
+        @firestore.transactional
+        def _renew(transaction) -> bool:
+            data = ref.get(transaction=transaction).to_dict() or {}
+            if data.get("status") != "posting" or data.get("lease_owner") != worker_id:
+                return False
+            transaction.update(ref, {
+                "lease_expires_at": datetime.now(timezone.utc) + timedelta(seconds=lease_seconds),
+            })
+            return True
+
+        return _renew(self.client.transaction())
+
+    def complete_post(self, doc_id: str, worker_id: str, blog_url: str) -> bool:
+        """Mark a leased article as posted. Returns False if the document is gone.
+
+        The article is marked posted even when the lease was lost in the
+        meantime: it has been published, so nobody should publish it again.
+        """
+        ref = self._col().document(doc_id)
+
+        @firestore.transactional
+        def _complete(transaction) -> bool:
+            old = ref.get(transaction=transaction).to_dict()
+            if not old:
+                return False
+            transaction.update(ref, {
+                "blog_url": blog_url,
+                "status": "posted",
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "last_error": "",
+                "updated_at": firestore.SERVER_TIMESTAMP,
+            })
+            self.counters.apply(transaction, old, {**old, "status": "posted"})
+            return True
+
+        return _complete(self.client.transaction())
+
+    def release_lease(self, doc_id: str, worker_id: str, error: str = "", count_attempt: bool = True) -> bool:
+        """Give a leased article back to the queue after a failed attempt.
+
+        Articles that used up ``MAX_POST_ATTEMPTS`` are parked as ``failed``.
+        With ``count_attempt=False`` (the article was never tried, e.g. the run
+        was cancelled first) the attempt taken by the claim is given back.
+        """
+        ref = self._col().document(doc_id)
+
+        @firestore.transactional
+        def _release(transaction) -> bool:
+            data = ref.get(transaction=transaction).to_dict() or {}
+            if data.get("status") != "posting" or data.get("lease_owner") != worker_id:
+                return False
+            attempts = int(data.get("post_attempts") or 0)
+            update: Dict[str, Any] = {}
+            if not count_attempt:
+                attempts = max(attempts - 1, 0)
+                update["post_attempts"] = attempts
+            status = "failed" if attempts >= MAX_POST_ATTEMPTS else "new"
+            transaction.update(ref, {
+                **update,
+                "status": status,
+                "lease_owner": None,
+                "lease_expires_at": None,
+                "last_error": error,
+                "updated_at": firestore.SERVER_TIMESTAMP,
+            })
+            self.counters.apply(transaction, data, {**data, "status": status})
+            return True
+
+        return _release(self.client.transaction())
+
+    def _try_claim(self, ref, worker_id: str, lease_seconds: int) -> Dict[str, Any]:
+        @firestore.transactional
+        def _claim(transaction) -> Dict[str, Any]:
+            snap = ref.get(transaction=transaction)
+            data = snap.to_dict() or {}
+            now = datetime.now(timezone.utc)
+            status = data.get("status")
+            if status == "posting":
+                expires = data.get("lease_expires_at")
+                if expires and expires > now:
+                    return {}
+            elif status != "new":
+                return {}
+
+            attempts = int(data.get("post_attempts") or 0)
+            if attempts >= MAX_POST_ATTEMPTS:
+                # Expired lease after the last allowed attempt: park it
+                transaction.update(ref, {
+                    "status": "failed",
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                    "updated_at": firestore.SERVER_TIMESTAMP,
+                })
+                self.counters.apply(transaction, data, {**data, "status": "failed"})
+                return {}
+
+            lease = {
+                "status": "posting",
+                "lease_owner": worker_id,
+                "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                "post_attempts": attempts + 1,
+            }
+            transaction.update(ref, {**lease, "updated_at": firestore.SERVER_TIMESTAMP})
+            self.counters.apply(transaction, data, {**data, **lease})
+            data.update(lease)
+            return data
+
+        return _claim(self.client.transaction())
+
 
 
 
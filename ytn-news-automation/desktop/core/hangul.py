@@ -0,0 +1,40 @@
+from typing import Dict
+
+
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_COUNT = 11172
+_LEADS = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_VOWELS = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_TAILS = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+          "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# Compound letters as typed one key at a time: "고" then "과"
+_COMPOUNDS = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+
+def _split(jamo: str) -> str:
+    return _COMPOUNDS.get(jamo, jamo)
+
+
+def _build_table() -> Dict[int, str]:
+    table: Dict[int, str] = {ord(k): v for k, v in _COMPOUNDS.items()}
+    for index in range(_SYLLABLE_COUNT):
+        lead, rest = divmod(index, 588)
+        vowel, tail = divmod(rest, 28)
+        table[_SYLLABLE_BASE + index] = _LEADS[lead] + _split(_VOWELS[vowel]) + "".join(map(_split, _TAILS[tail]))
+    return table
+
+
+_JAMO_TABLE = _build_table()
+
+
+def search_key(text: str) -> str:
+    """Lowercased text with Hangul syllables spelled out as single jamo.
+
+    A query matches as a plain substring of the key, so "한ㄱ" or "하" find
+    "한국" just like the finished syllables do.
+    """
+    return text.lower().translate(_JAMO_TABLE)
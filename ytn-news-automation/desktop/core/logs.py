@@ -0,0 +1,85 @@
+import logging
+import os
+import sys
+from typing import Any
+
+from loguru import logger
+
+from .paths import app_data_dir
+
+
+# Components that tag their records; the log view filters on these
+COMPONENTS = ("app", "crawler", "poster", "firestore", "api", "queue")
+
+# stdlib loggers (modules shared with the server, libraries) -> component
+_STDLIB_COMPONENTS = {
+    "desktop.core.crawler": "crawler",
+    "google": "firestore",
+    "httpx": "api",
+}
+
+_configured = False
+
+
+class _InterceptHandler(logging.Handler):
+    """Forward stdlib logging records to loguru, tagged with a component."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            level: Any = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        component = next(
+            (c for prefix, c in _STDLIB_COMPONENTS.items() if record.name.startswith(prefix)), "app"
+        )
+        logger.bind(component=component).opt(exception=record.exc_info).log(level, record.getMessage())
+
+
+def log_dir() -> str:
+    path = os.path.join(app_data_dir(), "logs")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def setup_logging() -> None:
+    """Send all records to rotated, gzip-compressed JSON-lines files (and stderr
+    when there is one). Safe to call more than once.
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+    # Read here, not at import, so values from the .env files apply
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    logger.remove()
+    logger.configure(extra={"component": "app"})
+    logger.add(
+        os.path.join(log_dir(), "desktop_{time:YYYY-MM-DD}.jsonl"),
+        level=level,
+        serialize=True,
+        rotation=os.getenv("LOG_ROTATION", "10 MB"),
+        retention=os.getenv("LOG_RETENTION", "14 days"),
+        compression="gz",
+        # Written from a background thread; GUI and pool threads never block on disk
+        enqueue=True,
+        encoding="utf-8",
+    )
+    # A windowed PyInstaller build has no console
+    if sys.stderr is not None:
+        logger.add(
+            sys.stderr,
+            level=level,
+            format="{time:HH:mm:ss} | {level: <7} | {extra[component]: <9} | {message}",
+        )
+
+    logging.basicConfig(handlers=[_InterceptHandler()], level=logging.INFO, force=True)
+
+    def _excepthook(exc_type, exc, tb) -> None:
+        # Uncaught errors, including ones raised in Qt slots
+        logger.opt(exception=(exc_type, exc, tb)).critical("처리되지 않은 예외")
+
+    sys.excepthook = _excepthook
+
+
+def get_logger(component: str) -> Any:
+    return logger.bind(component=component)
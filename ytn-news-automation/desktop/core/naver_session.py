@@ -0,0 +1,104 @@
+import base64
+import json
+import os
+import time
+from typing import Any, Dict, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+from .logs import get_logger
+from .paths import app_data_dir
+
+
+SESSION_FILE = "naver_session.bin"
+# Cookies Naver sets on login; without them every page bounces to nid.naver.com
+AUTH_COOKIES = ("NID_AUT", "NID_SES")
+
+_MAGIC = b"NSS1"
+_SALT_BYTES = 16
+_KDF_ITERATIONS = 390_000
+
+log = get_logger("poster")
+
+
+def has_auth_cookies(state: Optional[Dict[str, Any]], now: Optional[float] = None) -> bool:
+    """Whether a storage_state still carries unexpired Naver login cookies.
+
+    Checked offline, so a batch can skip the login page without a round trip;
+    a session Naver revoked server-side is still caught on the first page load.
+    """
+    if not state:
+        return False
+    now = time.time() if now is None else now
+    found = set()
+    for cookie in state.get("cookies") or []:
+        if cookie.get("name") not in AUTH_COOKIES or "naver.com" not in (cookie.get("domain") or ""):
+            continue
+        expires = cookie.get("expires", -1)
+        # -1 is a browser-session cookie; Playwright keeps those in storage_state
+        if expires is None or expires < 0 or expires > now:
+            found.add(cookie["name"])
+    return found == set(AUTH_COOKIES)
+
+
+class SessionStore:
+    """Playwright storage_state of one Naver account, encrypted on disk.
+
+    The Fernet key is derived with PBKDF2 from the account id and password and a
+    per-file salt, so the file is useless without the credentials it was made
+    with; changing NAVER_ID or NAVER_PW simply makes the next batch log in again.
+    """
+
+    def __init__(self, account: str, secret: str, path: Optional[str] = None) -> None:
+        self.account = account
+        self._secret = f"{account}\0{secret}".encode("utf-8")
+        self.path = path or os.path.join(app_data_dir(), SESSION_FILE)
+
+    def _fernet(self, salt: bytes) -> Fernet:
+        kdf = PBKDF2HMAC(algorithm=hashes.SHA256(), length=32, salt=salt, iterations=_KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(kdf.derive(self._secret)))
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """The saved storage_state, or None when missing, unreadable or for another account."""
+        try:
+            with open(self.path, "rb") as f:
+                blob = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            log.warning(f"로그인 세션 파일을 읽지 못함: {exc}")
+            return None
+        head = len(_MAGIC)
+        if not blob.startswith(_MAGIC) or len(blob) <= head + _SALT_BYTES:
+            log.warning("로그인 세션 파일 형식이 올바르지 않아 무시합니다")
+            return None
+        salt = blob[head:head + _SALT_BYTES]
+        try:
+            payload = json.loads(self._fernet(salt).decrypt(blob[head + _SALT_BYTES:]))
+        except (InvalidToken, ValueError):
+            # Written with other credentials, or corrupted
+            log.info("저장된 로그인 세션을 사용할 수 없어 다시 로그인합니다")
+            return None
+        if payload.get("account") != self.account:
+            return None
+        return payload.get("state")
+
+    def save(self, state: Dict[str, Any]) -> None:
+        salt = os.urandom(_SALT_BYTES)
+        token = self._fernet(salt).encrypt(
+            json.dumps({"account": self.account, "saved_at": time.time(), "state": state}).encode("utf-8")
+        )
+        tmp = f"{self.path}.tmp"
+        # Owner-only from the start; the state holds live session cookies
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(_MAGIC + salt + token)
+        os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,41 @@
+from typing import Any, Dict, Optional, Tuple
+
+
+# Article bodies live in news/{id}/body/content so list queries only read the
+# small summary document; the summary keeps a short preview instead.
+# Shared by the desktop app and the server, so both store the same preview.
+BODY_COLLECTION = "body"
+BODY_DOC_ID = "content"
+PREVIEW_CHARS = 200
+
+
+def preview_fields(content: Optional[str]) -> Dict[str, Any]:
+    content = content or ""
+    return {"content_preview": content[:PREVIEW_CHARS], "content_length": len(content)}
+
+
+def split_content(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """Split a write payload into (summary fields, body fields or None)."""
+    if "content" not in data:
+        return data, None
+    summary = {k: v for k, v in data.items() if k != "content"}
+    summary.update(preview_fields(data.get("content")))
+    return summary, {"content": data.get("content") or ""}
+
+
+def as_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """A stored document as a list row; documents not migrated yet still carry the body inline."""
+    if "content" in data:
+        for key, value in preview_fields(data.pop("content")).items():
+            data.setdefault(key, value)
+    return data
+
+
+def normalize_status(data: Dict[str, Any]) -> Dict[str, Any]:
+    """A blank `status` (the editor dialog sends "" for an empty field) stored as "new".
+
+    The posting queue only claims "new" articles, so a blank one would never be posted.
+    """
+    if "status" in data and not str(data["status"] or "").strip():
+        return {**data, "status": "new"}
+    return data
@@ -0,0 +1,24 @@
+import os
+import sys
+
+
+APP_DIR_NAME = "YTNNewsAutomation"
+
+
+def app_data_dir() -> str:
+    """Per-user directory for local state (write queue, sessions, journals).
+
+    YTN_DATA_DIR overrides the platform default.
+    """
+    base = os.getenv("YTN_DATA_DIR")
+    if not base:
+        if sys.platform == "win32":
+            root = os.getenv("LOCALAPPDATA") or os.getenv("APPDATA") or os.path.expanduser("~")
+            base = os.path.join(root, APP_DIR_NAME)
+        elif sys.platform == "darwin":
+            base = os.path.join(os.path.expanduser("~/Library/Application Support"), APP_DIR_NAME)
+        else:
+            root = os.getenv("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+            base = os.path.join(root, "ytn-news-automation")
+    os.makedirs(base, exist_ok=True)
+    return base
@@ -0,0 +1,105 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .paths import app_data_dir
+
+
+# Attempt states, in order. "clicked" means the post may exist even though no URL was seen
+STARTED = "started"
+CLICKED = "clicked"
+CONFIRMED = "confirmed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    doc_id TEXT PRIMARY KEY,
+    title TEXT NOT NULL DEFAULT '',
+    state TEXT NOT NULL,
+    blog_url TEXT NOT NULL DEFAULT '',
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class PostJournal:
+    """Per-article record of posting attempts, committed at every step.
+
+    An article enters the journal when its attempt starts, moves to "clicked"
+    just before the publish click and to "confirmed" with its URL, and leaves
+    once Firestore has recorded it as posted. After a crash, whatever is left
+    tells the poster which articles may already be on the blog.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.path.join(app_data_dir(), "post_journal.sqlite3")
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        # A commit per step; WAL keeps those cheap and the file consistent after a crash
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+
+    def start(self, doc_id: str, title: str) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO attempts (doc_id, title, state, blog_url, started_at, updated_at) "
+                "VALUES (?, ?, ?, '', ?, ?)",
+                (doc_id, title, STARTED, now, now),
+            )
+
+    def clicked(self, doc_id: str) -> None:
+        self._set(doc_id, CLICKED)
+
+    def confirmed(self, doc_id: str, blog_url: str) -> None:
+        self._set(doc_id, CONFIRMED, blog_url)
+
+    def _set(self, doc_id: str, state: str, blog_url: str = "") -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE attempts SET state = ?, blog_url = ?, updated_at = ? WHERE doc_id = ?",
+                (state, blog_url, time.time(), doc_id),
+            )
+
+    def forget(self, doc_id: str) -> None:
+        """Drop the entry: the article is recorded as posted, or was never published."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM attempts WHERE doc_id = ?", (doc_id,))
+
+    def get(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT doc_id, title, state, blog_url, started_at, updated_at FROM attempts WHERE doc_id = ?",
+                (doc_id,),
+            ).fetchone()
+        return self._entry(row) if row else None
+
+    def entries(self, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entries, oldest first: {"id", "title", "state", "blog_url", "started_at", "updated_at"}."""
+        query = "SELECT doc_id, title, state, blog_url, started_at, updated_at FROM attempts"
+        args: tuple = ()
+        if state:
+            query += " WHERE state = ?"
+            args = (state,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY started_at", args).fetchall()
+        return [self._entry(row) for row in rows]
+
+    @staticmethod
+    def _entry(row: tuple) -> Dict[str, Any]:
+        doc_id, title, state, blog_url, started_at, updated_at = row
+        return {
+            "id": doc_id,
+            "title": title,
+            "state": state,
+            "blog_url": blog_url,
+            "started_at": started_at,
+            "updated_at": updated_at,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
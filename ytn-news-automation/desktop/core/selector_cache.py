@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .logs import get_logger
+from .paths import app_data_dir
+
+
+CACHE_FILE = "selector_cache.json"
+
+# (name, attempt): the attempt returns True when it handled the step, False or
+# raises when its selectors did not match and the next strategy should run
+Strategy = Tuple[str, Callable[[], bool]]
+
+log = get_logger("poster")
+
+
+class StepAborted(RuntimeError):
+    """Raised by a strategy when running the next one would do harm, e.g. type a
+    body the editor is still busy pasting. `run` stops and re-raises it."""
+
+
+class SelectorCache:
+    """Which selector strategy last worked for each editor step, kept on disk.
+
+    `run` tries the remembered winner first and the rest in declared order, so
+    a step whose markup is stable costs a single probe. Catch-all fallbacks
+    (typing wherever focus is, clicking any "발행" text) run only after every
+    targeted strategy missed and are never remembered, so one lucky hit cannot
+    put them first for good. Per-step timings and miss counts are accumulated
+    alongside and written with the winners.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or os.path.join(app_data_dir(), CACHE_FILE)
+        # Steps run on several posting threads at once
+        self._lock = threading.Lock()
+        self._steps: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                steps = json.load(f).get("steps")
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, AttributeError) as exc:
+            log.warning(f"선택자 캐시를 읽지 못해 새로 만듭니다: {exc}")
+            return
+        if isinstance(steps, dict):
+            self._steps = steps
+
+    def _entry(self, step: str) -> Dict[str, Any]:
+        return self._steps.setdefault(
+            step, {"winner": "", "runs": 0, "total_ms": 0.0, "max_ms": 0.0, "misses": 0, "failures": 0, "wins": {}}
+        )
+
+    def run(
+        self,
+        step: str,
+        strategies: Sequence[Strategy],
+        fallbacks: Sequence[Strategy] = (),
+        required: bool = False,
+    ) -> str:
+        """Run strategies, then fallbacks, until one handles `step`.
+
+        Returns the name of the one that did, or "" if none did; with
+        `required`, that raises instead so the post stops before publishing.
+        A strategy raising StepAborted ends the step at once, required or not.
+        """
+        with self._lock:
+            winner = self._entry(step)["winner"]
+        ordered: List[Strategy] = sorted(strategies, key=lambda s: s[0] != winner)
+        cacheable = {name for name, _ in strategies}
+        started = time.perf_counter()
+        used, misses = "", 0
+        errors: List[str] = []
+        aborted: Optional[StepAborted] = None
+        for name, attempt in [*ordered, *fallbacks]:
+            try:
+                handled = attempt()
+            except StepAborted as exc:
+                aborted = exc
+                errors.append(f"{name}: {exc}")
+                break
+            except Exception as exc:
+                log.debug(f"선택자 전략 실패: {step}/{name}: {exc}")
+                errors.append(f"{name}: {str(exc).splitlines()[0] if str(exc) else type(exc).__name__}")
+                handled = False
+            if handled:
+                used = name
+                break
+            misses += 1
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        with self._lock:
+            entry = self._entry(step)
+            entry["runs"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["misses"] += misses
+            if used:
+                entry["wins"][used] = entry["wins"].get(used, 0) + 1
+                if used in cacheable:
+                    entry["winner"] = used
+            else:
+                entry["failures"] += 1
+            self._dirty = True
+        if used and used not in cacheable:
+            log.warning(f"편집기 단계 {step}: 대체 전략 {used} 사용")
+        if aborted is not None:
+            log.warning(f"편집기 단계 {step}: 중단 ({'; '.join(errors)})")
+            raise aborted
+        if not used:
+            log.warning(f"편집기 단계 {step}: 모든 선택자 전략 실패 ({'; '.join(errors) or '일치하는 요소 없음'})")
+            if required:
+                raise RuntimeError(f"editor step failed: {step}")
+        return used
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-step {"winner", "runs", "avg_ms", "max_ms", "misses", "failures", "wins"}."""
+        with self._lock:
+            return {
+                step: {
+                    **{k: v for k, v in entry.items() if k != "total_ms"},
+                    "wins": dict(entry["wins"]),
+                    "avg_ms": entry["total_ms"] / entry["runs"] if entry["runs"] else 0.0,
+                }
+                for step, entry in self._steps.items()
+            }
+
+    def summary(self) -> str:
+        """One line for the log: where posting time goes, slowest step first."""
+        stats = sorted(self.stats().items(), key=lambda kv: kv[1]["avg_ms"], reverse=True)
+        return ", ".join(
+            f"{step} {s['avg_ms']:.0f}ms ({s['winner'] or '-'}, 빗나감 {s['misses']}, 실패 {s['failures']})"
+            for step, s in stats
+        )
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps({"steps": self._steps}, ensure_ascii=False, indent=1)
+            self._dirty = False
+        tmp = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp, self.path)
+        except OSError as exc:
+            log.warning(f"선택자 캐시 저장 실패: {exc}")
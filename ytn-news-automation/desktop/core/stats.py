@@ -0,0 +1,157 @@
+import os
+import random
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dates import KST
+
+
+# Aggregates live in news_stats/{counter}/shards/{n}. Writers increment one random
+# shard, readers sum all shards, so hot counters don't hit Firestore's per-document
+# write rate limit.
+STATS_COLLECTION = os.getenv("FIRESTORE_STATS_COLLECTION", "news_stats")
+STATS_SHARDS = int(os.getenv("STATS_SHARDS", "8"))
+TOTALS = "totals"
+
+FieldPath = Tuple[str, ...]
+Delta = Dict[str, Dict[FieldPath, int]]
+
+
+def _key(value: Any) -> str:
+    # Firestore map keys can't be empty
+    return str(value or "").strip() or "(none)"
+
+
+def _day(doc: Dict[str, Any]) -> str:
+    for field in ("published_at", "created_at"):
+        value = doc.get(field)
+        if isinstance(value, datetime):
+            aware = value if value.tzinfo else value.replace(tzinfo=KST)
+            return aware.astimezone(KST).date().isoformat()
+    # created_at is still a SERVER_TIMESTAMP sentinel while a document is being created
+    return datetime.now(KST).date().isoformat()
+
+
+def contributions(doc: Optional[Dict[str, Any]]) -> Delta:
+    """Counter increments a single news document accounts for."""
+    if not doc:
+        return {}
+    status = _key(doc.get("status"))
+    category = _key(doc.get("category"))
+    reporter = _key(doc.get("reporter_name"))
+    return {
+        TOTALS: {
+            ("total",): 1,
+            ("status", status): 1,
+            ("category", category): 1,
+            ("category_status", category, status): 1,
+            ("reporter", reporter): 1,
+        },
+        f"daily-{_day(doc)}": {
+            ("total",): 1,
+            ("category", category): 1,
+            ("reporter", reporter): 1,
+        },
+    }
+
+
+def delta(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> Delta:
+    """Increments that turn the counters for `old` into those for `new` (None = absent)."""
+    out: Delta = {}
+    for sign, doc in ((-1, old), (1, new)):
+        for counter, paths in contributions(doc).items():
+            bucket = out.setdefault(counter, {})
+            for path, n in paths.items():
+                bucket[path] = bucket.get(path, 0) + sign * n
+    return {
+        counter: {path: n for path, n in paths.items() if n}
+        for counter, paths in out.items()
+        if any(paths.values())
+    }
+
+
+def _merge(into: Dict[str, Any], data: Dict[str, Any]) -> None:
+    for k, v in data.items():
+        if isinstance(v, dict):
+            _merge(into.setdefault(k, {}), v)
+        elif isinstance(v, (int, float)):
+            into[k] = into.get(k, 0) + v
+
+
+def add_delta(into: Dict[str, Dict[str, Any]], changes: Delta) -> None:
+    """Apply `changes` to plain nested dicts, one per counter (backends without shards)."""
+    for counter, paths in changes.items():
+        root = into.setdefault(counter, {})
+        for path, n in paths.items():
+            node = root
+            for part in path[:-1]:
+                node = node.setdefault(part, {})
+            node[path[-1]] = node.get(path[-1], 0) + n
+
+
+def day_keys(days: int) -> List[str]:
+    """The last `days` KST dates, today first."""
+    today = datetime.now(KST).date()
+    return [(today - timedelta(days=i)).isoformat() for i in range(days)]
+
+
+def summarize(merged: Dict[str, Dict[str, Any]], days: List[str]) -> Dict[str, Any]:
+    """Shape merged counters like `GET /stats`."""
+    totals = merged.get(TOTALS, {})
+    daily = [(d, merged.get(f"daily-{d}", {})) for d in days]
+    return {
+        "total": totals.get("total", 0),
+        "status": totals.get("status", {}),
+        "category": totals.get("category", {}),
+        "category_status": totals.get("category_status", {}),
+        "reporter": totals.get("reporter", {}),
+        "daily": [
+            {
+                "date": d,
+                "total": counts.get("total", 0),
+                "category": counts.get("category", {}),
+                "reporter": counts.get("reporter", {}),
+            }
+            for d, counts in daily
+        ],
+    }
+
+
+class NewsCounters:
+    """Sharded counters in Firestore.
+
+    `firestore` is the module the caller's client comes from (firebase_admin's on
+    the desktop, google.cloud's on the server); only its Increment is used.
+    """
+
+    def __init__(self, client, firestore, collection_name: Optional[str] = None, shards: Optional[int] = None) -> None:
+        self.client = client
+        self._increment = firestore.Increment
+        self.collection_name = collection_name or STATS_COLLECTION
+        self.shards = shards or STATS_SHARDS
+
+    def _shard_ref(self, counter: str, shard: int):
+        return self.client.collection(self.collection_name).document(counter).collection("shards").document(str(shard))
+
+    def apply(self, writer, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> int:
+        """Queue counter increments on `writer` (a WriteBatch or Transaction); returns the write count."""
+        changes = delta(old, new)
+        for counter, paths in changes.items():
+            nested: Dict[str, Any] = {}
+            for path, n in paths.items():
+                node = nested
+                for part in path[:-1]:
+                    node = node.setdefault(part, {})
+                node[path[-1]] = self._increment(n)
+            writer.set(self._shard_ref(counter, random.randrange(self.shards)), nested, merge=True)
+        return len(changes)
+
+    def read(self, days: int = 7) -> Dict[str, Any]:
+        """Sum all shards of the totals and of the last `days` daily counters (today first)."""
+        keys = day_keys(days)
+        counters = [TOTALS] + [f"daily-{d}" for d in keys]
+        merged: Dict[str, Dict[str, Any]] = {c: {} for c in counters}
+        refs = [self._shard_ref(c, i) for c in counters for i in range(self.shards)]
+        for snap in self.client.get_all(refs):
+            _merge(merged[snap.reference.parent.parent.id], snap.to_dict() or {})
+        return summarize(merged, keys)
@@ -0,0 +1,312 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from .logs import get_logger
+from .paths import app_data_dir
+
+
+WRITE_QUEUE_BATCH = int(os.getenv("WRITE_QUEUE_BATCH", "50"))
+WRITE_QUEUE_INTERVAL = float(os.getenv("WRITE_QUEUE_INTERVAL", "1.0"))
+# After the first queued write, wait this long for more so a burst goes out as one batch
+WRITE_QUEUE_LINGER = float(os.getenv("WRITE_QUEUE_LINGER", "0.2"))
+# An op the backend keeps rejecting is parked after this many tries; failing to
+# reach the backend at all is not counted, so edits made offline are never parked
+WRITE_QUEUE_MAX_ATTEMPTS = int(os.getenv("WRITE_QUEUE_MAX_ATTEMPTS", "8"))
+MAX_BACKOFF_SECONDS = 60.0
+
+log = get_logger("queue")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ops (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    op TEXT NOT NULL,
+    doc_id TEXT,
+    data TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT NOT NULL DEFAULT '',
+    parked INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# sink(ops) -> results, one {"op", "id", "found"} per op in the same order
+Sink = Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]
+
+# Ops whose document has a parked op wait behind it, e.g. an update to a create that failed
+_SENDABLE = (
+    "parked = 0 AND (doc_id IS NULL OR doc_id NOT IN "
+    "(SELECT doc_id FROM ops WHERE parked = 1 AND doc_id IS NOT NULL))"
+)
+
+
+def new_doc_id() -> str:
+    # Same shape as Firestore auto ids; chosen here so a create can be replayed
+    return uuid.uuid4().hex[:20]
+
+
+def is_connection_error(exc: Exception) -> bool:
+    """Default for WriteQueue's `is_transient`: the backend was not reached."""
+    return isinstance(exc, (OSError, TimeoutError))
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, default=lambda v: v.isoformat() if isinstance(v, datetime) else str(v))
+
+
+class WriteQueue:
+    """Persisted write-behind queue for creates, updates and crawl upserts.
+
+    Writes return as soon as they are stored in a local SQLite file; a background
+    thread sends them to `sink` in batches and retries with backoff while the
+    backend is unreachable. Updates to a document with a pending (not yet sent)
+    create or update are merged into it. Creates carry their final id, so a batch
+    whose response got lost can be sent again without duplicating documents.
+
+    Errors `is_transient` accepts (the backend was not reached) are retried
+    without limit. A batch the backend rejects is resent op by op, so only the
+    bad op is charged an attempt; after WRITE_QUEUE_MAX_ATTEMPTS it is parked.
+    Parked ops are retried on start and whenever a flush gets through.
+    """
+
+    def __init__(
+        self,
+        sink: Sink,
+        path: Optional[str] = None,
+        batch_size: int = WRITE_QUEUE_BATCH,
+        interval: float = WRITE_QUEUE_INTERVAL,
+        is_transient: Callable[[Exception], bool] = is_connection_error,
+    ) -> None:
+        self.sink = sink
+        self.is_transient = is_transient
+        self.path = path or os.path.join(app_data_dir(), "write_queue.sqlite3")
+        self.batch_size = batch_size
+        self.interval = interval
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        # Held for a whole send so the flusher and an explicit flush() never send the same ops
+        self._flush_lock = threading.Lock()
+        self._inflight: set = set()
+        self._idle = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._failures = 0
+        # Called on the queue thread; marshal to the GUI thread before touching widgets
+        self.on_flushed: Optional[Callable[[List[Dict[str, Any]]], None]] = None
+        self.on_error: Optional[Callable[[Exception], None]] = None
+
+    # Producer side
+    def create(self, data: Dict[str, Any]) -> str:
+        doc_id = new_doc_id()
+        self._insert("create", doc_id, data)
+        return doc_id
+
+    def update(self, doc_id: str, data: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            # Parked ops of the document go out again with the edit, which may be what fixes them
+            self._conn.execute("UPDATE ops SET parked = 0, attempts = 0 WHERE doc_id = ? AND parked = 1", (doc_id,))
+            row = self._conn.execute(
+                "SELECT seq, data FROM ops WHERE doc_id = ? AND op IN ('create', 'update') "
+                "ORDER BY seq DESC LIMIT 1",
+                (doc_id,),
+            ).fetchone()
+            if row and row[0] not in self._inflight:
+                merged = {**json.loads(row[1]), **json.loads(_dumps(data))}
+                self._conn.execute("UPDATE ops SET data = ? WHERE seq = ?", (_dumps(merged), row[0]))
+                self._wake.set()
+                return
+        self._insert("update", doc_id, data)
+
+    def upsert(self, data: Dict[str, Any]) -> None:
+        self._insert("upsert", None, data)
+
+    def forget(self, doc_id: str) -> bool:
+        """Drop pending writes for `doc_id` before it is deleted.
+
+        Returns True if the document only existed in the queue, i.e. there is
+        nothing to delete on the backend.
+        """
+        with self._lock:
+            while any(self._op_doc_id(seq) == doc_id for seq in self._inflight):
+                self._idle.wait(timeout=30)
+            with self._conn:
+                local_only = self._conn.execute(
+                    "SELECT 1 FROM ops WHERE doc_id = ? AND op = 'create'", (doc_id,)
+                ).fetchone() is not None
+                self._conn.execute("DELETE FROM ops WHERE doc_id = ?", (doc_id,))
+        return local_only
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """Queued ops, oldest first: {"op", "id", "data", "attempts", "error", "parked"}."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT op, doc_id, data, attempts, last_error, parked FROM ops ORDER BY seq"
+            ).fetchall()
+        return [
+            {"op": op, "id": doc_id, "data": json.loads(data), "attempts": attempts, "error": error, "parked": bool(parked)}
+            for op, doc_id, data, attempts, error, parked in rows
+        ]
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ops WHERE parked = 0").fetchone()[0]
+
+    def parked_count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ops WHERE parked = 1").fetchone()[0]
+
+    def retry_parked(self) -> int:
+        """Queue parked ops again with fresh attempts; returns how many there were."""
+        with self._lock, self._conn:
+            count = self._conn.execute("UPDATE ops SET parked = 0, attempts = 0 WHERE parked = 1").rowcount
+        if count:
+            log.info(f"보류된 저장 {count}건 재시도")
+            self._wake.set()
+        return count
+
+    def _insert(self, op: str, doc_id: Optional[str], data: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT INTO ops (op, doc_id, data) VALUES (?, ?, ?)", (op, doc_id, _dumps(data)))
+        self._wake.set()
+
+    def _op_doc_id(self, seq: int) -> Optional[str]:
+        row = self._conn.execute("SELECT doc_id FROM ops WHERE seq = ?", (seq,)).fetchone()
+        return row[0] if row else None
+
+    # Flusher
+    def start(self) -> None:
+        if self._thread is None:
+            self.retry_parked()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="write-queue", daemon=True)
+            self._thread.start()
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the flusher; with `flush`, try once more to send what is queued."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+        if flush:
+            try:
+                self.flush()
+            except Exception as exc:
+                # Still persisted; sent on the next start
+                log.warning(f"종료 전 전송 실패, 다음 실행 때 전송: {exc}")
+        with self._lock:
+            self._conn.close()
+
+    def flush(self) -> int:
+        """Send queued ops until the queue is empty; returns how many were sent."""
+        sent = 0
+        with self._flush_lock:
+            while True:
+                n = self._flush_batch()
+                if not n:
+                    return sent
+                sent += n
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            if self._wake.wait(timeout=self.interval):
+                self._stop.wait(WRITE_QUEUE_LINGER)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                if self.flush() and self.parked_count():
+                    # The backend takes writes again; give parked ops another round
+                    self.retry_parked()
+                self._failures = 0
+            except Exception as exc:
+                self._failures += 1
+                log.warning(f"전송 실패 ({self._failures}회 연속): {type(exc).__name__}: {exc}")
+                if self.on_error is not None:
+                    self.on_error(exc)
+                self._stop.wait(min(self.interval * (2 ** self._failures), MAX_BACKOFF_SECONDS))
+
+    def _flush_batch(self) -> int:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT seq, op, doc_id, data FROM ops WHERE {_SENDABLE} ORDER BY seq LIMIT ?",
+                (self.batch_size,),
+            ).fetchall()
+            if not rows:
+                return 0
+            self._inflight = {r[0] for r in rows}
+        ops = [{"op": op, "id": doc_id, "data": json.loads(data)} for _, op, doc_id, data in rows]
+        sent: List[int] = []
+        results: List[Dict[str, Any]] = []
+        error: Optional[Exception] = None
+        try:
+            results = self.sink(ops)
+            sent = [r[0] for r in rows]
+        except Exception as exc:
+            error = exc
+            if self.is_transient(exc):
+                self._note_error([r[0] for r in rows], exc)
+            elif len(rows) == 1:
+                self._reject(rows[0], exc)
+            else:
+                # One bad op fails the whole batch; send them singly to find it
+                sent, results, error = self._send_each(rows, ops)
+        with self._lock, self._conn:
+            if sent:
+                self._conn.execute(f"DELETE FROM ops WHERE seq IN ({','.join('?' * len(sent))})", sent)
+            self._inflight = set()
+            self._idle.notify_all()
+        if results and self.on_flushed is not None:
+            self.on_flushed(results)
+        if error is not None:
+            raise error
+        return len(sent)
+
+    def _send_each(self, rows: List[tuple], ops: List[Dict[str, Any]]):
+        """Send ops one at a time; returns (sent seqs, results, last error or None)."""
+        sent: List[int] = []
+        results: List[Dict[str, Any]] = []
+        error: Optional[Exception] = None
+        rejected: set = set()
+        for row, op in zip(rows, ops):
+            seq, doc_id = row[0], row[2]
+            if doc_id and doc_id in rejected:
+                # Follows an op on the same document that was just rejected
+                continue
+            try:
+                results += self.sink([op])
+                sent.append(seq)
+            except Exception as exc:
+                error = exc
+                if self.is_transient(exc):
+                    self._note_error([r[0] for r in rows if r[0] not in sent], exc)
+                    break
+                self._reject(row, exc)
+                if doc_id:
+                    rejected.add(doc_id)
+        return sent, results, error
+
+    def _note_error(self, seqs: List[int], exc: Exception) -> None:
+        # Shown with the pending rows; not an attempt, the backend never saw the ops
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE ops SET last_error = ? WHERE seq IN ({','.join('?' * len(seqs))})",
+                [f"{type(exc).__name__}: {exc}"] + seqs,
+            )
+
+    def _reject(self, row: tuple, exc: Exception) -> None:
+        seq, op, doc_id = row[0], row[1], row[2]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE ops SET attempts = attempts + 1, last_error = ?, "
+                "parked = CASE WHEN attempts + 1 >= ? THEN 1 ELSE 0 END WHERE seq = ?",
+                (f"{type(exc).__name__}: {exc}", WRITE_QUEUE_MAX_ATTEMPTS, seq),
+            )
+            parked = self._conn.execute("SELECT parked FROM ops WHERE seq = ?", (seq,)).fetchone()
+        if parked and parked[0]:
+            log.error(f"저장 보류 ({op} {doc_id or ''}): {type(exc).__name__}: {exc}")
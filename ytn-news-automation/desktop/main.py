@@ -1,9 +1,16 @@
 import os
 import sys
+import time
+
+_STARTED = time.perf_counter()
+
 from dotenv import load_dotenv
 
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication
 
+from desktop.core.logs import setup_logging
+
 try:
     from desktop.ui.main_window import MainWindow
 except Exception as exc:
@@ -11,9 +18,22 @@ except Exception as exc:
     raise
 
 
+def _probe(app: QApplication, window: MainWindow, until: str) -> None:
+    # STARTUP_PROBE=window|data: print when the window is up (and the first list
+    # load is done), then quit. Used by desktop/scripts/measure_startup.py.
+    def _mark(stage: str) -> None:
+        print(f"startup {stage} {(time.perf_counter() - _STARTED) * 1000:.1f}", flush=True)
+        if stage == until:
+            app.quit()
+
+    # Runs once the event loop has shown the window
+    QTimer.singleShot(0, lambda: _mark("window"))
+    window.ready.connect(lambda: _mark("data"))
+
+
 def main() -> int:
     # Load environment from multiple locations
-    # 1) Bundled config when running as PyInstaller onefile
+    # 1) Bundled config when running from the PyInstaller bundle
     base_dir = getattr(sys, "_MEIPASS", os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
     load_dotenv(dotenv_path=os.path.join(base_dir, "config", ".env"), override=False)
 
@@ -24,13 +44,19 @@ def main() -> int:
     # 3) Fallback to current working directory search
     load_dotenv(override=False)
 
+    # After the .env files: LOG_LEVEL and YTN_DATA_DIR may come from them
+    setup_logging()
+
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    probe = os.getenv("STARTUP_PROBE", "")
+    if probe:
+        _probe(app, window, probe)
+    # Services connect and the list loads in the background, after the first paint
+    QTimer.singleShot(0, window.start)
     return app.exec_()
 
 
 if __name__ == "__main__":
     sys.exit(main())
-
-
@@ -0,0 +1 @@
+# marks package
@@ -0,0 +1,79 @@
+"""Build the desktop app with PyInstaller as a onedir bundle.
+
+A onefile build unpacks the whole bundle (Qt, gRPC, Playwright's driver) into
+a temp folder on every launch before any code runs; onedir starts straight
+from dist/YTNNewsApp/. The bundle is compiled with -O (--optimize 1) and
+without UPX, which would otherwise decompress every DLL at load time.
+
+Usage (from ytn-news-automation/, after `pip install -r desktop/requirements.txt`):
+    python -m desktop.scripts.build_exe
+    python -m desktop.scripts.build_exe --browsers "%LOCALAPPDATA%\\ms-playwright"
+    python -m desktop.scripts.build_exe --dry-run
+
+Ship the whole dist/YTNNewsApp/ folder; YTNNewsApp(.exe) inside it is the app.
+"""
+import argparse
+import os
+import sys
+from typing import List
+
+
+NAME = "YTNNewsApp"
+# Never imported by the app, but pulled in by the analysis of some dependencies
+EXCLUDES = ("tkinter", "pydoc_data", "test", "PyQt5.QtWebEngineWidgets", "PyQt5.QtQml", "PyQt5.QtQuick")
+
+
+def _playwright_browsers() -> str:
+    # Where `PLAYWRIGHT_BROWSERS_PATH=0 playwright install chromium` puts them
+    try:
+        import playwright
+    except ImportError:
+        return ""
+    path = os.path.join(os.path.dirname(playwright.__file__), "driver", "package", ".local-browsers")
+    return path if os.path.isdir(path) else ""
+
+
+def pyinstaller_args(browsers: str) -> List[str]:
+    sep = os.pathsep
+    args = [
+        os.path.join("desktop", "main.py"),
+        "--noconfirm",
+        "--clean",
+        "--onedir",
+        "--windowed",
+        "--name", NAME,
+        # `desktop` is imported as a package from the project root
+        "--paths", ".",
+        "--optimize", "1",
+        "--noupx",
+    ]
+    for module in EXCLUDES:
+        args += ["--exclude-module", module]
+    if os.path.isdir("config"):
+        args += ["--add-data", f"config{sep}config"]
+    if browsers:
+        args += ["--add-data", f"{browsers}{sep}playwright/driver/package/.local-browsers"]
+    return args
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--browsers", default="", help="Playwright browsers folder to bundle (default: the package-local one, if any)")
+    parser.add_argument("--dry-run", action="store_true", help="print the PyInstaller arguments and exit")
+    args = parser.parse_args()
+
+    browsers = os.path.expandvars(args.browsers) if args.browsers else _playwright_browsers()
+    pyi_args = pyinstaller_args(browsers)
+    print("pyinstaller " + " ".join(pyi_args))
+    if args.dry_run:
+        return
+    if not browsers:
+        print("note: no Playwright browsers bundled; crawling/posting need `playwright install chromium` on the target", file=sys.stderr)
+
+    import PyInstaller.__main__
+
+    PyInstaller.__main__.run(pyi_args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Measure how long the Naver blog editor takes to load with and without resource blocking.
+
+Without --har it loads the live editor with the saved login session (see
+naver_session.bin; run one posting batch first), blocking off and on,
+alternating, N times each, and prints the median load time, transfer size
+and request counts per mode. Only these live runs show the network savings.
+
+--record loads the editor once and writes every response to a HAR file;
+--har replays it instead. Replayed responses are served locally with no
+network latency, so replay numbers compare rendering/script time and request
+counts only, not network savings. Requests missing from the HAR
+(cache-busting URLs) are aborted in both modes. --out saves the runs and
+medians as JSON. The HAR holds the session cookies; keep it out of version
+control (*.har is ignored) and delete it when done.
+
+Usage (from ytn-news-automation/):
+    # Live editor: network savings (needs the saved session)
+    python -m desktop.scripts.measure_editor_load --runs 5 --out editor_load.json
+
+    # Recording: rendering/processing only
+    python -m desktop.scripts.measure_editor_load --record editor.har
+    python -m desktop.scripts.measure_editor_load --har editor.har --runs 5 --out editor_replay.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from playwright.sync_api import sync_playwright
+
+from desktop.core.blog_poster import WRITE_URL, _Traffic
+from desktop.core.naver_session import SessionStore
+
+
+def _saved_state() -> Dict[str, Any]:
+    state = SessionStore(os.getenv("NAVER_ID", ""), os.getenv("NAVER_PW", "")).load()
+    if state is None:
+        sys.exit("no saved Naver session for NAVER_ID/NAVER_PW; post once from the app first")
+    return state
+
+
+def record(har: str, headless: bool) -> None:
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless)
+        context = browser.new_context(storage_state=_saved_state(), record_har_path=har)
+        page = context.new_page()
+        page.goto(WRITE_URL, timeout=60000)
+        page.wait_for_load_state("networkidle")
+        if "nidlogin" in page.url:
+            sys.exit("the saved session has expired; post once from the app first")
+        # The HAR is written when the context closes
+        context.close()
+        browser.close()
+    print(f"recorded {WRITE_URL} to {har}")
+
+
+def measure_once(browser, har: str, block: bool, state: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    context = browser.new_context(storage_state=state)
+    try:
+        if har:
+            context.route_from_har(har, not_found="abort")
+        # Registered after the HAR route so it sees each request first and falls back to it
+        traffic = _Traffic(context, block)
+        page = context.new_page()
+        started = time.perf_counter()
+        page.goto(WRITE_URL, timeout=60000)
+        page.wait_for_load_state("networkidle")
+        return {
+            "block": block,
+            "load_ms": round((time.perf_counter() - started) * 1000, 1),
+            "kb": round(traffic.bytes / 1024, 1),
+            "requests": traffic.requests,
+            "blocked": traffic.blocked,
+        }
+    finally:
+        context.close()
+
+
+def _median(runs: List[Dict[str, Any]], key: str) -> float:
+    return round(statistics.median(r[key] for r in runs), 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--record", default="", help="load the live editor once and save it to this HAR file")
+    parser.add_argument("--har", default="", help="replay this HAR file instead of loading the live editor")
+    parser.add_argument("--runs", type=int, default=5, help="loads per mode")
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument("--out", default="", help="write the results to this JSON file")
+    args = parser.parse_args()
+    load_dotenv(dotenv_path=os.path.join("config", ".env"), override=False)
+
+    if args.record:
+        record(args.record, not args.headed)
+        return
+
+    state = None if args.har else _saved_state()
+    runs: List[Dict[str, Any]] = []
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=not args.headed)
+        try:
+            for i in range(args.runs):
+                # Alternate so drift (cache warm-up, a slow minute) hits both modes alike
+                for block in (False, True):
+                    run = measure_once(browser, args.har, block, state)
+                    runs.append(run)
+                    print(
+                        f"run {i + 1} block={'on' if block else 'off'}: {run['load_ms']} ms, {run['kb']} KB, "
+                        f"{run['requests']} requests, {run['blocked']} blocked"
+                    )
+        finally:
+            browser.close()
+
+    summary: Dict[str, Any] = {"source": args.har or WRITE_URL, "runs": runs}
+    for block in (False, True):
+        mode = [r for r in runs if r["block"] == block]
+        key = "on" if block else "off"
+        summary[f"block_{key}"] = {
+            "median_load_ms": _median(mode, "load_ms"),
+            "median_kb": _median(mode, "kb"),
+            "median_requests": _median(mode, "requests"),
+        }
+        print(
+            f"median block={key}: {summary[f'block_{key}']['median_load_ms']} ms, "
+            f"{summary[f'block_{key}']['median_kb']} KB, {summary[f'block_{key}']['median_requests']} requests"
+        )
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Measure desktop time-to-window (and time-to-data) from process start.
+
+Launches the app N times with STARTUP_PROBE set. The app prints when its
+window has been shown and, with --until data, when the first list load has
+finished, then quits. The wall time from launch to each mark is recorded per
+run; medians are printed and, with --out, saved as JSON. --budget-ms makes
+the script exit non-zero when the median time-to-window is over budget (CI).
+
+Runs without a display when QT_QPA_PLATFORM=offscreen (the default here).
+
+Usage (from ytn-news-automation/):
+    python -m desktop.scripts.measure_startup --runs 5 --out startup.json
+    python -m desktop.scripts.measure_startup --until data --budget-ms 1500
+
+    # The frozen build instead of the source tree
+    python -m desktop.scripts.measure_startup --cmd "dist/YTNNewsApp/YTNNewsApp.exe"
+
+    # Also list which imports dominate (one extra run under python -X importtime)
+    python -m desktop.scripts.measure_startup --importtime
+"""
+import argparse
+import json
+import os
+import re
+import shlex
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)")
+
+
+def measure_once(cmd: List[str], until: str, timeout: float, importtime: bool) -> Tuple[Dict[str, Optional[float]], str]:
+    env = {**os.environ, "STARTUP_PROBE": until}
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        cmd,
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE if importtime else subprocess.DEVNULL,
+        text=True,
+    )
+    result: Dict[str, Optional[float]] = {"window_ms": None, "data_ms": None}
+    stderr: List[str] = []
+    if importtime:
+        # Drained alongside stdout so a full pipe never stalls the app
+        reader = threading.Thread(target=lambda: stderr.extend(proc.stderr), daemon=True)
+        reader.start()
+    timer = threading.Timer(timeout, proc.kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            parts = line.split()
+            if len(parts) == 3 and parts[0] == "startup" and f"{parts[1]}_ms" in result:
+                result[f"{parts[1]}_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                if parts[1] == until:
+                    break
+    finally:
+        timer.cancel()
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    if importtime:
+        reader.join(timeout=5)
+    return result, "".join(stderr)
+
+
+def _slowest_imports(stderr: str, top: int) -> List[Tuple[int, str]]:
+    rows = []
+    for line in stderr.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if m:
+            rows.append((int(m.group(2)), m.group(3).strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def _median(values: List[Optional[float]]) -> Optional[float]:
+    present = [v for v in values if v is not None]
+    return round(statistics.median(present), 1) if present else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--until", default="window", choices=("window", "data"))
+    parser.add_argument("--cmd", default="", help="app command; defaults to `python -m desktop.main`")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--budget-ms", type=float, default=0.0, help="fail when the median time-to-window exceeds this")
+    parser.add_argument("--importtime", action="store_true", help="add an unmeasured -X importtime run and list the slowest imports")
+    parser.add_argument("--out", default="", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    cmd = shlex.split(args.cmd) if args.cmd else [sys.executable, "-m", "desktop.main"]
+
+    runs = []
+    for i in range(args.runs):
+        run, _ = measure_once(cmd, args.until, args.timeout, False)
+        runs.append(run)
+        print(f"run {i + 1}: window {run['window_ms']} ms, data {run['data_ms']} ms")
+
+    summary = {
+        "cmd": " ".join(cmd),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "revision": os.getenv("GIT_COMMIT", ""),
+        "runs": runs,
+        "median_window_ms": _median([r["window_ms"] for r in runs]),
+        "median_data_ms": _median([r["data_ms"] for r in runs]),
+    }
+    print(f"median: window {summary['median_window_ms']} ms, data {summary['median_data_ms']} ms")
+    if args.importtime and not args.cmd:
+        _, stderr = measure_once([sys.executable, "-X", "importtime", "-m", "desktop.main"], "window", args.timeout, True)
+        print("slowest imports before the window (cumulative us):")
+        for us, name in _slowest_imports(stderr, 20):
+            print(f"  {us:>9}  {name}")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+    median = summary["median_window_ms"]
+    if args.budget_ms and (median is None or median > args.budget_ms):
+        print(f"time-to-window {median} ms is over the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
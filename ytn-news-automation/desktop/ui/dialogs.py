@@ -9,6 +9,8 @@ from PyQt5.QtWidgets import (
     QTextEdit,
 )
 
+from ..core.dates import format_published_at
+
 
 class NewsEditorDialog(QDialog):
     def __init__(self, parent=None, initial: Optional[Dict[str, Any]] = None) -> None:
@@ -45,7 +47,7 @@ class NewsEditorDialog(QDialog):
         if initial:
             self.title.setText(initial.get("title", ""))
             self.category.setText(initial.get("category", ""))
-            self.published_at.setText(initial.get("published_at", ""))
+            self.published_at.setText(format_published_at(initial.get("published_at")))
             self.reporter_name.setText(initial.get("reporter_name", ""))
             self.reporter_email.setText(initial.get("reporter_email", ""))
             self.source_url.setText(initial.get("source_url", ""))
@@ -62,7 +64,8 @@ class NewsEditorDialog(QDialog):
             "reporter_email": self.reporter_email.text().strip(),
             "source_url": self.source_url.text().strip(),
             "blog_url": self.blog_url.text().strip(),
-            "status": self.status.text().strip(),
+            # Left empty, the article is queued for posting like any new one
+            "status": self.status.text().strip() or "new",
             "content": self.content.toPlainText().strip(),
         }
 
@@ -121,7 +124,7 @@ class NewsViewerDialog(QDialog):
         initial = initial or {}
         self.title.setText(initial.get("title", ""))
         self.category.setText(initial.get("category", ""))
-        self.published_at.setText(initial.get("published_at", ""))
+        self.published_at.setText(format_published_at(initial.get("published_at")))
         self.reporter_name.setText(initial.get("reporter_name", ""))
         self.reporter_email.setText(initial.get("reporter_email", ""))
         self.email.setText(initial.get("email", ""))
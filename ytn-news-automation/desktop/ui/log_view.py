@@ -0,0 +1,100 @@
+import os
+from collections import deque
+from typing import Any, Deque, Dict
+
+from loguru import logger
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtWidgets import QComboBox, QHBoxLayout, QLabel, QPlainTextEdit, QVBoxLayout, QWidget
+
+from ..core.logs import COMPONENTS
+
+
+# Records kept for re-filtering, and lines the view holds at most
+LOG_VIEW_LINES = int(os.getenv("LOG_VIEW_LINES", "2000"))
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+
+class _Bridge(QObject):
+    # The loguru sink runs on whichever thread logged; the signal hops to the GUI thread
+    record = pyqtSignal(object)
+
+
+class LogView(QWidget):
+    """Recent log records with level and component filters.
+
+    Records come from a loguru sink into a ring buffer of LOG_VIEW_LINES
+    entries; the text view is capped at the same number of lines, so a long
+    session costs the same memory and append time as a short one.
+    """
+
+    def __init__(self, parent=None, max_lines: int = LOG_VIEW_LINES) -> None:
+        super().__init__(parent)
+        self.records: Deque[Dict[str, Any]] = deque(maxlen=max_lines)
+
+        self.level = QComboBox()
+        self.level.addItems(LEVELS)
+        self.level.setCurrentText("INFO")
+        self.component = QComboBox()
+        self.component.addItem("전체", "")
+        for name in COMPONENTS:
+            self.component.addItem(name, name)
+
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setMaximumBlockCount(max_lines)
+        self.text.setMinimumHeight(160)
+
+        bar = QHBoxLayout()
+        bar.addWidget(QLabel("실행 로그"))
+        bar.addStretch(1)
+        bar.addWidget(QLabel("레벨"))
+        bar.addWidget(self.level)
+        bar.addWidget(QLabel("구성요소"))
+        bar.addWidget(self.component)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addLayout(bar)
+        layout.addWidget(self.text)
+
+        self._bridge = _Bridge()
+        self._bridge.record.connect(self._append)
+        self.level.currentIndexChanged.connect(self._rerender)
+        self.component.currentIndexChanged.connect(self._rerender)
+        self._sink_id = logger.add(self._sink, level="DEBUG", format="{message}")
+
+    def close_sink(self) -> None:
+        if self._sink_id is not None:
+            logger.remove(self._sink_id)
+            self._sink_id = None
+
+    def _sink(self, message: Any) -> None:
+        record = message.record
+        self._bridge.record.emit({
+            "time": record["time"].strftime("%H:%M:%S"),
+            "level": record["level"].name,
+            "levelno": record["level"].no,
+            "component": record["extra"].get("component", "app"),
+            "message": record["message"],
+        })
+
+    def _accepts(self, rec: Dict[str, Any]) -> bool:
+        component = self.component.currentData()
+        return rec["levelno"] >= logger.level(self.level.currentText()).no and (
+            not component or rec["component"] == component
+        )
+
+    @staticmethod
+    def _format(rec: Dict[str, Any]) -> str:
+        level = "" if rec["level"] in ("INFO", "SUCCESS") else f"{rec['level']}: "
+        return f"[{rec['time']}] [{rec['component']}] {level}{rec['message']}"
+
+    def _append(self, rec: Dict[str, Any]) -> None:
+        self.records.append(rec)
+        if self._accepts(rec):
+            self.text.appendPlainText(self._format(rec))
+
+    def _rerender(self, *args: Any) -> None:
+        lines = [self._format(rec) for rec in self.records if self._accepts(rec)]
+        self.text.setPlainText("\n".join(lines))
+        self.text.moveCursor(QTextCursor.End)
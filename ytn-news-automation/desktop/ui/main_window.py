@@ -1,65 +1,120 @@
 import os
-import traceback
-from datetime import datetime
-from typing import Any, Dict, List
+import socket
+import uuid
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QApplication as QtApplication
+from PyQt5.QtCore import QObject, Qt, QThreadPool, pyqtSignal
 from PyQt5.QtWidgets import (
     QAbstractItemView,
     QHBoxLayout,
+    QHeaderView,
     QLabel,
     QLineEdit,
     QMainWindow,
     QMessageBox,
     QPushButton,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
-    QTextEdit,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from ..core.firestore_manager import FirestoreManager
-from ..core.crawler import YTNService
-from ..core.blog_poster import NaverBlogPoster
-from ..core.api_client import ApiClient
+# Services (and Playwright, BeautifulSoup, firebase_admin, gRPC, httpx behind them)
+# are imported when first used, so the window shows before any of them load
+from ..core.dates import normalize_published_at
+from ..core.logs import get_logger
 from .dialogs import NewsEditorDialog, NewsViewerDialog
+from .log_view import LogView
+from .news_model import NewsFilterProxy, NewsTableModel
+from .workers import Worker
+
+if TYPE_CHECKING:
+    from ..core.blog_poster import NaverBlogPoster
+    from ..core.crawler import YTNService
+    from ..core.data_source import DataSource
+    from ..core.firestore_manager import FirestoreManager
+
+
+# Rows fetched per list reload; the table itself copes with 100k
+NEWS_LIST_LIMIT = int(os.getenv("NEWS_LIST_LIMIT", "50"))
+# Articles leased per posting run; each lease is renewed right before its post starts
+NAVER_POST_CLAIM = int(os.getenv("NAVER_POST_CLAIM", "6"))
+
+
+class _QueueEvents(QObject):
+    # Write-queue callbacks arrive on the queue thread; signals hop to the GUI thread
+    flushed = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+
+class _PostEvents(QObject):
+    # One {"id", "blog_url"} per confirmed post, emitted from the posting task
+    posted = pyqtSignal(object)
 
 
 class MainWindow(QMainWindow):
+    # First list load finished (or failed); used by the startup probe
+    ready = pyqtSignal()
+
     def __init__(self) -> None:
         super().__init__()
         self.setWindowTitle("YTN News Automation")
         self.resize(1200, 800)
 
-        # Data
-        self.firestore = FirestoreManager()
-        self.api_client = ApiClient()
-        self.crawler = YTNService()
-        self.poster = NaverBlogPoster()
+        # Data: the REST API when API_BASE_URL is set, Firestore otherwise.
+        # Connected in the background by start(); None until then.
+        self.data: Optional["DataSource"] = None
+        # Log component for list/CRUD messages: "firestore" or "api"
+        self.data_component = "app"
+        self._firestore: Optional["FirestoreManager"] = None
+        self._crawler: Optional["YTNService"] = None
+        self._poster: Optional["NaverBlogPoster"] = None
+        self._loaded = False
+        self.queue_events = _QueueEvents()
+        self.post_events = _PostEvents()
+        # Identifies this app instance as the owner of posting leases
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+        # Background work: crawl, post and list reloads run concurrently, one of each kind
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(4)
+        self.tasks: Dict[str, Worker] = {}
+        self._reload_again = False
 
         # UI
-        self.table = QTableWidget(0, 8)
-        self.table.setHorizontalHeaderLabels([
-            "제목",
-            "본문",
-            "발행일",
-            "기자명",
-            "기자이메일",
-            "카테고리",
-            "원본URL",
-            "블로그URL",
-        ])
+        self.news_model = NewsTableModel(self)
+        # Crawler preview rows (no id) with their full text, for Read
+        self.crawled_preview: List[Dict[str, Any]] = []
+        # Filter and sort run over the loaded rows only, never a new query
+        self.news_view = NewsFilterProxy(self)
+        self.news_view.setSourceModel(self.news_model)
+        self.table = QTableView()
+        self.table.setModel(self.news_view)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
-        self.table.verticalHeader().setVisible(False)
-        
+        self.table.setWordWrap(False)
+        self.table.setTextElideMode(Qt.ElideRight)
+        # Fixed row height and column widths: the view never measures rows it doesn't show
+        rows = self.table.verticalHeader()
+        rows.setVisible(False)
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(self.table.fontMetrics().height() + 8)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        for col, width in enumerate((260, 320, 120, 80, 160, 80, 200, 200)):
+            header.resizeSection(col, width)
+        # No sort column until a header is clicked: newest first, as loaded
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        self.table.setSortingEnabled(True)
+        self.news_view.rowsInserted.connect(self._keep_scroll_on_insert)
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("검색: 제목, 기자명, 기자이메일, 카테고리")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_count = QLabel("")
 
         # Controls
-        # Removed search input and refresh button per requirements
         self.btn_crawl = QPushButton("YTN 크롤링 실행")
         self.btn_post = QPushButton("네이버 블로그 포스팅")
         self.btn_create = QPushButton("Create")
@@ -76,15 +131,16 @@ class MainWindow(QMainWindow):
         top_bar.addWidget(self.btn_update)
         top_bar.addWidget(self.btn_delete)
 
-        self.logs = QTextEdit()
-        self.logs.setReadOnly(True)
-        self.logs.setMinimumHeight(160)
+        self.logs = LogView()
 
         central = QWidget()
         layout = QVBoxLayout(central)
         layout.addLayout(top_bar)
+        filter_bar = QHBoxLayout()
+        filter_bar.addWidget(self.filter_edit, 1)
+        filter_bar.addWidget(self.filter_count)
+        layout.addLayout(filter_bar)
         layout.addWidget(self.table)
-        layout.addWidget(QLabel("실행 로그"))
         layout.addWidget(self.logs)
         self.setCentralWidget(central)
 
@@ -98,72 +154,231 @@ class MainWindow(QMainWindow):
         self.btn_update.clicked.connect(self.update_news)
         self.btn_read.clicked.connect(self.read_news)
         self.btn_delete.clicked.connect(self.delete_news)
+        self.filter_edit.textChanged.connect(self.apply_filter)
+        self.news_view.modelReset.connect(self._update_filter_count)
+        self.news_view.rowsInserted.connect(self._update_filter_count)
+        self.news_view.rowsRemoved.connect(self._update_filter_count)
+        self.queue_events.flushed.connect(self.on_queue_flushed)
+        self.queue_events.failed.connect(self.on_queue_failed)
+        # Posted articles are usually older than the loaded rows; only patch shown ones
+        self.post_events.posted.connect(lambda row: self.apply_changed([row], insert=False))
+        self._update_buttons()
+
+    def start(self) -> None:
+        """Connect the data source off the GUI thread, then load the list."""
+
+        def _connect(worker: Worker) -> "DataSource":
+            from ..core.data_source import create_data_source
+
+            data = create_data_source()
+            data.queue.on_flushed = self.queue_events.flushed.emit
+            data.queue.on_error = lambda exc: self.queue_events.failed.emit(str(exc))
+            return data
+
+        def _done(data: "DataSource") -> None:
+            self.data = data
+            self.data_component = data.name.lower()
+            self._update_buttons()
+            self.reload_news()
+
+        worker = self.run_task("connect", _connect, on_result=_done, error_title="Connection Error")
+        if worker is not None:
+            worker.signals.error.connect(lambda _: self._mark_loaded())
+
+    def _mark_loaded(self) -> None:
+        if not self._loaded:
+            self._loaded = True
+            self.ready.emit()
+
+    @property
+    def crawler(self) -> "YTNService":
+        if self._crawler is None:
+            from ..core.crawler import YTNService
 
-        self.refresh_firestore()
+            self._crawler = YTNService()
+        return self._crawler
+
+    @property
+    def poster(self) -> "NaverBlogPoster":
+        if self._poster is None:
+            from ..core.blog_poster import NaverBlogPoster
+
+            self._poster = NaverBlogPoster()
+        return self._poster
+
+    @property
+    def firestore(self) -> "FirestoreManager":
+        # Posting leases live in Firestore even when the list comes from the API
+        manager = getattr(self.data, "manager", None)
+        if manager is not None:
+            return manager
+        if self._firestore is None:
+            from ..core.firestore_manager import FirestoreManager
+
+            self._firestore = FirestoreManager()
+        return self._firestore
+
+    def closeEvent(self, event) -> None:
+        for task in self.tasks.values():
+            task.cancel()
+        # Posting stops after the current item; its lease is released when it returns
+        self.pool.waitForDone(30000)
+        # Sends what is still queued (kept on disk if that fails) and drops connections
+        if self.data is not None:
+            self.data.close()
+        self.logs.close_sink()
+        super().closeEvent(event)
 
     # Utilities
-    def log(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.logs.append(f"[{timestamp}] {message}")
-        self.logs.ensureCursorVisible()
+    def log(self, message: str, component: str = "app", level: str = "INFO") -> None:
+        get_logger(component).log(level, message)
+
+    def run_task(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+        error_title: str = "Error",
+        component: str = "app",
+    ) -> Optional[Worker]:
+        """Start `fn(worker, *args)` in the pool unless a task called `name` is running."""
+        if name in self.tasks:
+            self.log(f"이미 실행 중: {name}", component)
+            return None
+        worker = Worker(fn, *args)
+        worker.name, worker.component = name, component
+        self.tasks[name] = worker
+        if on_result is not None:
+            worker.signals.result.connect(on_result)
+        if on_progress is not None:
+            worker.signals.progress.connect(on_progress)
+        worker.signals.error.connect(lambda msg: self._on_task_error(name, error_title, msg))
+        worker.signals.cancelled.connect(lambda: self.log(f"취소됨: {name}", component))
+        worker.signals.finished.connect(lambda: self._on_task_finished(name))
+        self._update_buttons()
+        self.pool.start(worker)
+        return worker
+
+    def _on_task_error(self, name: str, title: str, message: str) -> None:
+        # The worker has logged it with the traceback
+        QMessageBox.critical(self, title, message)
+
+    def _on_task_finished(self, name: str) -> None:
+        self.tasks.pop(name, None)
+        self._update_buttons()
+        if name == "reload":
+            self._mark_loaded()
+        if name == "reload" and self._reload_again:
+            self._reload_again = False
+            self.reload_news()
 
-    def set_busy(self, busy: bool) -> None:
-        for btn in [self.btn_crawl, self.btn_post, self.btn_create, self.btn_read, self.btn_update, self.btn_delete]:
-            btn.setEnabled(not busy)
-        QtApplication.setOverrideCursor(Qt.WaitCursor if busy else Qt.ArrowCursor)
+    def _update_buttons(self) -> None:
+        # Everything but the log needs the data source
+        for button in (self.btn_crawl, self.btn_post, self.btn_create, self.btn_read, self.btn_update, self.btn_delete):
+            button.setEnabled(self.data is not None)
+        self.btn_crawl.setText("크롤링 취소" if "crawl" in self.tasks else "YTN 크롤링 실행")
+        self.btn_post.setText("포스팅 취소" if "post" in self.tasks else "네이버 블로그 포스팅")
+        busy = [n for n in self.tasks if n != "reload" and not n.startswith("rows ")]
+        if busy:
+            self.status.showMessage(f"실행 중: {', '.join(busy)}")
+        else:
+            self.status.clearMessage()
 
     # Data ops
     def refresh_news(self) -> None:
-        try:
-            self.set_busy(True)
-            self.log("크롤링 시작...")
-            items = self.crawler.fetch_latest(limit=10)
+        # Shows crawler results without saving them
+        def _crawl(worker: Worker) -> List[Dict[str, Any]]:
+            return self.crawler.fetch_latest(limit=10)
+
+        def _done(items: List[Dict[str, Any]]) -> None:
             self.populate_table_from_crawler(items)
-            self.status.showMessage(f"Loaded {len(items)} crawler items", 3000)
-            self.log(f"크롤링 완료: {len(items)}건")
-        except Exception as exc:
-            self.log(f"ERROR: Failed to load crawler data: {exc}")
-            traceback.print_exc()
-            QMessageBox.critical(self, "Error", str(exc))
-        finally:
-            self.set_busy(False)
-
-    def refresh_firestore(self) -> None:
-        try:
-            self.set_busy(True)
-            self.log("Firestore 불러오는 중...")
-            items = self.firestore.list_news(limit=50)
+            self.log(f"크롤링 완료: {len(items)}건", "crawler")
+
+        self.log("크롤링 시작...", "crawler")
+        self.run_task("crawl", _crawl, on_result=_done, component="crawler")
+
+    def reload_news(self) -> None:
+        if "reload" in self.tasks:
+            # Coalesce: one more reload once the running one is done
+            self._reload_again = True
+            return
+
+        def _load(worker: Worker) -> List[Dict[str, Any]]:
+            return self.data.list_news(limit=NEWS_LIST_LIMIT)
+
+        def _done(items: List[Dict[str, Any]]) -> None:
             self.populate_table(items)
-            self.status.showMessage(f"Loaded {len(items)} firestore items", 3000)
-            self.log(f"불러오기 완료: {len(items)}건")
-        except Exception as exc:
-            self.log(f"ERROR: Firestore 로드 실패: {exc}")
-            traceback.print_exc()
-            QMessageBox.critical(self, "Error", str(exc))
-        finally:
-            self.set_busy(False)
+            self.status.showMessage(f"Loaded {len(items)} {self.data.name} items", 3000)
+            self.log(f"불러오기 완료: {len(items)}건", self.data_component)
+
+        self.log(f"{self.data.name} 불러오는 중...", self.data_component)
+        self.run_task("reload", _load, on_result=_done, component=self.data_component)
+
+    def on_queue_flushed(self, results: List[Dict[str, Any]]) -> None:
+        missing = [r["id"] for r in results if not r.get("found", True)]
+        self.log(f"저장 완료: {len(results)}건 (대기 {self.data.pending_count()}건)", "queue")
+        if self.data.parked_count():
+            self.log(f"저장 보류 {self.data.parked_count()}건: 빨간 행, 자동 재시도", "queue", "WARNING")
+        if missing:
+            self.log(f"저장 대상 없음: {', '.join(missing)}", "queue", "ERROR")
+            self.apply_removed(missing)
+        # Creates and updates are already shown; crawl upserts only get their id now
+        stored = [r["id"] for r in results if r.get("found", True) and r.get("id")]
+        unseen = [doc_id for doc_id in stored if not self.news_model.has_id(doc_id)]
+        self.apply_changed([{"id": doc_id, "pending": False} for doc_id in stored], insert=False)
+        if unseen:
+            self.fetch_rows(unseen)
+
+    def mark_parked(self) -> None:
+        """Turn the rows whose queued writes are parked red, with the error as tooltip."""
+        parked = [
+            {"id": p["id"], "parked": p["error"] or "parked"} for p in self.data.queue.pending() if p["parked"] and p["id"]
+        ]
+        self.apply_changed(parked, insert=False)
+
+    def fetch_rows(self, doc_ids: List[str]) -> None:
+        """Load a few documents and add/refresh their rows; gone ones are removed."""
+
+        def _load(worker: Worker) -> List[Dict[str, Any]]:
+            return self.data.get_news_many(doc_ids)
+
+        def _done(items: List[Dict[str, Any]]) -> None:
+            found = {item["id"] for item in items}
+            self.apply_changed(items)
+            self.apply_removed([doc_id for doc_id in doc_ids if doc_id not in found])
+
+        self.run_task(f"rows {uuid.uuid4().hex[:6]}", _load, on_result=_done, component=self.data_component)
+
+    def apply_changed(self, items: List[Dict[str, Any]], insert: bool = True) -> None:
+        """Show changed documents; partial patches must pass insert=False."""
+        if items:
+            self.news_model.upsert_items(items, insert=insert)
+            self._reload_again = self._reload_again or "reload" in self.tasks
+
+    def apply_removed(self, doc_ids: List[str]) -> None:
+        if doc_ids:
+            self.news_model.remove_ids(doc_ids)
+            self._reload_again = self._reload_again or "reload" in self.tasks
+
+    def _keep_scroll_on_insert(self, parent, first: int, last: int) -> None:
+        # Rows added above the viewport shouldn't push the visible rows down
+        bar = self.table.verticalScrollBar()
+        if first == 0 and bar.value() > 0:
+            bar.setValue(bar.value() + last - first + 1)
+
+    def on_queue_failed(self, error: str) -> None:
+        parked = self.data.parked_count()
+        self.log(
+            f"저장 지연 (대기 {self.data.pending_count()}건, 보류 {parked}건, 재시도 예정): {error}", "queue", "WARNING"
+        )
+        if parked:
+            self.mark_parked()
 
     def populate_table(self, items: List[Dict[str, Any]]) -> None:
-        self.table.setRowCount(0)
-        for item in items:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-            values = [
-                item.get("title", ""),
-                item.get("content", ""),
-                item.get("published_at", ""),
-                item.get("reporter_name", ""),
-                item.get("reporter_email", ""),
-                item.get("category", ""),
-                item.get("source_url", ""),
-                item.get("blog_url", ""),
-            ]
-            for col, value in enumerate(values):
-                qitem = QTableWidgetItem(str(value))
-                if col == 0 and item.get("id"):
-                    qitem.setData(Qt.UserRole, item.get("id"))
-                self.table.setItem(row, col, qitem)
-        # No search filter; show all rows
+        self.crawled_preview = []
+        self.news_model.set_items(items)
 
     def populate_table_from_crawler(self, items: List[Dict[str, Any]]) -> None:
         mapped: List[Dict[str, Any]] = []
@@ -171,7 +386,7 @@ class MainWindow(QMainWindow):
             mapped.append({
                 "title": it.get("title", ""),
                 "content": it.get("content", ""),
-                "published_at": it.get("published_at", ""),
+                "published_at": it.get("published_at"),
                 "reporter_name": it.get("reporter_name", ""),
                 "reporter_email": it.get("email", ""),
                 "category": it.get("category", ""),
@@ -179,53 +394,56 @@ class MainWindow(QMainWindow):
                 "blog_url": it.get("blog_url", ""),
             })
         self.populate_table(mapped)
+        self.crawled_preview = mapped
 
+    def current_row(self) -> int:
+        """Model row of the selected table row, -1 without a selection."""
+        index = self.news_view.mapToSource(self.table.currentIndex())
+        return index.row() if index.isValid() else -1
 
     def current_selection_id(self) -> str:
-        row = self.table.currentRow()
-        if row < 0:
-            return ""
-        first_col_item = self.table.item(row, 0)
-        if not first_col_item:
-            return ""
-        doc_id = first_col_item.data(Qt.UserRole)
-        return doc_id or ""
+        return self.news_model.id_at(self.current_row())
+
+    def apply_filter(self, text: str) -> None:
+        doc_id = self.current_selection_id()
+        self.news_view.set_filter(text)
+        # The proxy resets on a new filter; keep the selected article if it still matches
+        row = self.news_model.row_of(doc_id) if doc_id else -1
+        index = self.news_view.mapFromSource(self.news_model.index(row, 0)) if row >= 0 else None
+        if index is not None and index.isValid():
+            self.table.selectRow(index.row())
+            self.table.scrollTo(index)
+
+    def _update_filter_count(self, *args: Any) -> None:
+        shown, total = self.news_view.rowCount(), self.news_model.rowCount()
+        self.filter_count.setText(f"{shown}/{total}건" if self.news_view.filter_text() else f"{total}건")
 
     def create_news(self) -> None:
         dialog = NewsEditorDialog(parent=self)
         if dialog.exec_() == dialog.Accepted:
+            # Queued locally; the write queue sends it in the background
             data = dialog.get_data()
-            try:
-                self.set_busy(True)
-                doc_id = self.firestore.create_news(data)
-                self.log(f"Created news: {doc_id}")
-                self.refresh_firestore()
-            except Exception as exc:
-                self.log(f"ERROR: Create failed: {exc}")
-                QMessageBox.critical(self, "Error", str(exc))
-            finally:
-                self.set_busy(False)
+            doc_id = self.data.create_news(data)
+            self.log(f"Created news (저장 대기): {doc_id}", self.data_component)
+            self.apply_changed([{**normalize_published_at(data), "id": doc_id, "pending": True}])
 
     def update_news(self) -> None:
         doc_id = self.current_selection_id()
         if not doc_id:
             QMessageBox.information(self, "Update", "Select a row first")
             return
-        # Load existing
-        item = self.firestore.get_news_by_id(doc_id)
-        dialog = NewsEditorDialog(parent=self, initial=item)
-        if dialog.exec_() == dialog.Accepted:
-            data = dialog.get_data()
-            try:
-                self.set_busy(True)
-                self.firestore.update_news(doc_id, data)
-                self.log(f"Updated news: {doc_id}")
-                self.refresh_firestore()
-            except Exception as exc:
-                self.log(f"ERROR: Update failed: {exc}")
-                QMessageBox.critical(self, "Error", str(exc))
-            finally:
-                self.set_busy(False)
+
+        def _edit(item: Dict[str, Any]) -> None:
+            dialog = NewsEditorDialog(parent=self, initial=item)
+            if dialog.exec_() == dialog.Accepted:
+                data = dialog.get_data()
+                self.data.update_news(doc_id, data)
+                self.log(f"Updated news (저장 대기): {doc_id}", self.data_component)
+                self.apply_changed([{**normalize_published_at(data, derive_raw=False), "id": doc_id, "pending": True}])
+
+        self.run_task(
+            f"load {doc_id}", lambda worker: self.data.get_news(doc_id), on_result=_edit, component=self.data_component
+        )
 
     def delete_news(self) -> None:
         doc_id = self.current_selection_id()
@@ -234,60 +452,57 @@ class MainWindow(QMainWindow):
             return
         if QMessageBox.question(self, "Delete", "정말 삭제하시겠습니까?") != QMessageBox.Yes:
             return
-        try:
-            self.set_busy(True)
-            self.firestore.delete_news(doc_id)
-            self.log(f"Deleted: {doc_id}")
-            self.refresh_firestore()
-        except Exception as exc:
-            self.log(f"ERROR: Delete failed: {exc}")
-            QMessageBox.critical(self, "Error", str(exc))
-        finally:
-            self.set_busy(False)
+
+        def _done(_: Any) -> None:
+            self.log(f"Deleted: {doc_id}", self.data_component)
+            self.apply_removed([doc_id])
+
+        self.run_task(
+            f"delete {doc_id}", lambda worker: self.data.delete_news(doc_id), on_result=_done, component=self.data_component
+        )
 
     def read_news(self) -> None:
         doc_id = self.current_selection_id()
         if not doc_id:
-            # Fallback: build from selected row values if no id (e.g., crawler view)
-            row = self.table.currentRow()
+            # Fallback for rows without an id (crawler preview)
+            row = self.current_row()
             if row < 0:
                 QMessageBox.information(self, "Read", "Select a row first")
                 return
-            data = {
-                "title": self.table.item(row, 0).text() if self.table.item(row, 0) else "",
-                "content": self.table.item(row, 1).text() if self.table.item(row, 1) else "",
-                "published_at": self.table.item(row, 2).text() if self.table.item(row, 2) else "",
-                "reporter_name": self.table.item(row, 3).text() if self.table.item(row, 3) else "",
-                "reporter_email": self.table.item(row, 4).text() if self.table.item(row, 4) else "",
-                "category": self.table.item(row, 5).text() if self.table.item(row, 5) else "",
-                "source_url": self.table.item(row, 6).text() if self.table.item(row, 6) else "",
-            }
+            if row < len(self.crawled_preview):
+                data = self.crawled_preview[row]
+            else:
+                data = self.news_model.row_values(row) or {}
             NewsViewerDialog(self, initial=data).exec_()
             return
 
-        try:
-            self.set_busy(True)
-            item = self.firestore.get_news_by_id(doc_id)
-            NewsViewerDialog(self, initial=item).exec_()
-        except Exception as exc:
-            self.log(f"ERROR: Read failed: {exc}")
-            QMessageBox.critical(self, "Error", str(exc))
-        finally:
-            self.set_busy(False)
+        self.run_task(
+            f"load {doc_id}",
+            lambda worker: self.data.get_news(doc_id),
+            on_result=lambda item: NewsViewerDialog(self, initial=item).exec_(),
+            component=self.data_component,
+        )
 
     def crawl_ytn_news(self) -> None:
-        try:
-            self.set_busy(True)
-            self.log("크롤링 시작...")
-            items = self.crawler.fetch_latest(limit=10)
-            self.log(f"크롤링 완료: {len(items)}건")
-            # Save directly to Firestore
-            saved = 0
+        if "crawl" in self.tasks:
+            self.tasks["crawl"].cancel()
+            self.log("크롤링 취소 요청...", "crawler")
+            return
+
+        def _crawl(worker: Worker) -> int:
+            def _progress(stage: str, done: int, total: int) -> None:
+                worker.check_cancelled()
+                worker.report(stage, done, total)
+
+            items = self.crawler.fetch_latest(limit=10, on_progress=_progress)
+            worker.check_cancelled()
+            # Queued as upserts: matched to stored articles by source_url, then title
+            batch: List[Dict[str, Any]] = []
             for it in items:
-                source_url = it.get("link") or it.get("source_url") or ""
-                data = {
+                batch.append({
                     "title": it.get("title", ""),
-                    "published_at": it.get("published_at", ""),
+                    "published_at": it.get("published_at"),
+                    "published_at_raw": it.get("published_at_raw", ""),
                     "content": it.get("content", ""),
                     "reporter_email": it.get("email", ""),
                     "reporter_name": it.get("reporter_name", ""),
@@ -295,42 +510,85 @@ class MainWindow(QMainWindow):
                     # keep legacy fields for backward compatibility
                     "email": it.get("email", ""),
                     "phone": it.get("phone", ""),
-                    "source_url": source_url,
+                    "source_url": it.get("link") or it.get("source_url") or "",
                     "status": "new",
-                }
-                if source_url:
-                    self.firestore.upsert_by_source_url(source_url, data)
-                else:
-                    self.firestore.create_news(data)
-                saved += 1
-            self.log(f"Firestore 저장 완료: {saved}건")
-            self.refresh_firestore()
-        except Exception as exc:
-            self.log(f"ERROR: 크롤링 실패: {exc}")
-            traceback.print_exc()
-            QMessageBox.critical(self, "Crawling Error", str(exc))
-        finally:
-            self.set_busy(False)
+                })
+            return self.data.save_crawled(batch)
+
+        def _progress(stage: str, done: int, total: int) -> None:
+            if stage == "details":
+                self.status.showMessage(f"크롤링 중... {done}/{total}")
+
+        self.log("크롤링 시작...", "crawler")
+        self.run_task(
+            "crawl",
+            _crawl,
+            on_result=lambda saved: self.log(f"크롤링 완료, 저장 대기열에 추가: {saved}건", "crawler"),
+            on_progress=_progress,
+            error_title="Crawling Error",
+            component="crawler",
+        )
 
     def post_to_naver(self) -> None:
-        try:
-            self.set_busy(True)
-            self.log("네이버 블로그 포스팅 시작...")
-            # Pick up to 3 items not posted yet
-            items = [n for n in self.firestore.list_news(limit=50) if n.get("status") != "posted"][:3]
-            results = self.poster.post_batch(items)
-            # Update Firestore
-            for doc_id, blog_url in results.items():
-                self.firestore.update_news(doc_id, {"blog_url": blog_url, "status": "posted"})
-            self.log(f"포스팅 완료: {len(results)}건")
-            self.refresh_firestore()
-        except Exception as exc:
-            self.log(f"ERROR: 포스팅 실패: {exc}")
-            traceback.print_exc()
-            QMessageBox.critical(self, "Posting Error", str(exc))
-        finally:
-            self.set_busy(False)
-
-    # Search filtering removed per requirements
+        if "post" in self.tasks:
+            self.tasks["post"].cancel()
+            self.log("포스팅 취소 요청: 현재 글까지 마치고 멈춥니다", "poster")
+            return
+
+        def _post(worker: Worker) -> Dict[str, int]:
+            # Queued crawl results must be stored before they can be claimed
+            self.data.queue.flush()
+            # Posts confirmed before the app last stopped, but never marked posted
+            for entry in self.poster.unrecorded():
+                self.firestore.complete_post(entry["id"], self.worker_id, entry["blog_url"])
+                self.poster.recorded(entry["id"])
+                self.post_events.posted.emit({"id": entry["id"], "blog_url": entry["blog_url"]})
+            # Lease pending items so other posters skip them
+            items = self.firestore.claim_pending(self.worker_id, limit=NAVER_POST_CLAIM)
+            counts = {"claimed": len(items), "posted": 0, "failed": 0}
+            if not items:
+                return counts
+            worker.report("claimed", 0, len(items))
+            settled = set()
+            try:
+                # Results arrive as each page finishes, in completion order
+                for result in self.poster.post_items(
+                    items,
+                    should_stop=worker.is_cancelled,
+                    before_post=lambda it: self.firestore.renew_lease(it["id"], self.worker_id),
+                ):
+                    doc_id = result["id"]
+                    if result["blog_url"]:
+                        self.firestore.complete_post(doc_id, self.worker_id, result["blog_url"])
+                        self.poster.recorded(doc_id)
+                        self.post_events.posted.emit({"id": doc_id, "blog_url": result["blog_url"]})
+                        counts["posted"] += 1
+                    else:
+                        # Cancelled, or held until an earlier publish is confirmed: the claim
+                        # shouldn't use up one of its attempts
+                        tried = result["attempted"]
+                        self.firestore.release_lease(doc_id, self.worker_id, error=result["error"], count_attempt=tried)
+                        if tried:
+                            counts["failed"] += 1
+                    settled.add(doc_id)
+                    worker.report("posted", len(settled), len(items))
+            except Exception as exc:
+                for it in items:
+                    if it["id"] not in settled:
+                        self.firestore.release_lease(it["id"], self.worker_id, error=str(exc))
+                raise
+            return counts
 
+        def _progress(stage: str, done: int, total: int) -> None:
+            self.status.showMessage(f"포스팅 중... {done}/{total}")
+
+        def _done(counts: Dict[str, int]) -> None:
+            if not counts["claimed"]:
+                self.log("포스팅 대상 없음", "poster")
+                return
+            self.log(f"포스팅 완료: {counts['posted']}건, 실패 {counts['failed']}건", "poster")
 
+        self.log("네이버 블로그 포스팅 시작...", "poster")
+        self.run_task(
+            "post", _post, on_result=_done, on_progress=_progress, error_title="Posting Error", component="poster"
+        )
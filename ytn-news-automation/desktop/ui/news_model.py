@@ -0,0 +1,435 @@
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from PyQt5.QtCore import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor
+
+from ..core.dates import KST, format_published_at
+from ..core.hangul import search_key
+
+
+# (header, field) per column; "content" shows a preview
+COLUMNS = [
+    ("제목", "title"),
+    ("본문", "content"),
+    ("발행일", "published_at"),
+    ("기자명", "reporter_name"),
+    ("기자이메일", "reporter_email"),
+    ("카테고리", "category"),
+    ("원본URL", "source_url"),
+    ("블로그URL", "blog_url"),
+]
+FIELDS = [field for _, field in COLUMNS]
+PREVIEW_COLUMN = FIELDS.index("content")
+PUBLISHED_COLUMN = FIELDS.index("published_at")
+# Body text kept per row; the full article is loaded when a row is opened
+PREVIEW_DISPLAY_CHARS = 80
+# Few distinct values, so rows share one string object each
+_INTERNED = {"reporter_name", "reporter_email", "category"}
+# What the filter bar matches; the body preview is left out to keep a scan of 50k rows short
+SEARCH_COLUMNS = [FIELDS.index(f) for f in ("title", "reporter_name", "reporter_email", "category")]
+
+_PENDING_BRUSH = QBrush(QColor("#888888"))
+_PARKED_BRUSH = QBrush(QColor("#c62828"))
+
+
+def _preview(item: Dict[str, Any]) -> str:
+    text = item.get("content_preview") or item.get("content") or ""
+    if len(text) > PREVIEW_DISPLAY_CHARS:
+        return text[:PREVIEW_DISPLAY_CHARS] + "…"
+    return text
+
+
+def _cell(item: Dict[str, Any], field: str) -> Any:
+    if field == "content":
+        return _preview(item)
+    value = item.get(field)
+    if field == "published_at":
+        # Formatted when painted; only visible rows pay for it
+        if isinstance(value, datetime) and value.tzinfo is None:
+            return value.replace(tzinfo=KST)
+        return value
+    text = "" if value is None else str(value)
+    return sys.intern(text) if field in _INTERNED else text
+
+
+def _timestamp(value: Any) -> float:
+    return value.timestamp() if isinstance(value, datetime) else float("-inf")
+
+
+class NewsTableModel(QAbstractTableModel):
+    """News rows for a QTableView, kept column by column.
+
+    Each column is one Python list of short strings (body text cut to a
+    preview), plus the document id per row, so 100k rows stay cheap to load
+    and hold. Cells are only formatted when the view asks for them.
+
+    After the first load, rows change through `upsert_items`/`remove_ids`,
+    keyed by document id, so views keep their selection and scroll position.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._ids: List[str] = []
+        self._cols: List[List[Any]] = [[] for _ in COLUMNS]
+        self._pending: set = set()
+        # id -> error of a queued write the backend keeps rejecting
+        self._parked: Dict[str, str] = {}
+        # Normalized text per row for the filter bar (see hangul.search_key)
+        self._search: List[str] = []
+        # id -> position counted from the last row, so inserting at the top leaves it valid
+        self._from_end: Dict[str, int] = {}
+
+    # Qt model API
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            value = self._cols[col][row]
+            if col == PUBLISHED_COLUMN:
+                return format_published_at(value)
+            if col == PREVIEW_COLUMN:
+                return value.replace("\n", " ")
+            return value
+        if role == Qt.UserRole:
+            return self._ids[row]
+        if role == Qt.ForegroundRole and self._ids[row] in self._parked:
+            return _PARKED_BRUSH
+        if role == Qt.ForegroundRole and self._ids[row] in self._pending:
+            # Queued locally, not stored yet
+            return _PENDING_BRUSH
+        if role == Qt.ToolTipRole and self._ids[row] in self._parked:
+            return f"저장 보류 (자동 재시도): {self._parked[self._ids[row]]}"
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section][0]
+        return None
+
+    # Rows
+    def set_items(self, items: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._ids = [item.get("id") or "" for item in items]
+        self._cols = [[_cell(item, field) for item in items] for field in FIELDS]
+        self._pending = {item["id"] for item in items if item.get("pending") and item.get("id")}
+        self._parked = {item["id"]: item["parked"] for item in items if item.get("parked") and item.get("id")}
+        self._search = [self._search_key(row) for row in range(len(self._ids))]
+        self._reindex()
+        self.endResetModel()
+
+    def upsert_items(self, items: List[Dict[str, Any]], insert: bool = True) -> None:
+        """Update rows in place by id; unknown ids are inserted at the top.
+
+        Only the fields present in an item are changed. With `insert=False`
+        unknown ids are skipped, so a partial patch such as {"id", "pending": False}
+        or {"id", "blog_url"} never adds a row holding just those fields.
+        """
+        new: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            doc_id = item.get("id")
+            if not doc_id:
+                continue
+            row = self.row_of(doc_id)
+            if row < 0 and not insert:
+                continue
+            if "pending" in item:
+                if item["pending"]:
+                    self._pending.add(doc_id)
+                else:
+                    self._pending.discard(doc_id)
+                    self._parked.pop(doc_id, None)
+            if "parked" in item:
+                if item["parked"]:
+                    self._parked[doc_id] = item["parked"]
+                else:
+                    self._parked.pop(doc_id, None)
+            if row < 0:
+                new[doc_id] = {**new.get(doc_id, {}), **item}
+                continue
+            for col, field in enumerate(FIELDS):
+                if field in item or (field == "content" and "content_preview" in item):
+                    self._cols[col][row] = _cell(item, field)
+            self._search[row] = self._search_key(row)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(COLUMNS) - 1))
+        if new:
+            # Newest first, like a reload
+            added = list(reversed(new.values()))
+            self.beginInsertRows(QModelIndex(), 0, len(added) - 1)
+            self._ids[0:0] = [item["id"] for item in added]
+            for col, field in enumerate(FIELDS):
+                self._cols[col][0:0] = [_cell(item, field) for item in added]
+            self._search[0:0] = [self._search_key(row) for row in range(len(added))]
+            total = len(self._ids)
+            for row, item in enumerate(added):
+                self._from_end[item["id"]] = total - 1 - row
+            self.endInsertRows()
+
+    def remove_ids(self, doc_ids: Iterable[str]) -> None:
+        doc_ids = set(doc_ids)
+        rows = sorted((self.row_of(i) for i in doc_ids if i in self._from_end), reverse=True)
+        for row in rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._from_end[self._ids[row]]
+            # Only the rows above move closer to the end
+            for above in self._ids[:row]:
+                if above:
+                    self._from_end[above] -= 1
+            del self._ids[row]
+            del self._search[row]
+            for column in self._cols:
+                del column[row]
+            self.endRemoveRows()
+        self._pending.difference_update(doc_ids)
+        for doc_id in doc_ids:
+            self._parked.pop(doc_id, None)
+
+    def _search_key(self, row: int) -> str:
+        return search_key(" ".join(self._cols[col][row] for col in SEARCH_COLUMNS))
+
+    def search_keys(self) -> List[str]:
+        """Normalized search text per row; read-only for callers."""
+        return self._search
+
+    def sort_key(self, column: int) -> Callable[[int], Any]:
+        """row -> comparable value for sorting on `column`."""
+        values = self._cols[column]
+        if column == PUBLISHED_COLUMN:
+            return lambda row: _timestamp(values[row])
+        return values.__getitem__
+
+    def _reindex(self) -> None:
+        last = len(self._ids) - 1
+        self._from_end = {doc_id: last - row for row, doc_id in enumerate(self._ids) if doc_id}
+
+    def row_of(self, doc_id: str) -> int:
+        """Row of `doc_id`, -1 if it isn't shown."""
+        pos = self._from_end.get(doc_id)
+        return -1 if pos is None else len(self._ids) - 1 - pos
+
+    def has_id(self, doc_id: str) -> bool:
+        return doc_id in self._from_end
+
+    def id_at(self, row: int) -> str:
+        if 0 <= row < len(self._ids):
+            return self._ids[row]
+        return ""
+
+    def row_values(self, row: int) -> Optional[Dict[str, Any]]:
+        """The stored cells of `row` by field name (body as its preview)."""
+        if not 0 <= row < len(self._ids):
+            return None
+        return {field: self._cols[col][row] for col, field in enumerate(FIELDS)}
+
+
+class NewsFilterProxy(QAbstractProxyModel):
+    """Filter and sort over a NewsTableModel without per-row callbacks.
+
+    QSortFilterProxyModel calls filterAcceptsRow/lessThan once per row, and from
+    Python that is far too slow for 50k rows per keystroke. Here the visible rows
+    are one list of source rows: a query is a substring scan over the source's
+    precomputed search keys (narrowing the previous result while the query only
+    grows), and a sort is one list sort over a column's keys. Source inserts,
+    removals and edits are forwarded row by row, so selections survive them.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._query = ""
+        self._sort_column = -1
+        self._descending = False
+        # All source rows in sort order, and the ones passing the filter in the same order
+        self._order: List[int] = []
+        self._rows: List[int] = []
+        # source row -> proxy row (-1 when filtered out); rebuilt when needed
+        self._proxy_of: Optional[List[int]] = None
+
+    def setSourceModel(self, model: NewsTableModel) -> None:
+        super().setSourceModel(model)
+        model.modelReset.connect(self._on_reset)
+        model.rowsInserted.connect(self._on_inserted)
+        model.rowsAboutToBeRemoved.connect(self._on_about_to_be_removed)
+        model.rowsRemoved.connect(self._on_removed)
+        model.dataChanged.connect(self._on_data_changed)
+        self._on_reset()
+
+    # Qt proxy API
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if parent.isValid() or not (0 <= row < len(self._rows) and 0 <= column < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: Optional[QModelIndex] = None):
+        if index is None:
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def mapToSource(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid() or index.row() >= len(self._rows):
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[index.row()], index.column())
+
+    def mapFromSource(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        proxy_of = self._proxy_rows()
+        row = proxy_of[index.row()] if index.row() < len(proxy_of) else -1
+        return self.index(row, index.column()) if row >= 0 else QModelIndex()
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        # Not mapped through a row, so headers stay when nothing matches
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        """Sort on `column`; -1 restores the source order (newest first)."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.mapToSource(index) for index in persistent]
+        self._sort_column = column
+        self._descending = column >= 0 and order == Qt.DescendingOrder
+        key = self._key()
+        self._order.sort(key=key, reverse=self._descending)
+        if self._query:
+            self._rows.sort(key=key, reverse=self._descending)
+        else:
+            self._rows = list(self._order)
+        self._proxy_of = None
+        self.changePersistentIndexList(persistent, [self.mapFromSource(index) for index in sources])
+        self.layoutChanged.emit()
+
+    # Filter
+    def set_filter(self, text: str) -> None:
+        query = search_key(text.strip())
+        if query == self._query:
+            return
+        # A longer query can only match a subset of what the shorter one matched
+        candidates = self._rows if self._query in query else self._order
+        self.beginResetModel()
+        self._query = query
+        self._rows = self._filtered(candidates)
+        self._proxy_of = None
+        self.endResetModel()
+
+    def filter_text(self) -> str:
+        return self._query
+
+    def _filtered(self, rows: List[int]) -> List[int]:
+        if not self._query:
+            return list(rows)
+        query, keys = self._query, self.sourceModel().search_keys()
+        return [row for row in rows if query in keys[row]]
+
+    def _matches(self, row: int) -> bool:
+        return not self._query or self._query in self.sourceModel().search_keys()[row]
+
+    # Ordering
+    def _key(self) -> Callable[[int], Any]:
+        if self._sort_column < 0:
+            return int
+        return self.sourceModel().sort_key(self._sort_column)
+
+    def _position(self, rows: List[int], row: int, key: Callable[[int], Any]) -> int:
+        # bisect_right over `rows` in the current sort order
+        value = key(row)
+        lo, hi = 0, len(rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = key(rows[mid])
+            if (value > other) if self._descending else (value < other):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _in_place(self, pos: int, key: Callable[[int], Any]) -> bool:
+        value = key(self._rows[pos])
+        before = key(self._rows[pos - 1]) if pos > 0 else None
+        after = key(self._rows[pos + 1]) if pos + 1 < len(self._rows) else None
+        if self._descending:
+            return (before is None or before >= value) and (after is None or value >= after)
+        return (before is None or before <= value) and (after is None or value <= after)
+
+    def _proxy_rows(self) -> List[int]:
+        if self._proxy_of is None:
+            proxy_of = [-1] * self.sourceModel().rowCount()
+            for pos, row in enumerate(self._rows):
+                proxy_of[row] = pos
+            self._proxy_of = proxy_of
+        return self._proxy_of
+
+    def _insert_visible(self, row: int, key: Callable[[int], Any]) -> None:
+        pos = self._position(self._rows, row, key)
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._rows.insert(pos, row)
+        self._proxy_of = None
+        self.endInsertRows()
+
+    def _remove_visible(self, pos: int) -> None:
+        self.beginRemoveRows(QModelIndex(), pos, pos)
+        del self._rows[pos]
+        self._proxy_of = None
+        self.endRemoveRows()
+
+    # Source changes
+    def _on_reset(self) -> None:
+        self.beginResetModel()
+        self._order = list(range(self.sourceModel().rowCount()))
+        if self._sort_column >= 0:
+            self._order.sort(key=self._key(), reverse=self._descending)
+        self._rows = self._filtered(self._order)
+        self._proxy_of = None
+        self.endResetModel()
+
+    def _on_inserted(self, parent: QModelIndex, first: int, last: int) -> None:
+        count = last - first + 1
+        self._order = [r + count if r >= first else r for r in self._order]
+        self._rows = [r + count if r >= first else r for r in self._rows]
+        self._proxy_of = None
+        key = self._key()
+        for row in range(first, last + 1):
+            self._order.insert(self._position(self._order, row, key), row)
+            if self._matches(row):
+                self._insert_visible(row, key)
+
+    def _on_about_to_be_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        proxy_of = self._proxy_rows()
+        for pos in sorted((proxy_of[r] for r in range(first, last + 1) if proxy_of[r] >= 0), reverse=True):
+            self._remove_visible(pos)
+        self._order = [r for r in self._order if not first <= r <= last]
+
+    def _on_removed(self, parent: QModelIndex, first: int, last: int) -> None:
+        count = last - first + 1
+        self._order = [r - count if r > last else r for r in self._order]
+        self._rows = [r - count if r > last else r for r in self._rows]
+        self._proxy_of = None
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles: Any = None) -> None:
+        key = self._key()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            if self._sort_column >= 0:
+                self._order.remove(row)
+                self._order.insert(self._position(self._order, row, key), row)
+            pos = self._proxy_rows()[row]
+            visible = self._matches(row)
+            if pos >= 0:
+                if visible and self._in_place(pos, key):
+                    self.dataChanged.emit(self.index(pos, 0), self.index(pos, self.columnCount() - 1))
+                    continue
+                # Now sorts elsewhere or no longer matches the filter
+                self._remove_visible(pos)
+            if visible:
+                self._insert_visible(row, key)
@@ -0,0 +1,68 @@
+import threading
+from typing import Any, Callable
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from ..core.logs import get_logger
+
+
+class Cancelled(Exception):
+    """Raised inside a task when its worker was cancelled."""
+
+
+class WorkerSignals(QObject):
+    # Emitted from the pool thread; slots on GUI objects run on the GUI thread
+    progress = pyqtSignal(str, int, int)  # stage, done, total
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+
+class Worker(QRunnable):
+    """Run `fn(worker, *args, **kwargs)` on a QThreadPool thread.
+
+    `fn` reports with `worker.report(stage, done, total)` and should call
+    `worker.check_cancelled()` between steps; `cancel()` can be called from any
+    thread. Exactly one of result/error/cancelled is emitted, then finished.
+    """
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancel = threading.Event()
+        # Used in log records; MainWindow.run_task sets both
+        self.name = getattr(fn, "__name__", "task")
+        self.component = "app"
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def check_cancelled(self) -> None:
+        if self._cancel.is_set():
+            raise Cancelled()
+
+    def report(self, stage: str, done: int = 0, total: int = 0) -> None:
+        self.signals.progress.emit(stage, done, total)
+
+    def run(self) -> None:
+        try:
+            result = self.fn(self, *self.args, **self.kwargs)
+        except Cancelled:
+            self.signals.cancelled.emit()
+        except Exception as exc:
+            get_logger(self.component).opt(exception=exc).error(f"{self.name} 실패: {exc}")
+            self.signals.error.emit(str(exc) or type(exc).__name__)
+        else:
+            if self._cancel.is_set():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
@@ -1,66 +1,266 @@
+import asyncio
+import json
 import os
-from typing import Any, Dict, List
+import threading
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
-from .services.firestore_service import FirestoreService
-from .models.news import NewsCreate, NewsUpdate, NewsOut
+from .models.crawl import CrawlJobOut, CrawlRequest
+from .models.news import NewsBatchIn, NewsBatchOut, NewsCreate, NewsOut, NewsUpdate
+from .models.stats import StatsOut
+from .services.doc_cache import DocCache
+from .services.http_cache import GZipUnlessStreaming, etag_middleware
+from .services.metrics import metrics_middleware, render_metrics
 
 
 load_dotenv()
 
-app = FastAPI(title="YTN News API", version="0.1.0")
+STREAM_KEEPALIVE_SECONDS = 15
+WARMUP_ATTEMPTS = 5
+
+# The backend (for Firestore, with its gRPC/google-auth imports) is built on first use or by the
+# warm-up thread, so the server accepts traffic as soon as uvicorn is up.
+_db = None
+_feed = None
+_crawl_jobs = None
+_services_lock = threading.Lock()
+_ready = threading.Event()
+_warmup_error: Optional[str] = None
+
+# Hot single documents; write endpoints (and the change feed, when running) invalidate
+doc_cache = DocCache()
+
+
+def get_db():
+    global _db
+    if _db is None:
+        with _services_lock:
+            if _db is None:
+                from .services.backend import create_backend
+
+                # NEWS_BACKEND=firestore (default) | memory | sqlite
+                _db = create_backend()
+    return _db
+
+
+def get_feed():
+    global _feed
+    if _feed is None:
+        db = get_db()
+        with _services_lock:
+            if _feed is None:
+                from .services.change_feed import ChangeFeed
+
+                _feed = ChangeFeed(db)
+                _feed.on_change = doc_cache.invalidate
+    return _feed
+
+
+def get_crawl_jobs():
+    global _crawl_jobs
+    if _crawl_jobs is None:
+        db = get_db()
+        with _services_lock:
+            if _crawl_jobs is None:
+                from .services.crawl_jobs import CrawlJobs
+
+                _crawl_jobs = CrawlJobs(db)
+    return _crawl_jobs
+
+
+def _warm_up() -> None:
+    global _warmup_error
+    for attempt in range(WARMUP_ATTEMPTS):
+        try:
+            get_db().warm_up()
+            _warmup_error = None
+            _ready.set()
+            return
+        except Exception as exc:
+            _warmup_error = f"{type(exc).__name__}: {exc}"
+            time.sleep(min(2 ** attempt, 10))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    threading.Thread(target=_warm_up, name="firestore-warmup", daemon=True).start()
+    yield
+    if _feed is not None:
+        _feed.stop()
+    if _crawl_jobs is not None:
+        _crawl_jobs.shutdown()
+
+
+app = FastAPI(title="YTN News API", version="0.1.0", lifespan=lifespan)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-db = FirestoreService()
+app.middleware("http")(etag_middleware)
+app.add_middleware(GZipUnlessStreaming, minimum_size=1024)
+# Added last so it is outermost and times the whole stack
+app.middleware("http")(metrics_middleware)
 
 
 @app.get("/health")
 def health() -> Dict[str, str]:
+    # Liveness only: never touches Firestore
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def ready():
+    if _ready.is_set():
+        return {"status": "ready"}
+    body = {"status": "starting"}
+    if _warmup_error:
+        body["error"] = _warmup_error
+    return JSONResponse(status_code=503, content=body)
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
+@app.get("/stats", response_model=StatsOut)
+def get_stats(days: int = Query(7, ge=1, le=31), db=Depends(get_db)) -> Dict[str, Any]:
+    return db.get_stats(days=days)
+
+
+@app.post("/crawl", response_model=CrawlJobOut, status_code=202)
+def start_crawl(payload: Optional[CrawlRequest] = None, jobs=Depends(get_crawl_jobs)) -> Dict[str, Any]:
+    """Start a YTN crawl in the background; poll `GET /crawl/{job_id}` for progress."""
+    from .services.crawl_jobs import CrawlBusy, CrawlerUnavailable
+
+    try:
+        return jobs.submit(limit=(payload or CrawlRequest()).limit)
+    except CrawlBusy as exc:
+        raise HTTPException(status_code=409, detail={"message": "crawl already running", "job_id": exc.job_id})
+    except CrawlerUnavailable as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+
+@app.get("/crawl/{job_id}", response_model=CrawlJobOut)
+def get_crawl(job_id: str, jobs=Depends(get_crawl_jobs)) -> Dict[str, Any]:
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Not found")
+    return job
+
+
 @app.get("/news", response_model=List[NewsOut])
-def list_news() -> List[Dict[str, Any]]:
-    return db.list_news(limit=200)
+def list_news(
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    category: Optional[str] = None,
+    limit: int = Query(200, ge=1, le=500),
+    db=Depends(get_db),
+) -> List[Dict[str, Any]]:
+    return db.list_news(limit=limit, since=since, until=until, category=category)
+
+
+def _sse(event: Dict[str, Any]) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'], ensure_ascii=False)}\n\n"
+
+
+@app.get("/news/stream")
+async def stream_news(
+    request: Request,
+    last_event_id: Optional[str] = Header(None),
+) -> StreamingResponse:
+    """Server-Sent Events: `created`/`updated` carry the summary document, `deleted`
+    carries only the id, `reset` means the client must re-read `GET /news`.
+    Resume with the `Last-Event-ID` header or `?last_event_id=`.
+    """
+    feed = await run_in_threadpool(get_feed)
+    await run_in_threadpool(feed.start)
+    queue, backlog = feed.subscribe(last_event_id or request.query_params.get("last_event_id"))
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            for event in backlog:
+                yield _sse(event)
+            while not await request.is_disconnected():
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse(event)
+        finally:
+            feed.unsubscribe(queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.post("/news", response_model=NewsOut)
-def create_news(payload: NewsCreate) -> Dict[str, Any]:
+def create_news(payload: NewsCreate, db=Depends(get_db)) -> Dict[str, Any]:
     return db.create_news(payload.model_dump(exclude_none=True))
 
 
+@app.post("/news/batch", response_model=NewsBatchOut)
+def batch_news(payload: NewsBatchIn, db=Depends(get_db)) -> Dict[str, Any]:
+    """Apply queued writes in one round trip; results follow the order of `ops`."""
+    for op in payload.ops:
+        if op.op == "update" and not op.id:
+            raise HTTPException(status_code=422, detail="update ops need an id")
+        if op.id and "/" in op.id:
+            raise HTTPException(status_code=422, detail="ids must not contain '/'")
+    results: List[Dict[str, Any]] = [{} for _ in payload.ops]
+    upserts = [i for i, op in enumerate(payload.ops) if op.op == "upsert"]
+    if upserts:
+        saved = db.bulk_upsert([payload.ops[i].data.model_dump(exclude_none=True) for i in upserts])
+        for i, doc_id in zip(upserts, saved["ids"]):
+            results[i] = {"op": "upsert", "id": doc_id}
+            doc_cache.invalidate(doc_id)
+    for i, op in enumerate(payload.ops):
+        data = op.data.model_dump(exclude_none=True)
+        if op.op == "create":
+            results[i] = {"op": "create", "id": db.create_news(data, doc_id=op.id)["id"]}
+        elif op.op == "update":
+            found = bool(db.update_news(op.id, data))
+            doc_cache.invalidate(op.id)
+            results[i] = {"op": "update", "id": op.id, "found": found}
+    return {"results": results}
+
+
 @app.get("/news/{doc_id}", response_model=NewsOut)
-def get_news(doc_id: str) -> Dict[str, Any]:
-    item = db.get_news_by_id(doc_id)
+def get_news(doc_id: str, db=Depends(get_db)) -> Dict[str, Any]:
+    item = doc_cache.get(doc_id, lambda: db.get_news_by_id(doc_id))
     if not item:
         raise HTTPException(status_code=404, detail="Not found")
     return item
 
 
 @app.put("/news/{doc_id}", response_model=NewsOut)
-def update_news(doc_id: str, payload: NewsUpdate) -> Dict[str, Any]:
+def update_news(doc_id: str, payload: NewsUpdate, db=Depends(get_db)) -> Dict[str, Any]:
     item = db.update_news(doc_id, payload.model_dump(exclude_none=True))
+    doc_cache.invalidate(doc_id)
     if not item:
         raise HTTPException(status_code=404, detail="Not found")
     return item
 
 
 @app.delete("/news/{doc_id}")
-def delete_news(doc_id: str) -> Dict[str, str]:
+def delete_news(doc_id: str, db=Depends(get_db)) -> Dict[str, str]:
     db.delete_news(doc_id)
+    doc_cache.invalidate(doc_id)
     return {"status": "deleted"}
-
-
-
-
-
-
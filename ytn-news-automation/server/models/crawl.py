@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CrawlRequest(BaseModel):
+    limit: int = Field(10, ge=1, le=50)
+
+
+class CrawlProgress(BaseModel):
+    stage: str = ""
+    done: int = 0
+    total: int = 0
+
+
+class CrawlResult(BaseModel):
+    fetched: int = 0
+    created: int = 0
+    updated: int = 0
+    doc_ids: List[str] = []
+
+
+class CrawlJobOut(BaseModel):
+    id: str
+    status: str
+    limit: int = 10
+    progress: CrawlProgress = CrawlProgress()
+    result: Optional[CrawlResult] = None
+    error: str = ""
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
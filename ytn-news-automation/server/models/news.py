@@ -1,13 +1,14 @@
-from typing import Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl
 
 
 class NewsBase(BaseModel):
     title: Optional[str] = None
     content: Optional[str] = None
     published_at: Optional[str] = None
+    published_at_raw: Optional[str] = None
     reporter_name: Optional[str] = None
     reporter_email: Optional[str] = None
     category: Optional[str] = None
@@ -26,10 +27,33 @@ class NewsUpdate(NewsBase):
 
 class NewsOut(NewsBase):
     id: str
+    # Stored as a timestamp; the original YTN text is kept in published_at_raw
+    published_at: Optional[datetime] = None
+    published_at_raw: Optional[str] = None
+    # List responses carry only the preview; `content` is filled by GET /news/{id}
+    content_preview: Optional[str] = None
+    content_length: Optional[int] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 
+class NewsBatchOp(BaseModel):
+    # create: `id` optional, client-chosen ids make replays no-ops
+    # update: `id` required; upsert: matched by source_url, then title
+    op: Literal["create", "update", "upsert"]
+    id: Optional[str] = None
+    data: NewsCreate = NewsCreate()
 
 
+class NewsBatchIn(BaseModel):
+    ops: List[NewsBatchOp] = Field(default_factory=list, max_length=500)
 
+
+class NewsBatchResult(BaseModel):
+    op: str
+    id: Optional[str] = None
+    found: bool = True
+
+
+class NewsBatchOut(BaseModel):
+    results: List[NewsBatchResult] = []
@@ -0,0 +1,19 @@
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class DailyStats(BaseModel):
+    date: str
+    total: int = 0
+    category: Dict[str, int] = {}
+    reporter: Dict[str, int] = {}
+
+
+class StatsOut(BaseModel):
+    total: int = 0
+    status: Dict[str, int] = {}
+    category: Dict[str, int] = {}
+    category_status: Dict[str, Dict[str, int]] = {}
+    reporter: Dict[str, int] = {}
+    daily: List[DailyStats] = []
@@ -0,0 +1,67 @@
+"""Convert stored published_at strings into timestamps, keeping the text in published_at_raw.
+
+Usage (from ytn-news-automation/):
+    python -m server.scripts.backfill_published_at --dry-run
+    python -m server.scripts.backfill_published_at
+
+Safe to re-run: documents whose published_at is already a timestamp are skipped.
+"""
+import argparse
+
+from dotenv import load_dotenv
+from google.cloud import firestore
+
+from desktop.core.dates import parse_published_at
+
+from ..services.firestore_service import FirestoreService
+
+
+PAGE_SIZE = 400
+
+
+def backfill(service: FirestoreService, dry_run: bool = False) -> int:
+    col = service._col()
+    changed = 0
+    unparsed = 0
+    last = None
+    while True:
+        query = col.order_by(firestore.FieldPath.document_id()).limit(PAGE_SIZE)
+        if last is not None:
+            query = query.start_after(last)
+        snaps = list(query.stream())
+        if not snaps:
+            break
+        batch = service.client.batch()
+        pending = 0
+        for snap in snaps:
+            value = (snap.to_dict() or {}).get("published_at")
+            if not isinstance(value, str):
+                continue
+            parsed = parse_published_at(value)
+            if parsed is None and value.strip():
+                unparsed += 1
+                print(f"  {snap.id}: could not parse {value!r}")
+            batch.update(snap.reference, {"published_at": parsed, "published_at_raw": value})
+            pending += 1
+        if pending and not dry_run:
+            batch.commit()
+        changed += pending
+        last = snaps[-1]
+    print(f"unparseable dates: {unparsed}")
+    return changed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    parser.add_argument("--collection", default=None, help="defaults to FIRESTORE_COLLECTION or 'news'")
+    args = parser.parse_args()
+
+    load_dotenv()
+    service = FirestoreService(collection_name=args.collection)
+    total = backfill(service, dry_run=args.dry_run)
+    print(f"done: {total} documents {'to update' if args.dry_run else 'updated'}")
+
+
+if __name__ == "__main__":
+    main()
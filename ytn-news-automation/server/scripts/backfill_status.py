@@ -0,0 +1,66 @@
+"""Set status "new" on news documents whose status is missing or blank.
+
+The posting queue only claims "new" articles. Documents created from the
+editor dialog with an empty status field, or saved before statuses existed,
+were never posted; this queues them like any new article and moves their
+count in the news_stats counters from "(none)" to "new".
+
+Usage (from ytn-news-automation/):
+    python -m server.scripts.backfill_status --dry-run
+    python -m server.scripts.backfill_status
+
+Safe to re-run: documents with a status are skipped.
+"""
+import argparse
+
+from dotenv import load_dotenv
+from google.cloud import firestore
+
+from ..services.firestore_service import FirestoreService
+
+
+PAGE_SIZE = 150  # up to three writes per document (summary and two counter shards)
+
+
+def backfill(service: FirestoreService, dry_run: bool = False) -> int:
+    col = service._col()
+    changed = 0
+    last = None
+    while True:
+        query = col.order_by(firestore.FieldPath.document_id()).limit(PAGE_SIZE)
+        if last is not None:
+            query = query.start_after(last)
+        snaps = list(query.stream())
+        if not snaps:
+            break
+        batch = service.client.batch()
+        pending = 0
+        for snap in snaps:
+            data = snap.to_dict() or {}
+            if str(data.get("status") or "").strip():
+                continue
+            print(f"  {snap.id}: {data.get('title', '')!r}")
+            batch.update(snap.reference, {"status": "new", "updated_at": firestore.SERVER_TIMESTAMP})
+            service.counters.apply(batch, data, {**data, "status": "new"})
+            pending += 1
+        if pending and not dry_run:
+            batch.commit()
+        changed += pending
+        last = snaps[-1]
+    return changed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    parser.add_argument("--collection", default=None, help="defaults to FIRESTORE_COLLECTION or 'news'")
+    args = parser.parse_args()
+
+    load_dotenv()
+    service = FirestoreService(collection_name=args.collection)
+    total = backfill(service, dry_run=args.dry_run)
+    print(f"done: {total} documents {'to update' if args.dry_run else 'updated'}")
+
+
+if __name__ == "__main__":
+    main()
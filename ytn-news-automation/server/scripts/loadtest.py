@@ -0,0 +1,286 @@
+"""Load-test the API with mixed list/get/create/update/delete traffic.
+
+Reports requests/s and p50/p95/p99 latency per endpoint and, with --out, saves
+them as JSON; --baseline compares against an earlier result file.
+
+Runs against `server.main:app` in-process (httpx ASGI transport, no network),
+under a local uvicorn (--uvicorn) or against any running server (--url). The
+in-process and uvicorn modes use NEWS_BACKEND=memory unless --backend says
+otherwise, so no Firestore project is needed.
+
+Usage (from ytn-news-automation/, after `pip install -r server/requirements-dev.txt`):
+    python -m server.scripts.loadtest --duration 20 --concurrency 32 --out after.json
+    python -m server.scripts.loadtest --uvicorn --backend sqlite --baseline before.json
+    python -m server.scripts.loadtest --url https://<service-url> --mix list=80,get=20
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+
+OPS = ("list", "get", "create", "update", "delete")
+LABELS = {
+    "list": "GET /news",
+    "get": "GET /news/{id}",
+    "create": "POST /news",
+    "update": "PUT /news/{id}",
+    "delete": "DELETE /news/{id}",
+}
+CATEGORIES = ("정치", "경제", "사회", "국제", "문화")
+DEFAULT_MIX = "list=40,get=35,create=10,update=10,delete=5"
+
+
+def parse_mix(text: str) -> Dict[str, int]:
+    mix: Dict[str, int] = {}
+    for part in text.split(","):
+        op, _, weight = part.partition("=")
+        op = op.strip()
+        if op not in OPS:
+            raise SystemExit(f"unknown op in --mix: {op!r} (expected one of {', '.join(OPS)})")
+        mix[op] = int(weight or 1)
+    return mix
+
+
+def _article(rng: random.Random, content_chars: int) -> Dict[str, Any]:
+    published = datetime.now(timezone.utc) - timedelta(minutes=rng.randrange(60 * 24 * 7))
+    return {
+        "title": f"부하 테스트 기사 {uuid.uuid4().hex[:8]}",
+        "content": ("가나다라마바사 아자차카타파하 " * (content_chars // 16 + 1))[:content_chars],
+        "published_at": published.isoformat(),
+        "reporter_name": rng.choice(("홍길동", "김철수", "이영희")),
+        "category": rng.choice(CATEGORIES),
+        "source_url": f"https://example.com/loadtest/{uuid.uuid4().hex}",
+        "status": "new",
+    }
+
+
+class Runner:
+    def __init__(self, client: httpx.AsyncClient, mix: Dict[str, int], content_chars: int, seed: int) -> None:
+        self.client = client
+        self.ops = list(mix)
+        self.weights = [mix[op] for op in self.ops]
+        self.content_chars = content_chars
+        self.rng = random.Random(seed)
+        self.ids: List[str] = []
+        self.samples: Dict[str, List[float]] = {op: [] for op in OPS}
+        self.errors: Dict[str, int] = {op: 0 for op in OPS}
+        self.recording = False
+
+    async def seed(self, n: int) -> None:
+        for _ in range(n):
+            r = await self.client.post("/news", json=_article(self.rng, self.content_chars))
+            r.raise_for_status()
+            self.ids.append(r.json()["id"])
+
+    async def _request(self, op: str) -> Tuple[str, httpx.Response, float]:
+        if op in ("get", "update", "delete") and not self.ids:
+            op = "create"
+        started = time.perf_counter()
+        if op == "list":
+            params: Dict[str, Any] = {"limit": 50}
+            if self.rng.random() < 0.25:
+                params["category"] = self.rng.choice(CATEGORIES)
+            r = await self.client.get("/news", params=params)
+        elif op == "get":
+            r = await self.client.get(f"/news/{self.rng.choice(self.ids)}")
+        elif op == "create":
+            r = await self.client.post("/news", json=_article(self.rng, self.content_chars))
+            if r.status_code == 200:
+                self.ids.append(r.json()["id"])
+        elif op == "update":
+            body = {"status": self.rng.choice(("new", "posted", "failed")), "title": f"수정 {uuid.uuid4().hex[:6]}"}
+            r = await self.client.put(f"/news/{self.rng.choice(self.ids)}", json=body)
+        else:
+            doc_id = self.ids.pop(self.rng.randrange(len(self.ids)))
+            r = await self.client.delete(f"/news/{doc_id}")
+        return op, r, time.perf_counter() - started
+
+    async def worker(self, deadline: float) -> None:
+        while time.perf_counter() < deadline:
+            op = self.rng.choices(self.ops, self.weights)[0]
+            try:
+                op, r, elapsed = await self._request(op)
+                failed = r.status_code >= 400
+            except httpx.HTTPError:
+                elapsed, failed = 0.0, True
+            if not self.recording:
+                continue
+            if failed:
+                self.errors[op] += 1
+            else:
+                self.samples[op].append(elapsed)
+
+    async def run(self, concurrency: int, warmup: float, duration: float) -> float:
+        deadline = time.perf_counter() + warmup + duration
+        tasks = [asyncio.create_task(self.worker(deadline)) for _ in range(concurrency)]
+        await asyncio.sleep(warmup)
+        self.recording = True
+        started = time.perf_counter()
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - started
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    # Nearest-rank, in milliseconds
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return round(sorted_values[rank - 1] * 1000, 2)
+
+
+def summarize(samples: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    out: Dict[str, Any] = {
+        "requests": len(samples),
+        "errors": errors,
+        "rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+    }
+    if samples:
+        values = sorted(samples)
+        out.update({
+            "p50_ms": _percentile(values, 50),
+            "p95_ms": _percentile(values, 95),
+            "p99_ms": _percentile(values, 99),
+            "mean_ms": round(statistics.fmean(values) * 1000, 2),
+            "max_ms": round(values[-1] * 1000, 2),
+        })
+    return out
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_uvicorn(backend: str) -> Tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = {**os.environ, "NEWS_BACKEND": backend}
+    cmd = [sys.executable, "-m", "uvicorn", "server.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"]
+    proc = subprocess.Popen(cmd, env=env)
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit("uvicorn exited during startup")
+        try:
+            if httpx.get(base_url + "/health", timeout=1).status_code == 200:
+                return proc, base_url
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+    proc.terminate()
+    raise SystemExit("uvicorn did not answer /health within 30s")
+
+
+def _git_revision() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+        return out.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+async def _run(args: argparse.Namespace, mix: Dict[str, int]) -> Tuple[Runner, float, str]:
+    proc = None
+    if args.url:
+        mode, base_url, transport = "url", args.url.rstrip("/"), None
+    elif args.uvicorn:
+        proc, base_url = _start_uvicorn(args.backend)
+        mode, transport = "uvicorn", None
+    else:
+        os.environ["NEWS_BACKEND"] = args.backend
+        from server.main import app
+
+        mode, base_url, transport = "in-process", "http://loadtest", httpx.ASGITransport(app=app)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=base_url, transport=transport, limits=limits, timeout=30) as client:
+            runner = Runner(client, mix, args.content_chars, args.seed)
+            await runner.seed(args.seed_docs)
+            elapsed = await runner.run(args.concurrency, args.warmup, args.duration)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait(timeout=10)
+    return runner, elapsed, mode
+
+
+def _print_report(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    print(f"{'endpoint':<22}{'req':>8}{'err':>6}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    rows = list(result["endpoints"].items()) + [("total", result["total"])]
+    for label, s in rows:
+        line = (
+            f"{label:<22}{s['requests']:>8}{s['errors']:>6}{s['rps']:>9}"
+            f"{s.get('p50_ms', '-'):>9}{s.get('p95_ms', '-'):>9}{s.get('p99_ms', '-'):>9}"
+        )
+        base = (baseline or {}).get("endpoints", {}).get(label) if label != "total" else (baseline or {}).get("total")
+        if base and base.get("p95_ms") and s.get("p95_ms"):
+            change = (s["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100
+            line += f"   p95 {change:+.1f}% vs baseline"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="memory", choices=("memory", "sqlite", "firestore"))
+    parser.add_argument("--uvicorn", action="store_true", help="run the app under a local uvicorn instead of in-process")
+    parser.add_argument("--url", default="", help="load an already running server instead")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before the measurement")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"op weights (default {DEFAULT_MIX})")
+    parser.add_argument("--seed-docs", type=int, default=200, help="articles created before the run")
+    parser.add_argument("--content-chars", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default="", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default="", help="earlier --out file to compare p95 against")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    runner, elapsed, mode = asyncio.run(_run(args, mix))
+
+    all_samples = [v for op in OPS for v in runner.samples[op]]
+    result = {
+        "meta": {
+            "mode": mode,
+            "backend": "" if args.url else args.backend,
+            "url": args.url,
+            "concurrency": args.concurrency,
+            "duration_s": round(elapsed, 2),
+            "mix": mix,
+            "seed_docs": args.seed_docs,
+            "content_chars": args.content_chars,
+            "revision": os.getenv("GIT_COMMIT") or _git_revision(),
+            "python": sys.version.split()[0],
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "total": summarize(all_samples, sum(runner.errors.values()), elapsed),
+        "endpoints": {
+            LABELS[op]: summarize(runner.samples[op], runner.errors[op], elapsed)
+            for op in OPS
+            if op in mix
+        },
+    }
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print_report(result, baseline)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
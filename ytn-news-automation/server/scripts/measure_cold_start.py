@@ -0,0 +1,117 @@
+"""Measure time-to-first-response of the API from process start.
+
+Starts the server N times and records, per run, how long it takes until
+`/health` first answers 200 and until `/ready` does (Firestore warmed up).
+The median over the runs is printed and, with --out, saved as JSON so that
+two revisions can be compared.
+
+Usage (from ytn-news-automation/):
+    python -m server.scripts.measure_cold_start --runs 5 --out cold_start.json
+
+    # Against the container image instead of a local uvicorn
+    python -m server.scripts.measure_cold_start \\
+        --cmd "docker run --rm -p 8080:8080 -e FIREBASE_PROJECT_ID=... ytn-news-api" \\
+        --base-url http://127.0.0.1:8080
+
+    # Baseline without a /ready endpoint
+    python -m server.scripts.measure_cold_start --ready-path ""
+"""
+import argparse
+import json
+import os
+import shlex
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _ok(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as r:
+            return r.status == 200
+    except (urllib.error.URLError, ConnectionError, OSError):
+        return False
+
+
+def measure_once(cmd: List[str], base_url: str, ready_path: str, timeout: float) -> Dict[str, Optional[float]]:
+    started = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    result: Dict[str, Optional[float]] = {"health_ms": None, "ready_ms": None}
+    try:
+        deadline = started + timeout
+        while time.perf_counter() < deadline and proc.poll() is None:
+            elapsed = (time.perf_counter() - started) * 1000
+            if result["health_ms"] is None and _ok(base_url + "/health"):
+                result["health_ms"] = round(elapsed, 1)
+            if result["health_ms"] is not None:
+                if not ready_path:
+                    break
+                if _ok(base_url + ready_path):
+                    result["ready_ms"] = round((time.perf_counter() - started) * 1000, 1)
+                    break
+            time.sleep(0.01)
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    return result
+
+
+def _median(values: List[Optional[float]]) -> Optional[float]:
+    present = [v for v in values if v is not None]
+    return round(statistics.median(present), 1) if present else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cmd", default="", help="server command; defaults to a local uvicorn on a free port")
+    parser.add_argument("--base-url", default="")
+    parser.add_argument("--ready-path", default="/ready", help="empty to skip the readiness probe")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--out", default="", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    if args.cmd:
+        cmd = shlex.split(args.cmd)
+        base_url = args.base_url or "http://127.0.0.1:8080"
+    else:
+        port = _free_port()
+        cmd = [sys.executable, "-m", "uvicorn", "server.main:app", "--host", "127.0.0.1", "--port", str(port)]
+        base_url = args.base_url or f"http://127.0.0.1:{port}"
+
+    runs = []
+    for i in range(args.runs):
+        run = measure_once(cmd, base_url.rstrip("/"), args.ready_path, args.timeout)
+        runs.append(run)
+        print(f"run {i + 1}: health {run['health_ms']} ms, ready {run['ready_ms']} ms")
+
+    summary = {
+        "cmd": " ".join(cmd),
+        "python": sys.version.split()[0],
+        "revision": os.getenv("GIT_COMMIT", ""),
+        "runs": runs,
+        "median_health_ms": _median([r["health_ms"] for r in runs]),
+        "median_ready_ms": _median([r["ready_ms"] for r in runs]),
+    }
+    print(f"median: health {summary['median_health_ms']} ms, ready {summary['median_ready_ms']} ms")
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
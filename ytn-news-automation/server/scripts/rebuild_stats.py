@@ -0,0 +1,78 @@
+"""Recompute the news_stats counters from a full scan of the news collection.
+
+Usage (from ytn-news-automation/):
+    python -m server.scripts.rebuild_stats --dry-run
+    python -m server.scripts.rebuild_stats
+
+Run once after enabling the counters, or to repair drift. Writes that happen
+while the scan runs are not reflected, so run it while crawling/posting is idle.
+"""
+import argparse
+from typing import Any, Dict
+
+from dotenv import load_dotenv
+
+from desktop.core.stats import TOTALS, Delta, contributions
+
+from ..services.firestore_service import FirestoreService
+
+
+def scan(service: FirestoreService) -> Delta:
+    totals: Delta = {}
+    for snap in service._col().stream():
+        for counter, paths in contributions(snap.to_dict() or {}).items():
+            bucket = totals.setdefault(counter, {})
+            for path, n in paths.items():
+                bucket[path] = bucket.get(path, 0) + n
+    return totals
+
+
+def _nested(paths) -> Dict[str, Any]:
+    out: Dict[str, Any] = {}
+    for path, n in paths.items():
+        node = out
+        for part in path[:-1]:
+            node = node.setdefault(part, {})
+        node[path[-1]] = n
+    return out
+
+
+def write(service: FirestoreService, totals: Delta) -> None:
+    counters = service.counters
+    stats_col = service.client.collection(counters.collection_name)
+    stale = {ref.id for ref in stats_col.list_documents()} - set(totals)
+    batch = service.client.batch()
+    ops = 0
+    for counter in list(totals) + sorted(stale):
+        for shard in range(counters.shards):
+            ref = counters._shard_ref(counter, shard)
+            if shard == 0 and counter in totals:
+                batch.set(ref, _nested(totals[counter]))
+            else:
+                batch.delete(ref)
+            ops += 1
+            if ops >= 400:
+                batch.commit()
+                batch = service.client.batch()
+                ops = 0
+    if ops:
+        batch.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="print the totals without writing")
+    args = parser.parse_args()
+
+    load_dotenv()
+    service = FirestoreService()
+    totals = scan(service)
+    overall = totals.get(TOTALS, {}).get(("total",), 0)
+    print(f"{overall} documents, {len(totals)} counter documents")
+    if not args.dry_run:
+        write(service, totals)
+        print("counters rewritten")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Move inline article bodies into the news/{id}/body/content subdocument.
+
+Usage (from ytn-news-automation/):
+    python -m server.scripts.split_news_body --dry-run
+    python -m server.scripts.split_news_body
+
+Safe to re-run: documents that no longer carry an inline `content` field are skipped.
+"""
+import argparse
+
+from dotenv import load_dotenv
+from google.cloud import firestore
+
+from desktop.core.news_doc import split_content
+
+from ..services.firestore_service import FirestoreService
+
+
+PAGE_SIZE = 200  # two writes per document keeps each batch under Firestore's 500 limit
+
+
+def migrate(service: FirestoreService, dry_run: bool = False) -> int:
+    col = service._col()
+    moved = 0
+    last = None
+    while True:
+        query = col.order_by(firestore.FieldPath.document_id()).limit(PAGE_SIZE)
+        if last is not None:
+            query = query.start_after(last)
+        snaps = list(query.stream())
+        if not snaps:
+            break
+        batch = service.client.batch()
+        pending = 0
+        for snap in snaps:
+            data = snap.to_dict() or {}
+            if "content" not in data:
+                continue
+            summary, body = split_content({"content": data["content"]})
+            summary["content"] = firestore.DELETE_FIELD
+            batch.set(service._body_ref(snap.id), body)
+            batch.update(snap.reference, summary)
+            pending += 1
+        if pending and not dry_run:
+            batch.commit()
+        moved += pending
+        print(f"scanned {len(snaps)} docs, {'would move' if dry_run else 'moved'} {pending} bodies")
+        last = snaps[-1]
+    return moved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report what would change without writing")
+    parser.add_argument("--collection", default=None, help="defaults to FIRESTORE_COLLECTION or 'news'")
+    args = parser.parse_args()
+
+    load_dotenv()
+    service = FirestoreService(collection_name=args.collection)
+    total = migrate(service, dry_run=args.dry_run)
+    print(f"done: {total} documents {'to migrate' if args.dry_run else 'migrated'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import os
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Protocol
+
+
+# (kind, doc_id, summary) with kind "created" | "updated" | "deleted"; summary is None for deletes
+ChangeCallback = Callable[[str, str, Optional[Dict[str, Any]]], None]
+
+
+class Subscription(Protocol):
+    def unsubscribe(self) -> None: ...
+
+
+class NewsBackend(Protocol):
+    """Storage used by the API. FirestoreService is the production implementation;
+    the memory and SQLite backends serve local runs and load tests.
+    """
+
+    def warm_up(self) -> None: ...
+
+    def list_news(
+        self,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]: ...
+
+    def get_news_by_id(self, doc_id: str) -> Dict[str, Any]: ...
+
+    def create_news(self, data: Dict[str, Any], doc_id: Optional[str] = None) -> Dict[str, Any]:
+        """With `doc_id` given, creating an existing id returns it unchanged."""
+        ...
+
+    def update_news(self, doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]: ...
+
+    def delete_news(self, doc_id: str) -> None: ...
+
+    def bulk_upsert(self, items: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Returns the `created` and `updated` ids, and `ids` in input order."""
+        ...
+
+    def get_stats(self, days: int = 7) -> Dict[str, Any]: ...
+
+    def watch(self, callback: ChangeCallback) -> Subscription:
+        """Call `callback` for every later change to the news collection."""
+        ...
+
+
+class LocalWatchers:
+    """Change fan-out for backends whose writes all go through this process."""
+
+    def __init__(self) -> None:
+        self._callbacks: List[ChangeCallback] = []
+        self._lock = threading.Lock()
+
+    def add(self, callback: ChangeCallback) -> Subscription:
+        with self._lock:
+            self._callbacks.append(callback)
+        return _LocalSubscription(self, callback)
+
+    def remove(self, callback: ChangeCallback) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def emit(self, kind: str, doc_id: str, summary: Optional[Dict[str, Any]]) -> None:
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(kind, doc_id, None if summary is None else dict(summary))
+
+
+class _LocalSubscription:
+    def __init__(self, watchers: LocalWatchers, callback: ChangeCallback) -> None:
+        self._watchers = watchers
+        self._callback = callback
+
+    def unsubscribe(self) -> None:
+        self._watchers.remove(self._callback)
+
+
+def create_backend(name: Optional[str] = None) -> NewsBackend:
+    """Build the backend named by NEWS_BACKEND: firestore (default), memory or sqlite."""
+    name = (name or os.getenv("NEWS_BACKEND") or "firestore").strip().lower()
+    if name == "firestore":
+        from .firestore_service import FirestoreService
+
+        return FirestoreService()
+    if name == "memory":
+        from .memory_backend import MemoryBackend
+
+        return MemoryBackend()
+    if name == "sqlite":
+        from .sqlite_backend import SQLiteBackend
+
+        return SQLiteBackend()
+    raise ValueError(f"unknown NEWS_BACKEND: {name!r} (expected firestore, memory or sqlite)")
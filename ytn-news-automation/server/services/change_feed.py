@@ -0,0 +1,108 @@
+import asyncio
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from fastapi.encoders import jsonable_encoder
+
+
+STREAM_HISTORY = int(os.getenv("STREAM_HISTORY", "1000"))
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "256"))
+
+
+class ChangeFeed:
+    """Fan out one backend listener on the news collection to any number of subscribers.
+
+    Event ids look like "{epoch}-{seq}". A subscriber reconnecting with the last id it
+    saw gets the missed events replayed from an in-memory history; if the id belongs to
+    another instance (or fell out of the history) it receives a `reset` event instead and
+    should re-read `GET /news`.
+    """
+
+    def __init__(self, service, history: int = STREAM_HISTORY, queue_size: int = STREAM_QUEUE_SIZE) -> None:
+        self.service = service
+        self.queue_size = queue_size
+        self._epoch = format(int(time.time() * 1000), "x")
+        self._seq = itertools.count(1)
+        self._last_seq = 0
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=history)
+        self._subscribers: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = set()
+        self._lock = threading.Lock()
+        self._watch = None
+        # Called with each changed document id, e.g. to invalidate caches
+        self.on_change: Optional[Callable[[str], None]] = None
+
+    def start(self) -> None:
+        """Attach the listener on first use."""
+        with self._lock:
+            if self._watch is None:
+                self._watch = self.service.watch(self._on_change)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._watch is not None:
+                self._watch.unsubscribe()
+                self._watch = None
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Tuple[asyncio.Queue, List[Dict[str, Any]]]:
+        """Register the calling event loop; returns its queue and the events to replay first."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        with self._lock:
+            self._subscribers.add((asyncio.get_running_loop(), queue))
+            return queue, self._backlog(last_event_id)
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        with self._lock:
+            self._subscribers = {s for s in self._subscribers if s[1] is not queue}
+
+    def _current_id(self) -> str:
+        return f"{self._epoch}-{self._last_seq}"
+
+    def _backlog(self, last_event_id: Optional[str]) -> List[Dict[str, Any]]:
+        if not last_event_id:
+            return []
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self._epoch or not seq.isdigit():
+            return [self._reset_event()]
+        seq_no = int(seq)
+        oldest = self._history[0]["seq"] if self._history else self._last_seq + 1
+        if seq_no < oldest - 1:
+            return [self._reset_event()]
+        return [e for e in self._history if e["seq"] > seq_no]
+
+    def _reset_event(self) -> Dict[str, Any]:
+        return {"id": self._current_id(), "type": "reset", "data": {}}
+
+    def _on_change(self, kind: str, doc_id: str, summary: Optional[Dict[str, Any]]) -> None:
+        # Runs on the backend's watch thread (or the writing thread for local backends)
+        if self.on_change is not None:
+            self.on_change(doc_id)
+        data: Dict[str, Any] = {"id": doc_id}
+        if summary is not None:
+            data = jsonable_encoder({**summary, "id": doc_id})
+        self._publish(kind, data)
+
+    def _publish(self, kind: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            seq = next(self._seq)
+            self._last_seq = seq
+            event = {"id": f"{self._epoch}-{seq}", "seq": seq, "type": kind, "data": data}
+            self._history.append(event)
+            for loop, queue in list(self._subscribers):
+                try:
+                    loop.call_soon_threadsafe(self._deliver, queue, event)
+                except RuntimeError:
+                    # Loop already closed; the subscriber is gone
+                    self._subscribers.discard((loop, queue))
+
+    def _deliver(self, queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop what it has not read and tell it to resync
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(self._reset_event())
@@ -0,0 +1,188 @@
+import importlib.util
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from google.cloud import firestore
+
+
+CRAWL_JOBS_COLLECTION = os.getenv("CRAWL_JOBS_COLLECTION", "crawl_jobs")
+# How long a crawl may go without progress; also how long a lost worker blocks new crawls
+CRAWL_JOB_TIMEOUT = int(os.getenv("CRAWL_JOB_TIMEOUT", "600"))
+
+
+class CrawlBusy(Exception):
+    def __init__(self, job_id: str) -> None:
+        super().__init__(f"crawl {job_id} is already running")
+        self.job_id = job_id
+
+
+class CrawlerUnavailable(RuntimeError):
+    pass
+
+
+class CrawlLeaseLost(RuntimeError):
+    pass
+
+
+def crawler_available() -> bool:
+    # The crawler dependencies are optional in the API image (build arg WITH_CRAWLER=1)
+    return all(importlib.util.find_spec(m) is not None for m in ("playwright", "bs4", "requests"))
+
+
+def _to_news(it: Dict[str, Any]) -> Dict[str, Any]:
+    # Same mapping as the desktop app's crawl_ytn_news
+    return {
+        "title": it.get("title", ""),
+        "published_at": it.get("published_at"),
+        "published_at_raw": it.get("published_at_raw", ""),
+        "content": it.get("content", ""),
+        "reporter_email": it.get("email", ""),
+        "reporter_name": it.get("reporter_name", ""),
+        "category": it.get("category", ""),
+        "email": it.get("email", ""),
+        "phone": it.get("phone", ""),
+        "source_url": it.get("link") or it.get("source_url") or "",
+        "status": "new",
+    }
+
+
+class CrawlJobs:
+    """Run YTN crawls on a background worker and track them in Firestore.
+
+    A lease document (crawl_locks/ytn) admits one crawl at a time across all
+    server instances; each instance runs it on a single worker thread. Every
+    progress update extends the lease, and a crawl that finds it gone stops.
+    """
+
+    def __init__(self, service) -> None:
+        self.service = service
+        # Job state and the lease need Firestore; other backends can't crawl
+        self.client = getattr(service, "client", None)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crawl")
+
+    def _jobs(self):
+        return self.client.collection(CRAWL_JOBS_COLLECTION)
+
+    def _lock_ref(self):
+        return self.client.collection("crawl_locks").document("ytn")
+
+    def submit(self, limit: int) -> Dict[str, Any]:
+        """Queue a crawl. Raises CrawlBusy while another crawl holds the lease."""
+        if self.client is None or not crawler_available():
+            raise CrawlerUnavailable("crawling needs the Firestore backend and the crawler dependencies")
+        job_ref = self._jobs().document()
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=CRAWL_JOB_TIMEOUT)
+        job = {
+            "status": "queued",
+            "limit": limit,
+            "created_at": now,
+            "expires_at": expires_at,
+            "started_at": None,
+            "finished_at": None,
+            "progress": {"stage": "queued", "done": 0, "total": limit},
+            "result": None,
+            "error": "",
+        }
+
+        @firestore.transactional
+        def _acquire(transaction) -> Optional[str]:
+            lock = self._lock_ref().get(transaction=transaction).to_dict() or {}
+            expires = lock.get("expires_at")
+            if lock.get("job_id") and expires and expires > now:
+                return lock["job_id"]
+            transaction.set(self._lock_ref(), {"job_id": job_ref.id, "expires_at": expires_at})
+            transaction.set(job_ref, job)
+            return None
+
+        running = _acquire(self.client.transaction())
+        if running:
+            raise CrawlBusy(running)
+        self._executor.submit(self._run, job_ref.id, limit)
+        return {**job, "id": job_ref.id}
+
+    def get(self, job_id: str) -> Dict[str, Any]:
+        if self.client is None:
+            return {}
+        data = self._jobs().document(job_id).get().to_dict() or {}
+        if not data:
+            return {}
+        expires_at = data.get("expires_at")
+        if expires_at is None and data.get("created_at"):
+            # Jobs queued before leases were renewed
+            expires_at = data["created_at"] + timedelta(seconds=CRAWL_JOB_TIMEOUT)
+        if data.get("status") in ("queued", "running") and expires_at:
+            if expires_at < datetime.now(timezone.utc):
+                # The instance running it went away; its lease has expired as well
+                data["status"] = "failed"
+                data["error"] = data.get("error") or "timed out"
+        data["id"] = job_id
+        return data
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: str, limit: int) -> None:
+        ref = self._jobs().document(job_id)
+        try:
+            ref.update({
+                "status": "running",
+                "started_at": firestore.SERVER_TIMESTAMP,
+                "progress": {"stage": "links", "done": 0, "total": limit},
+            })
+            from desktop.core.crawler import YTNService
+
+            def on_progress(stage: str, done: int, total: int) -> None:
+                # Raising here ends fetch_latest, so nothing is saved without the lease
+                self._renew(job_id, {"stage": stage, "done": done, "total": total})
+
+            items = YTNService().fetch_latest(limit=limit, on_progress=on_progress)
+            on_progress("saving", 0, len(items))
+            saved = self.service.bulk_upsert([_to_news(it) for it in items])
+            ref.update({
+                "status": "succeeded",
+                "finished_at": firestore.SERVER_TIMESTAMP,
+                "progress": {"stage": "done", "done": len(items), "total": len(items)},
+                "result": {
+                    "fetched": len(items),
+                    "created": len(saved["created"]),
+                    "updated": len(saved["updated"]),
+                    "doc_ids": saved["created"] + saved["updated"],
+                },
+            })
+        except Exception as exc:
+            ref.update({
+                "status": "failed",
+                "finished_at": firestore.SERVER_TIMESTAMP,
+                "error": f"{type(exc).__name__}: {exc}",
+            })
+        finally:
+            self._release(job_id)
+
+    def _renew(self, job_id: str, progress: Dict[str, Any]) -> None:
+        """Extend the lease and record progress; raises CrawlLeaseLost if another crawl holds it."""
+        ref = self._jobs().document(job_id)
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=CRAWL_JOB_TIMEOUT)
+
+        @firestore.transactional
+        def _extend(transaction) -> bool:
+            lock = self._lock_ref().get(transaction=transaction).to_dict() or {}
+            if lock.get("job_id") != job_id:
+                return False
+            transaction.update(self._lock_ref(), {"expires_at": expires_at})
+            transaction.update(ref, {"progress": progress, "expires_at": expires_at})
+            return True
+
+        if not _extend(self.client.transaction()):
+            raise CrawlLeaseLost(f"crawl {job_id} lost its lease")
+
+    def _release(self, job_id: str) -> None:
+        @firestore.transactional
+        def _unlock(transaction) -> None:
+            lock = self._lock_ref().get(transaction=transaction).to_dict() or {}
+            if lock.get("job_id") == job_id:
+                transaction.delete(self._lock_ref())
+
+        _unlock(self.client.transaction())
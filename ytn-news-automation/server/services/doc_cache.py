@@ -0,0 +1,86 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Set, Tuple
+
+from .metrics import DOC_CACHE_ENTRIES, DOC_CACHE_REQUESTS
+
+
+DOC_CACHE_SIZE = int(os.getenv("DOC_CACHE_SIZE", "1000"))
+DOC_CACHE_TTL = float(os.getenv("DOC_CACHE_TTL", "5"))
+
+
+class DocCache:
+    """Size-bounded LRU with a short TTL for single documents.
+
+    Concurrent misses for the same key are coalesced: the first caller loads,
+    the others wait for its result, so at most one load per key is in flight.
+    `invalidate` also detaches an in-flight load, so a read racing a write
+    can't put the pre-write document back into the cache.
+    """
+
+    def __init__(self, maxsize: int = DOC_CACHE_SIZE, ttl: float = DOC_CACHE_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._stale: Set[int] = set()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                DOC_CACHE_REQUESTS.labels("hit").inc()
+                return entry[1]
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[key] = future
+                DOC_CACHE_REQUESTS.labels("miss").inc()
+            else:
+                DOC_CACHE_REQUESTS.labels("coalesced").inc()
+
+        if not leader:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as exc:
+            with self._lock:
+                self._finish(key, future)
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            fresh = self._finish(key, future)
+            # Misses ({}) are not cached so a newly created id is visible at once
+            if fresh and value:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            DOC_CACHE_ENTRIES.set(len(self._entries))
+        future.set_result(value)
+        return value
+
+    def _finish(self, key: str, future: Future) -> bool:
+        """Drop the in-flight marker; False if the load was invalidated meanwhile."""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if id(future) in self._stale:
+            self._stale.discard(id(future))
+            return False
+        return True
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            future = self._inflight.pop(key, None)
+            if future is not None:
+                self._stale.add(id(future))
+            DOC_CACHE_ENTRIES.set(len(self._entries))
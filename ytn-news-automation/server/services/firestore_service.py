@@ -1,88 +1,286 @@
 import os
+import threading
+from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+# google-cloud-firestore directly (not firebase_admin): same API, far fewer
+# modules to import on a cold start
+from google.api_core.exceptions import AlreadyExists
+from google.cloud import firestore
+from google.oauth2 import service_account
+
+from desktop.core.dates import KST, normalize_published_at
+from desktop.core.news_doc import BODY_COLLECTION, BODY_DOC_ID, as_summary, normalize_status, split_content
+from desktop.core.stats import NewsCounters
+
+from .backend import ChangeCallback
+from .metrics import firestore_op
+
+
+_CHANGE_TYPES = {"ADDED": "created", "MODIFIED": "updated", "REMOVED": "deleted"}
+
+_client: Optional[firestore.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> firestore.Client:
+	"""Process-wide client: credential discovery and channel setup happen once."""
+	global _client
+	with _client_lock:
+		if _client is None:
+			_client = _build_client()
+	return _client
+
+
+def _client_from_file(path: str, project_id: Optional[str]) -> firestore.Client:
+	cred = service_account.Credentials.from_service_account_file(path)
+	return firestore.Client(project=project_id or cred.project_id, credentials=cred)
+
+
+def _build_client() -> firestore.Client:
+	project_id = os.getenv("FIREBASE_PROJECT_ID") or None
+	cred_path_env = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+	root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+	# Prefer explicitly provided file if present and exists
+	if cred_path_env:
+		abs_path = cred_path_env if os.path.isabs(cred_path_env) else os.path.join(root, cred_path_env)
+		if os.path.exists(abs_path):
+			return _client_from_file(abs_path, project_id)
+		# If env var points to a missing file, unset it to avoid google.auth default error
+		os.environ.pop("GOOGLE_APPLICATION_CREDENTIALS", None)
+
+	# Try project-local default file path if present
+	default_abs = os.path.join(root, "config", "serviceAccountKey.json")
+	if os.path.exists(default_abs):
+		return _client_from_file(default_abs, project_id)
+	# Fall back to Application Default Credentials on Cloud Run / GCE
+	return firestore.Client(project=project_id)
 
 
 class FirestoreService:
 
 	def __init__(self, collection_name: Optional[str] = None) -> None:
 		self.collection_name = collection_name or os.getenv("FIRESTORE_COLLECTION", "news")
-		if not firebase_admin._apps:
-			project_id = os.getenv("FIREBASE_PROJECT_ID")
-			cred_path_env = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-			# Prefer explicitly provided file if present and exists
-			if cred_path_env:
-				abs_path = cred_path_env
-				if not os.path.isabs(cred_path_env):
-					root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-					abs_path = os.path.join(root, cred_path_env)
-				if os.path.exists(abs_path):
-					cred = credentials.Certificate(abs_path)
-					firebase_admin.initialize_app(cred, {"projectId": project_id} if project_id else None)
-					self.client = firestore.client()
-					return
-				# If env var points to a missing file, unset it to avoid google.auth default error
-				try:
-					del os.environ["GOOGLE_APPLICATION_CREDENTIALS"]
-				except KeyError:
-					pass
-
-			# Try project-local default file path if present
-			root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-			default_abs = os.path.join(root, "config", "serviceAccountKey.json")
-			if os.path.exists(default_abs):
-				cred = credentials.Certificate(default_abs)
-				firebase_admin.initialize_app(cred, {"projectId": project_id} if project_id else None)
-			else:
-				# Fall back to Application Default Credentials on Cloud Run / GCE
-				firebase_admin.initialize_app(options={"projectId": project_id} if project_id else None)
-		self.client = firestore.client()
+		self.client = get_client()
+		self.counters = NewsCounters(self.client, firestore)
+
+	def warm_up(self) -> None:
+		"""Open the gRPC channel and fetch an access token before real traffic arrives."""
+		with firestore_op("get", docs=1):
+			self._col().document("_warmup").get()
 
 	def _col(self):
 		return self.client.collection(self.collection_name)
 
-	def list_news(self, limit: int = 100) -> List[Dict[str, Any]]:
-		docs = self._col().order_by("created_at", direction=firestore.Query.DESCENDING).limit(limit).stream()
+	def _body_ref(self, doc_id: str):
+		return self._col().document(doc_id).collection(BODY_COLLECTION).document(BODY_DOC_ID)
+
+	@staticmethod
+	def _from_doc(data: Dict[str, Any]) -> Dict[str, Any]:
+		# Documents not backfilled yet still hold the raw YTN date text
+		return normalize_published_at(data)
+
+	def list_news(
+		self,
+		limit: int = 100,
+		since: Optional[datetime] = None,
+		until: Optional[datetime] = None,
+		category: Optional[str] = None,
+	) -> List[Dict[str, Any]]:
+		"""Newest first. With `since`/`until` the range applies to `published_at`
+		(and results are ordered by it); otherwise ordered by `created_at`.
+		"""
+		query = self._col()
+		if category:
+			query = query.where("category", "==", category)
+		if since or until:
+			if since:
+				query = query.where("published_at", ">=", since if since.tzinfo else since.replace(tzinfo=KST))
+			if until:
+				query = query.where("published_at", "<", until if until.tzinfo else until.replace(tzinfo=KST))
+			query = query.order_by("published_at", direction=firestore.Query.DESCENDING)
+		else:
+			query = query.order_by("created_at", direction=firestore.Query.DESCENDING)
+		with firestore_op("query") as op:
+			snaps = list(query.limit(limit).stream())
+			op.docs = len(snaps)
 		items: List[Dict[str, Any]] = []
-		for d in docs:
-			data = d.to_dict() or {}
+		for d in snaps:
+			data = self._from_doc(as_summary(d.to_dict() or {}))
 			data["id"] = d.id
 			items.append(data)
 		return items
 
 	def get_news_by_id(self, doc_id: str) -> Dict[str, Any]:
-		snap = self._col().document(doc_id).get()
-		data = snap.to_dict() or {}
+		ref = self._col().document(doc_id)
+		body_ref = self._body_ref(doc_id)
+		with firestore_op("get", docs=2):
+			snaps = {snap.reference.path: snap for snap in self.client.get_all([ref, body_ref])}
+		data = self._from_doc(snaps[ref.path].to_dict() or {})
 		if not data:
 			return {}
+		if "content" not in data:
+			data["content"] = (snaps[body_ref.path].to_dict() or {}).get("content", "")
 		data["id"] = doc_id
 		return data
 
-	def create_news(self, data: Dict[str, Any]) -> Dict[str, Any]:
-		payload = {**data}
+	def create_news(self, data: Dict[str, Any], doc_id: Optional[str] = None) -> Dict[str, Any]:
+		"""Create an article. With a client-chosen `doc_id` a repeated create is a no-op
+		that returns the stored article, so queued writes can be replayed safely.
+		"""
+		summary, body = split_content(normalize_published_at(normalize_status(data)))
+		payload = {**summary}
 		payload.setdefault("status", "new")
 		payload.setdefault("created_at", firestore.SERVER_TIMESTAMP)
 		payload["updated_at"] = firestore.SERVER_TIMESTAMP
-		ref = self._col().document()
-		ref.set(payload)
-		created = ref.get().to_dict() or {}
+		ref = self._col().document(doc_id) if doc_id else self._col().document()
+		batch = self.client.batch()
+		if doc_id:
+			batch.create(ref, payload)
+		else:
+			batch.set(ref, payload)
+		batch.set(self._body_ref(ref.id), body or {"content": ""})
+		with firestore_op("set") as op:
+			op.docs = 2 + self.counters.apply(batch, None, payload)
+			try:
+				batch.commit()
+			except AlreadyExists:
+				op.docs = 0
+				return self.get_news_by_id(ref.id)
+		with firestore_op("get", docs=1):
+			created = self._from_doc(ref.get().to_dict() or {})
+		created["content"] = (body or {}).get("content", "")
 		created["id"] = ref.id
 		return created
 
 	def update_news(self, doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
-		payload = {**data}
+		summary, body = split_content(normalize_published_at(normalize_status(data), derive_raw=False))
+		payload = {**summary}
 		payload["updated_at"] = firestore.SERVER_TIMESTAMP
 		ref = self._col().document(doc_id)
-		ref.set(payload, merge=True)
-		updated = ref.get().to_dict() or {}
-		if not updated:
+
+		@firestore.transactional
+		def _update(transaction) -> int:
+			old = ref.get(transaction=transaction).to_dict()
+			if not old:
+				return 0
+			writes = {**payload}
+			if body is not None:
+				# Moves a legacy inline body out of the summary on first edit
+				writes["content"] = firestore.DELETE_FIELD
+				transaction.set(self._body_ref(doc_id), body)
+			transaction.set(ref, writes, merge=True)
+			return (2 if body is not None else 1) + self.counters.apply(transaction, old, {**old, **summary})
+
+		with firestore_op("set") as op:
+			op.docs = _update(self.client.transaction())
+		if not op.docs:
 			return {}
-		updated["id"] = doc_id
-		return updated
+		return self.get_news_by_id(doc_id)
 
 	def delete_news(self, doc_id: str) -> None:
-		self._col().document(doc_id).delete()
+		ref = self._col().document(doc_id)
+
+		@firestore.transactional
+		def _delete(transaction) -> int:
+			old = ref.get(transaction=transaction).to_dict()
+			transaction.delete(self._body_ref(doc_id))
+			transaction.delete(ref)
+			return 2 + self.counters.apply(transaction, old, None)
+
+		with firestore_op("delete") as op:
+			op.docs = _delete(self.client.transaction())
+
+	def get_stats(self, days: int = 7) -> Dict[str, Any]:
+		with firestore_op("get", docs=(days + 1) * self.counters.shards):
+			return self.counters.read(days=days)
+
+	def watch(self, callback: ChangeCallback):
+		"""Listen on the collection; the returned watch has `unsubscribe()`. The initial
+		snapshot reads the collection once (summary documents only) and is not reported.
+		"""
+		primed = False
+
+		def _on_snapshot(docs, changes, read_time) -> None:
+			# Runs on the Firestore watch thread
+			nonlocal primed
+			if not primed:
+				primed = True
+				return
+			for change in changes:
+				kind = _CHANGE_TYPES.get(change.type.name, "updated")
+				summary = None
+				if kind != "deleted":
+					summary = self._from_doc(as_summary(change.document.to_dict() or {}))
+				callback(kind, change.document.id, summary)
+
+		return self._col().on_snapshot(_on_snapshot)
+
+	def bulk_upsert(self, items: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+		"""Create or update crawled articles in batched writes, matching existing
+		documents by source_url, then by title. Existing articles keep their status.
+		`ids` lists the stored id per input item.
 
+		Counter deltas are computed from the snapshots read up front rather than in a
+		transaction; a concurrent edit of the same article can skew them slightly.
+		"""
+		items = [normalize_published_at(it) for it in items]
+		existing = self._find_existing(items)
+		result: Dict[str, List[str]] = {"created": [], "updated": [], "ids": []}
+		batch = self.client.batch()
+		ops = 0
+		with firestore_op("set") as op:
+			for i, item in enumerate(items):
+				summary, body = split_content(item)
+				snap = existing.get(i)
+				if snap is not None:
+					old = snap.to_dict() or {}
+					summary = {k: v for k, v in summary.items() if k != "status"}
+					writes = {**summary, "updated_at": firestore.SERVER_TIMESTAMP}
+					if body is not None:
+						writes["content"] = firestore.DELETE_FIELD
+						batch.set(self._body_ref(snap.id), body)
+						ops += 1
+					batch.set(snap.reference, writes, merge=True)
+					ops += 1 + self.counters.apply(batch, old, {**old, **summary})
+					result["updated"].append(snap.id)
+					result["ids"].append(snap.id)
+				else:
+					ref = self._col().document()
+					payload = {**summary}
+					payload.setdefault("status", "new")
+					payload.setdefault("created_at", firestore.SERVER_TIMESTAMP)
+					payload["updated_at"] = firestore.SERVER_TIMESTAMP
+					batch.set(ref, payload)
+					batch.set(self._body_ref(ref.id), body or {"content": ""})
+					ops += 2 + self.counters.apply(batch, None, payload)
+					result["created"].append(ref.id)
+					result["ids"].append(ref.id)
+				if ops >= 400:
+					batch.commit()
+					op.docs += ops
+					batch = self.client.batch()
+					ops = 0
+			if ops:
+				batch.commit()
+				op.docs += ops
+		return result
 
+	def _find_existing(self, items: List[Dict[str, Any]]) -> Dict[int, Any]:
+		"""Map item index -> snapshot of the stored article it matches, using `in` queries."""
+		found: Dict[int, Any] = {}
+		with firestore_op("query") as op:
+			for field in ("source_url", "title"):
+				wanted: Dict[str, List[int]] = {}
+				for i, it in enumerate(items):
+					value = (it.get(field) or "").strip()
+					if value and i not in found:
+						wanted.setdefault(value, []).append(i)
+				values = list(wanted)
+				# Firestore allows at most 30 values per `in` filter
+				for start in range(0, len(values), 30):
+					for snap in self._col().where(field, "in", values[start:start + 30]).stream():
+						op.docs += 1
+						for i in wanted.get(snap.get(field), []):
+							found.setdefault(i, snap)
+		return found
@@ -0,0 +1,44 @@
+import hashlib
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+def _etag(body: bytes) -> str:
+    return 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    tags = [t.strip() for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags or etag[2:] in tags
+
+
+async def etag_middleware(request: Request, call_next):
+    """Weak ETags on JSON GET responses; `If-None-Match` hits get an empty 304.
+
+    Saves the transfer, not the lookup: the response is still built first.
+    """
+    response = await call_next(request)
+    if request.method != "GET" or response.status_code != 200:
+        return response
+    if not response.headers.get("content-type", "").startswith("application/json"):
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    etag = _etag(body)
+    headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+    headers["ETag"] = etag
+    headers["Cache-Control"] = "no-cache"
+    if _matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    return Response(content=body, status_code=200, headers=headers)
+
+
+class GZipUnlessStreaming(GZipMiddleware):
+    """GZip that leaves Server-Sent Events alone; compressing them would buffer events."""
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/stream"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,144 @@
+import copy
+import itertools
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from desktop.core.dates import normalize_published_at, parse_published_at
+from desktop.core.news_doc import normalize_status, split_content
+from desktop.core.stats import add_delta, day_keys, delta, summarize
+
+from .backend import ChangeCallback, LocalWatchers
+
+
+_MIN = datetime.min.replace(tzinfo=timezone.utc)
+
+
+class MemoryBackend:
+    """Process-local news store with the FirestoreService interface. Nothing is
+    persisted; meant for local runs and load tests (NEWS_BACKEND=memory).
+    """
+
+    def __init__(self) -> None:
+        self._docs: Dict[str, Dict[str, Any]] = {}
+        self._bodies: Dict[str, str] = {}
+        self._counters: Dict[str, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._watchers = LocalWatchers()
+
+    def warm_up(self) -> None:
+        pass
+
+    @staticmethod
+    def _prepare(data: Dict[str, Any], derive_raw: bool = True):
+        summary, body = split_content(normalize_published_at(normalize_status(data), derive_raw))
+        if isinstance(summary.get("published_at"), datetime):
+            # Naive timestamps are read as KST, like the query bounds
+            summary = {**summary, "published_at": parse_published_at(summary["published_at"])}
+        return summary, body
+
+    def list_news(
+        self,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        since = parse_published_at(since) if since else None
+        until = parse_published_at(until) if until else None
+        with self._lock:
+            docs = [{**d, "id": doc_id} for doc_id, d in self._docs.items()]
+        if category:
+            docs = [d for d in docs if d.get("category") == category]
+        if since or until:
+            # Like a Firestore range filter, documents without published_at drop out
+            docs = [
+                d for d in docs
+                if isinstance(d.get("published_at"), datetime)
+                and (since is None or d["published_at"] >= since)
+                and (until is None or d["published_at"] < until)
+            ]
+            docs.sort(key=lambda d: d["published_at"], reverse=True)
+        else:
+            docs.sort(key=lambda d: d.get("created_at") or _MIN, reverse=True)
+        return docs[:limit]
+
+    def get_news_by_id(self, doc_id: str) -> Dict[str, Any]:
+        with self._lock:
+            data = self._docs.get(doc_id)
+            if data is None:
+                return {}
+            return {**data, "content": self._bodies.get(doc_id, ""), "id": doc_id}
+
+    def create_news(self, data: Dict[str, Any], doc_id: Optional[str] = None) -> Dict[str, Any]:
+        summary, body = self._prepare(data)
+        now = datetime.now(timezone.utc)
+        payload = {**summary}
+        payload.setdefault("status", "new")
+        payload.setdefault("created_at", now)
+        payload["updated_at"] = now
+        with self._lock:
+            if doc_id and doc_id in self._docs:
+                return self.get_news_by_id(doc_id)
+            doc_id = doc_id or f"mem{next(self._ids):08d}"
+            self._docs[doc_id] = payload
+            self._bodies[doc_id] = (body or {}).get("content", "")
+            add_delta(self._counters, delta(None, payload))
+        self._watchers.emit("created", doc_id, payload)
+        return {**payload, "content": (body or {}).get("content", ""), "id": doc_id}
+
+    def update_news(self, doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        summary, body = self._prepare(data, derive_raw=False)
+        with self._lock:
+            old = self._docs.get(doc_id)
+            if old is None:
+                return {}
+            new = {**old, **summary, "updated_at": datetime.now(timezone.utc)}
+            self._docs[doc_id] = new
+            if body is not None:
+                self._bodies[doc_id] = body["content"]
+            add_delta(self._counters, delta(old, new))
+        self._watchers.emit("updated", doc_id, new)
+        return self.get_news_by_id(doc_id)
+
+    def delete_news(self, doc_id: str) -> None:
+        with self._lock:
+            old = self._docs.pop(doc_id, None)
+            self._bodies.pop(doc_id, None)
+            add_delta(self._counters, delta(old, None))
+        if old is not None:
+            self._watchers.emit("deleted", doc_id, None)
+
+    def _match(self, item: Dict[str, Any]) -> Optional[str]:
+        for field in ("source_url", "title"):
+            value = (item.get(field) or "").strip()
+            if not value:
+                continue
+            with self._lock:
+                for doc_id, d in self._docs.items():
+                    if d.get(field) == value:
+                        return doc_id
+        return None
+
+    def bulk_upsert(self, items: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Same matching as FirestoreService.bulk_upsert: source_url, then title."""
+        result: Dict[str, List[str]] = {"created": [], "updated": [], "ids": []}
+        for item in items:
+            doc_id = self._match(item)
+            if doc_id is not None:
+                self.update_news(doc_id, {k: v for k, v in item.items() if k != "status"})
+                result["updated"].append(doc_id)
+            else:
+                doc_id = self.create_news(item)["id"]
+                result["created"].append(doc_id)
+            result["ids"].append(doc_id)
+        return result
+
+    def get_stats(self, days: int = 7) -> Dict[str, Any]:
+        with self._lock:
+            counters = copy.deepcopy(self._counters)
+        return summarize(counters, day_keys(days))
+
+    def watch(self, callback: ChangeCallback):
+        return self._watchers.add(callback)
@@ -0,0 +1,97 @@
+import time
+from contextlib import contextmanager
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from starlette.requests import Request
+from starlette.routing import Match
+
+
+# Firestore round trips sit between a few ms and a few hundred ms; the low
+# buckets separate cheap in-process work (validation, serialization) from I/O.
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests handled", ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "Time until the response starts", ["method", "route"], buckets=LATENCY_BUCKETS
+)
+HTTP_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "Requests currently being handled", ["method", "route"]
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes", "Response body size when Content-Length is known", ["method", "route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+
+FIRESTORE_LATENCY = Histogram(
+    "firestore_operation_duration_seconds", "Firestore call latency", ["op"], buckets=LATENCY_BUCKETS
+)
+FIRESTORE_OPERATIONS = Counter(
+    "firestore_operations_total", "Firestore calls", ["op", "outcome"]
+)
+FIRESTORE_DOCUMENTS = Counter(
+    "firestore_documents_total", "Documents read, written or deleted", ["op"]
+)
+
+# Hit ratio = hit / (hit + miss + coalesced); coalesced = waiters that shared another request's load
+DOC_CACHE_REQUESTS = Counter(
+    "doc_cache_requests_total", "GET /news/{doc_id} cache lookups", ["result"]
+)
+DOC_CACHE_ENTRIES = Gauge(
+    "doc_cache_entries", "Documents currently cached"
+)
+
+
+class _Op:
+    def __init__(self, docs: int) -> None:
+        self.docs = docs
+
+
+@contextmanager
+def firestore_op(op: str, docs: int = 0):
+    """Time one Firestore call. Set `.docs` on the yielded object once the count is known."""
+    tracker = _Op(docs)
+    started = time.perf_counter()
+    outcome = "error"
+    try:
+        yield tracker
+        outcome = "ok"
+    finally:
+        FIRESTORE_LATENCY.labels(op).observe(time.perf_counter() - started)
+        FIRESTORE_OPERATIONS.labels(op, outcome).inc()
+        if tracker.docs:
+            FIRESTORE_DOCUMENTS.labels(op).inc(tracker.docs)
+
+
+def _route_template(request: Request) -> str:
+    # Label by path template (/news/{doc_id}), never by raw path, to bound cardinality
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched")
+    return "unmatched"
+
+
+async def metrics_middleware(request: Request, call_next):
+    method = request.method
+    route = _route_template(request)
+    in_flight = HTTP_IN_FLIGHT.labels(method, route)
+    in_flight.inc()
+    started = time.perf_counter()
+    status = "500"
+    try:
+        response = await call_next(request)
+        status = str(response.status_code)
+        size = response.headers.get("content-length")
+        if size is not None:
+            HTTP_RESPONSE_SIZE.labels(method, route).observe(int(size))
+        return response
+    finally:
+        HTTP_LATENCY.labels(method, route).observe(time.perf_counter() - started)
+        HTTP_REQUESTS.labels(method, route, status).inc()
+        in_flight.dec()
+
+
+def render_metrics():
+    return generate_latest(), CONTENT_TYPE_LATEST
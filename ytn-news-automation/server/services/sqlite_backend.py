@@ -0,0 +1,236 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from desktop.core.dates import normalize_published_at, parse_published_at
+from desktop.core.news_doc import normalize_status, split_content
+from desktop.core.stats import TOTALS, add_delta, day_keys, delta, summarize
+
+from .backend import ChangeCallback, LocalWatchers
+
+
+SQLITE_PATH = os.getenv("SQLITE_PATH", "news.sqlite3")
+
+_DATETIME_FIELDS = ("published_at", "created_at", "updated_at")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS news (
+    id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    category TEXT,
+    source_url TEXT,
+    title TEXT,
+    published_at TEXT,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS news_created_at ON news (created_at);
+CREATE INDEX IF NOT EXISTS news_published_at ON news (published_at);
+CREATE INDEX IF NOT EXISTS news_category ON news (category, created_at);
+CREATE INDEX IF NOT EXISTS news_source_url ON news (source_url);
+CREATE INDEX IF NOT EXISTS news_title ON news (title);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+
+def _sort_key(value: Any) -> Optional[str]:
+    # Fixed-width UTC text so SQLite orders and compares it like a timestamp
+    if not isinstance(value, datetime):
+        return None
+    return parse_published_at(value).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, default=lambda v: v.isoformat() if isinstance(v, datetime) else str(v))
+
+
+def _loads(text: str) -> Dict[str, Any]:
+    data = json.loads(text)
+    for field in _DATETIME_FIELDS:
+        if isinstance(data.get(field), str):
+            try:
+                data[field] = datetime.fromisoformat(data[field])
+            except ValueError:
+                pass
+    return data
+
+
+class SQLiteBackend:
+    """Single-file news store with the FirestoreService interface (NEWS_BACKEND=sqlite).
+
+    One connection serialized by a lock; change events only cover writes made
+    through this process.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or SQLITE_PATH
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._watchers = LocalWatchers()
+        with self._lock:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def warm_up(self) -> None:
+        with self._lock:
+            self._conn.execute("SELECT 1").fetchone()
+
+    def _row(self, doc_id: str, summary: Dict[str, Any], content: Optional[str]):
+        return {
+            "id": doc_id,
+            "data": _dumps(summary),
+            "content": content,
+            "category": summary.get("category"),
+            "source_url": summary.get("source_url"),
+            "title": summary.get("title"),
+            "published_at": _sort_key(summary.get("published_at")),
+            "created_at": _sort_key(summary.get("created_at")),
+        }
+
+    def _apply_counters(self, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+        # Called inside the write transaction
+        changes = delta(old, new)
+        if not changes:
+            return
+        names = list(changes)
+        marks = ",".join("?" * len(names))
+        current = {
+            name: json.loads(data)
+            for name, data in self._conn.execute(f"SELECT name, data FROM counters WHERE name IN ({marks})", names)
+        }
+        add_delta(current, changes)
+        self._conn.executemany(
+            "INSERT INTO counters (name, data) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET data = excluded.data",
+            [(name, json.dumps(current[name], ensure_ascii=False)) for name in names],
+        )
+
+    def _get_summary(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute("SELECT data FROM news WHERE id = ?", (doc_id,)).fetchone()
+        return _loads(row[0]) if row else None
+
+    def list_news(
+        self,
+        limit: int = 100,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        category: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        where: List[str] = []
+        params: List[Any] = []
+        if category:
+            where.append("category = ?")
+            params.append(category)
+        if since:
+            where.append("published_at >= ?")
+            params.append(_sort_key(since))
+        if until:
+            where.append("published_at < ?")
+            params.append(_sort_key(until))
+        order = "published_at" if since or until else "created_at"
+        sql = "SELECT id, data FROM news"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order} DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [{**_loads(data), "id": doc_id} for doc_id, data in rows]
+
+    def get_news_by_id(self, doc_id: str) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT data, content FROM news WHERE id = ?", (doc_id,)).fetchone()
+        if row is None:
+            return {}
+        return {**_loads(row[0]), "content": row[1], "id": doc_id}
+
+    def create_news(self, data: Dict[str, Any], doc_id: Optional[str] = None) -> Dict[str, Any]:
+        summary, body = split_content(normalize_published_at(normalize_status(data)))
+        now = datetime.now(timezone.utc)
+        payload = {**summary}
+        payload.setdefault("status", "new")
+        payload.setdefault("created_at", now)
+        payload["updated_at"] = now
+        doc_id = doc_id or uuid.uuid4().hex[:20]
+        content = (body or {}).get("content", "")
+        row = self._row(doc_id, payload, content)
+        with self._lock, self._conn:
+            if self._get_summary(doc_id) is not None:
+                # Replayed create with a client-chosen id
+                return self.get_news_by_id(doc_id)
+            self._conn.execute(
+                "INSERT INTO news (id, data, content, category, source_url, title, published_at, created_at) "
+                "VALUES (:id, :data, :content, :category, :source_url, :title, :published_at, :created_at)",
+                row,
+            )
+            self._apply_counters(None, payload)
+        self._watchers.emit("created", doc_id, payload)
+        return {**payload, "content": content, "id": doc_id}
+
+    def update_news(self, doc_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        summary, body = split_content(normalize_published_at(normalize_status(data), derive_raw=False))
+        with self._lock, self._conn:
+            old = self._get_summary(doc_id)
+            if old is None:
+                return {}
+            new = {**old, **summary, "updated_at": datetime.now(timezone.utc)}
+            row = self._row(doc_id, new, body["content"] if body is not None else None)
+            self._conn.execute(
+                "UPDATE news SET data = :data, content = COALESCE(:content, content), category = :category, "
+                "source_url = :source_url, title = :title, published_at = :published_at WHERE id = :id",
+                row,
+            )
+            self._apply_counters(old, new)
+        self._watchers.emit("updated", doc_id, new)
+        return self.get_news_by_id(doc_id)
+
+    def delete_news(self, doc_id: str) -> None:
+        with self._lock, self._conn:
+            old = self._get_summary(doc_id)
+            self._conn.execute("DELETE FROM news WHERE id = ?", (doc_id,))
+            self._apply_counters(old, None)
+        if old is not None:
+            self._watchers.emit("deleted", doc_id, None)
+
+    def _match(self, item: Dict[str, Any]) -> Optional[str]:
+        for field in ("source_url", "title"):
+            value = (item.get(field) or "").strip()
+            if not value:
+                continue
+            with self._lock:
+                row = self._conn.execute(f"SELECT id FROM news WHERE {field} = ? LIMIT 1", (value,)).fetchone()
+            if row:
+                return row[0]
+        return None
+
+    def bulk_upsert(self, items: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+        """Same matching as FirestoreService.bulk_upsert: source_url, then title."""
+        result: Dict[str, List[str]] = {"created": [], "updated": [], "ids": []}
+        for item in items:
+            doc_id = self._match(item)
+            if doc_id is not None:
+                self.update_news(doc_id, {k: v for k, v in item.items() if k != "status"})
+                result["updated"].append(doc_id)
+            else:
+                doc_id = self.create_news(item)["id"]
+                result["created"].append(doc_id)
+            result["ids"].append(doc_id)
+        return result
+
+    def get_stats(self, days: int = 7) -> Dict[str, Any]:
+        keys = day_keys(days)
+        names = [TOTALS] + [f"daily-{d}" for d in keys]
+        marks = ",".join("?" * len(names))
+        with self._lock:
+            rows = self._conn.execute(f"SELECT name, data FROM counters WHERE name IN ({marks})", names).fetchall()
+        return summarize({name: json.loads(data) for name, data in rows}, keys)
+
+    def watch(self, callback: ChangeCallback):
+        return self._watchers.add(callback)
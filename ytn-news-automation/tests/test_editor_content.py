@@ -0,0 +1,97 @@
+import os
+import time
+from html.parser import HTMLParser
+
+from desktop.core.editor_content import build_document, paragraphs
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+SOURCE_URL = "https://www.ytn.co.kr/_ln/0103_202601150712345678?a=1&b=2"
+
+
+def _fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class _Blocks(HTMLParser):
+    """Top-level blocks of pasted markup as (tag, text, href)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.blocks = []
+        self._depth = 0
+        self._href = ""
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth == 0:
+            self.blocks.append([tag, "", ""])
+        if tag == "a":
+            self.blocks[-1][2] = dict(attrs)["href"]
+        self._depth += 1
+
+    def handle_endtag(self, tag):
+        self._depth -= 1
+
+    def handle_data(self, data):
+        if self._depth:
+            self.blocks[-1][1] += data
+
+
+def _blocks(markup: str):
+    parser = _Blocks()
+    parser.feed(markup)
+    return [tuple(block) for block in parser.blocks]
+
+
+def test_matches_expected_markup():
+    # ytn_article.html is the reviewed output of build_document, not markup recorded
+    # from SmartEditor; how the editor converts a paste is not covered here.
+    doc = build_document(_fixture("ytn_article.txt"), SOURCE_URL)
+    assert doc["html"] == "".join(_fixture("ytn_article.html").splitlines())
+
+
+def test_paragraphs_quotes_and_source_link():
+    article = _fixture("ytn_article.txt")
+    blocks = _blocks(build_document(article, SOURCE_URL)["html"])
+    lines = paragraphs(article)
+    # Blank lines are dropped; every other line is one block, in order, then the source
+    assert [text for _, text, _ in blocks[:-1]] == lines
+    quotes = [text for tag, text, _ in blocks if tag == "blockquote"]
+    assert quotes == ["“손이 얼어서 휴대전화를 꺼내기도 힘들 정도예요.”", '"이번 주말까지는 추위가 이어질 것으로 보입니다"']
+    assert {tag for tag, _, _ in blocks} == {"p", "blockquote"}
+    assert blocks[-1] == ("p", f"출처: {SOURCE_URL}", SOURCE_URL)
+
+
+def test_escaping():
+    doc = build_document('<b>속보</b> & "인용" 아님\n“따옴표 <i>안</i>”', 'https://x.test/?q="a"&b=<c>')
+    assert "<b>" not in doc["html"] and "<i>" not in doc["html"]
+    assert "&lt;b&gt;속보&lt;/b&gt; &amp; &quot;인용&quot; 아님" in doc["html"]
+    assert 'href="https://x.test/?q=&quot;a&quot;&amp;b=&lt;c&gt;"' in doc["html"]
+    # Plain text and the marker stay unescaped
+    assert doc["text"].splitlines()[0] == '<b>속보</b> & "인용" 아님'
+
+
+def test_text_and_marker():
+    article = _fixture("ytn_article.txt")
+    doc = build_document(article, SOURCE_URL)
+    assert doc["text"].splitlines() == paragraphs(article) + [f"출처: {SOURCE_URL}"]
+    # The last article paragraph, not the source line the editor may turn into a link card
+    assert doc["marker"] == paragraphs(article)[-1][:40]
+    assert build_document("", SOURCE_URL)["marker"] == f"출처: {SOURCE_URL}"[:40]
+    assert build_document("") == {"html": "", "text": "", "marker": ""}
+
+
+def test_long_article_builds_fast():
+    article = _fixture("ytn_article.txt")
+    body = "\n".join([article] * (20000 // len(article) + 1))[:20000]
+    assert len(body) == 20000
+    best = min(_timed(body) for _ in range(5))
+    # About 2 ms here; the bound leaves room for slow CI machines
+    assert best < 0.05
+
+
+def _timed(body: str) -> float:
+    started = time.perf_counter()
+    build_document(body, SOURCE_URL)
+    return time.perf_counter() - started